@@ -0,0 +1,136 @@
+import contextvars
+from contextlib import contextmanager
+from copy import deepcopy
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from pydantic import BaseModel, ValidationError
+from pydantic.errors import MissingError
+from pydantic.fields import ModelField
+from pydantic.main import validate_model
+
+_trusted = contextvars.ContextVar("trusted", default=False)
+
+
+def _default(field: ModelField) -> Any:
+    # ModelField.get_default only exists from pydantic 1.8.
+    if field.default_factory is not None:
+        return field.default_factory()
+    return None if field.default is None else deepcopy(field.default)
+
+
+@contextmanager
+def trusted(enabled: bool = True) -> Iterator[None]:
+    """Build models without validating their data within the context.
+
+    Values are stored as given, e.g. as decoded from the API's JSON, without being validated or coerced
+    to the field types; missing fields are set to their default, or None if they are required. Nested
+    models are built the same way.
+
+    Args:
+        enabled (bool): Whether to skip validation. Defaults to True.
+    """
+    token = _trusted.set(enabled)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+class Model(BaseModel):
+    """Base class of the API models, validated unless built in :func:`trusted` mode.
+
+    Fields named in ``__lazy__``, typically lists of nested models, are stored as given and only built
+    (and validated) by their builder function on first access, then kept. Builders run in the mode the
+    model was built in, so that the fields of a trusted model are not validated either. Serializing,
+    comparing or copying a model builds all of them.
+    """
+
+    __lazy__: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+    __slots__ = ("_unbuilt", "_built_trusted")
+
+    def __init__(__pydantic_self__, **data: Any):
+        lazy = __pydantic_self__.__lazy__
+        is_trusted = _trusted.get()
+        if not lazy and not is_trusted:
+            super().__init__(**data)
+            return
+
+        cls = __pydantic_self__.__class__
+        unbuilt = {name: data.pop(name) for name in lazy if name in data}
+        if is_trusted:
+            fields_set = data.keys() & cls.__fields__
+            values = {
+                name: data[field.alias] if field.alias in data else _default(field)
+                for name, field in cls.__fields__.items()
+            }
+            for name in unbuilt:
+                del values[name]
+        else:
+            values, fields_set, error = validate_model(cls, data)
+            if error is not None:
+                errors = [
+                    e
+                    for e in error.raw_errors
+                    if not (
+                        isinstance(e.exc, MissingError) and e.loc_tuple()[0] in unbuilt
+                    )
+                ]
+                if errors:
+                    raise ValidationError(errors, cls)
+
+        object.__setattr__(__pydantic_self__, "__dict__", values)
+        if unbuilt:
+            fields_set |= unbuilt.keys()
+            object.__setattr__(__pydantic_self__, "_unbuilt", unbuilt)
+            object.__setattr__(__pydantic_self__, "_built_trusted", is_trusted)
+        object.__setattr__(__pydantic_self__, "__fields_set__", fields_set)
+        if __pydantic_self__.__private_attributes__:
+            __pydantic_self__._init_private_attributes()
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            unbuilt = object.__getattribute__(self, "_unbuilt")
+        except AttributeError:
+            unbuilt = None
+        if unbuilt is None or name not in unbuilt:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        # Builders do not mutate their input, so a concurrent first access only builds twice.
+        with trusted(object.__getattribute__(self, "_built_trusted")):
+            value = self.__lazy__[name](unbuilt[name])
+        self.__dict__.setdefault(name, value)
+        unbuilt.pop(name, None)
+        return self.__dict__[name]
+
+    def _build_all(self) -> None:
+        unbuilt = getattr(self, "_unbuilt", None)
+        if unbuilt:
+            for name in list(unbuilt):
+                if name not in self.__dict__:
+                    getattr(self, name)
+            object.__setattr__(self, "_unbuilt", None)
+            # Restore the field order.
+            values = {name: self.__dict__[name] for name in self.__fields__}
+            object.__setattr__(self, "__dict__", values)
+
+    def _iter(self, *args: Any, **kwargs: Any) -> Iterator[Tuple[str, Any]]:
+        self._build_all()
+        return super()._iter(*args, **kwargs)
+
+    def __repr_args__(self) -> Sequence[Tuple[Optional[str], Any]]:
+        self._build_all()
+        return super().__repr_args__()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self._build_all()
+        return super().__getstate__()
@@ -1,9 +1,9 @@
 from typing import Any, Dict, List, Union
 
-from pydantic import BaseModel
+from ._base import Model
 
 
-class ClubDetails(BaseModel):
+class ClubDetails(Model):
     """Details about a club.
 
     Args:
@@ -37,7 +37,7 @@ class ClubDetails(BaseModel):
     description: str
 
 
-class UserJoinClub(BaseModel):
+class UserJoinClub(Model):
     """Join date of user.
 
     Args:
@@ -49,7 +49,11 @@ class UserJoinClub(BaseModel):
     joined: int
 
 
-class ClubMembers(BaseModel):
+def _members(members: List[Dict[str, Any]]) -> List[UserJoinClub]:
+    return [UserJoinClub(**x) for x in members]
+
+
+class ClubMembers(Model):
     """List of club members and their join date as per timeframe.
 
     Args:
@@ -62,14 +66,10 @@ class ClubMembers(BaseModel):
     monthly: List[Dict[str, Union[str, int]]]
     all_time: List[Dict[str, Union[str, int]]]
 
-    def __init__(self, **data: Dict[str, Any]):
-        super().__init__(**data)
-        self.weekly = [UserJoinClub(**x) for x in self.weekly]
-        self.monthly = [UserJoinClub(**x) for x in self.monthly]
-        self.all_time = [UserJoinClub(**x) for x in self.all_time]
+    __lazy__ = {"weekly": _members, "monthly": _members, "all_time": _members}
 
 
-class ClubMatchDetails(BaseModel):
+class ClubMatchDetails(Model):
     """Details about the match.
 
     Args:
@@ -89,7 +89,11 @@ class ClubMatchDetails(BaseModel):
     time_class: str
 
 
-class ClubMatches(BaseModel):
+def _matches(matches: List[Dict[str, Any]]) -> List[ClubMatchDetails]:
+    return [ClubMatchDetails(id=x["@id"], **x) for x in matches]
+
+
+class ClubMatches(Model):
     """Lists of club matches that are registered, in progress or finished.
 
     Args:
@@ -102,11 +106,8 @@ class ClubMatches(BaseModel):
     in_progress: List[Dict[str, Any]]
     registered: List[Dict[str, Any]]
 
-    def __init__(self, **data: Dict[str, Any]):
-        super().__init__(**data)
-        for match_type in ("finished", "in_progress", "registered"):
-            matches = []
-            for match in getattr(self, match_type):
-                match["id"] = match.pop("@id")
-                matches.append(ClubMatchDetails(**match))
-            setattr(self, match_type, matches)
+    __lazy__ = {
+        "finished": _matches,
+        "in_progress": _matches,
+        "registered": _matches,
+    }
@@ -0,0 +1,49 @@
+import contextvars
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+def submit(executor: Executor, fn: Callable[..., T], *args: Any) -> "Future[T]":
+    """Schedule a call on an executor, run in a copy of the caller's context.
+
+    Context variables, e.g. :func:`~chesscom.api._base.trusted` mode, are not inherited by worker threads
+    otherwise.
+
+    Args:
+        executor (Executor): Executor running the call.
+        fn (Callable[..., T]): Function called.
+        *args (Any): Arguments of the call.
+
+    Returns:
+        Future[T]: Future of the result.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+def prefetch(
+    urls: List[str], fetch: Callable[[str], T], max_workers: int
+) -> Iterator[T]:
+    """Fetch URLs concurrently, yielding the results in order.
+
+    At most ``max_workers`` fetches are in flight, and not more than that are done ahead of the results
+    consumed.
+
+    Args:
+        urls (List[str]): URLs.
+        fetch (Callable[[str], T]): Function fetching a URL, called with :func:`submit`.
+        max_workers (int): Number of URLs fetched concurrently.
+
+    Yields:
+        T: Result of each URL, in the order of ``urls``.
+    """
+    pending = deque()
+    with ThreadPoolExecutor(max_workers) as executor:
+        for url in urls:
+            pending.append(submit(executor, fetch, url))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from ._base import Model
 
 
-class CountryDetails(BaseModel):
+class CountryDetails(Model):
     """Country details.
 
     Args:
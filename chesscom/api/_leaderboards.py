@@ -1,6 +1,6 @@
 from typing import Any, Dict, List
 
-from pydantic import BaseModel
+from ._base import Model
 
 AVAILABLE_LEADERBOARDS = [
     "daily",
@@ -18,7 +18,7 @@ AVAILABLE_LEADERBOARDS = [
 ]
 
 
-class Trend(BaseModel):
+class Trend(Model):
     """Amount changed in ranking and direction.
 
     Args:
@@ -30,7 +30,7 @@ class Trend(BaseModel):
     delta: int
 
 
-class LeaderboardPlayerDetails(BaseModel):
+class LeaderboardPlayerDetails(Model):
     """
     Args:
         player_id (str): Player ID.
@@ -68,7 +68,11 @@ class LeaderboardPlayerDetails(BaseModel):
             self.trend_rank = Trend(**self.trend_rank)
 
 
-class LeaderboardDetails(BaseModel):
+def _leaderboard(players: List[Dict[str, Any]]) -> List[LeaderboardPlayerDetails]:
+    return [LeaderboardPlayerDetails(id=x["@id"], **x) for x in players]
+
+
+class LeaderboardDetails(Model):
     f"""Leaderboard for {AVAILABLE_LEADERBOARDS}.\n
     Note: the endpoint refreshes when one of the leaderboards is updated.
 
@@ -98,11 +102,4 @@ class LeaderboardDetails(BaseModel):
     # lessons: List[Dict[str, Any]]
     tactics: List[Dict[str, Any]]
 
-    def __init__(self, **data: Dict[str, Any]):
-        super().__init__(**data)
-        for board in AVAILABLE_LEADERBOARDS:
-            leaderboard = []
-            for x in getattr(self, board):
-                x["id"] = x.pop("@id")
-                leaderboard.append(LeaderboardPlayerDetails(**x))
-            setattr(self, board, leaderboard)
+    __lazy__ = {board: _leaderboard for board in AVAILABLE_LEADERBOARDS}
@@ -1,9 +1,9 @@
 from typing import Any, Dict, List, Union
 
-from pydantic import BaseModel
+from ._base import Model
 
 
-class Player(BaseModel):
+class Player(Model):
     """Player information in match.
 
     Args:
@@ -29,7 +29,7 @@ class Player(BaseModel):
     played_as_black: str = None
 
 
-class MatchBoardPlayer(BaseModel):
+class MatchBoardPlayer(Model):
     """Player result in club match.
 
     Args:
@@ -47,7 +47,7 @@ class MatchBoardPlayer(BaseModel):
     team: str = None
 
 
-class MatchSettings(BaseModel):
+class MatchSettings(Model):
     """Match settings.
 
     Args:
@@ -75,7 +75,11 @@ class MatchSettings(BaseModel):
     autostart: bool = False
 
 
-class MatchTeamDetails(BaseModel):
+def _players(players: List[Dict[str, Any]]) -> List[Player]:
+    return [Player(**x) for x in players]
+
+
+class MatchTeamDetails(Model):
     """
 
     Args:
@@ -94,12 +98,10 @@ class MatchTeamDetails(BaseModel):
     players: List[Dict[str, Union[str, int, float]]]
     fair_play_removals: List[str] = None
 
-    def __init__(self, **data: Dict[str, Any]):
-        super().__init__(**data)
-        self.players = [Player(**x) for x in self.players]
+    __lazy__ = {"players": _players}
 
 
-class MatchTeams(BaseModel):
+class MatchTeams(Model):
     """Teams in match.
 
     Args:
@@ -115,14 +117,11 @@ class MatchTeams(BaseModel):
 
     def __init__(self, **data: Dict[str, Any]):
         super().__init__(**data)
-        self.team1["id"] = self.team1.pop("@id")
-        self.team2["id"] = self.team2.pop("@id")
+        self.team1 = MatchTeamDetails(id=self.team1["@id"], **self.team1)
+        self.team2 = MatchTeamDetails(id=self.team2["@id"], **self.team2)
 
-        self.team1 = MatchTeamDetails(**self.team1)
-        self.team2 = MatchTeamDetails(**self.team2)
 
-
-class MatchDetails(BaseModel):
+class MatchDetails(Model):
     """Match details.
 
     Args:
@@ -151,7 +150,7 @@ class MatchDetails(BaseModel):
         self.teams = MatchTeams(**self.teams)
 
 
-class MatchBoardScore(BaseModel):
+class MatchBoardScore(Model):
     """Match board score for players.
 
     Args:
@@ -163,7 +162,7 @@ class MatchBoardScore(BaseModel):
     player2: float
 
 
-class MatchResult(BaseModel):
+class MatchResult(Model):
     """Match result.
 
     May be missing if game/s are incomplete.
@@ -177,7 +176,7 @@ class MatchResult(BaseModel):
     played_as_black: str = None
 
 
-class MatchBoardGame(BaseModel):
+class MatchBoardGame(Model):
     """Game details on board in match.
 
     Args:
@@ -212,14 +211,15 @@ class MatchBoardGame(BaseModel):
 
     def __init__(self, **data: Dict[str, Any]):
         super().__init__(**data)
-        self.white["id"] = self.white.pop("@id")
-        self.black["id"] = self.black.pop("@id")
+        self.white = MatchBoardPlayer(id=self.white["@id"], **self.white)
+        self.black = MatchBoardPlayer(id=self.black["@id"], **self.black)
+
 
-        self.white = MatchBoardPlayer(**self.white)
-        self.black = MatchBoardPlayer(**self.black)
+def _games(games: List[Dict[str, Any]]) -> List[MatchBoardGame]:
+    return [MatchBoardGame(**x) for x in games]
 
 
-class MatchBoardDetails(BaseModel):
+class MatchBoardDetails(Model):
     """Match board details.
 
     Args:
@@ -230,16 +230,17 @@ class MatchBoardDetails(BaseModel):
     board_scores: Dict[str, float]
     games: List[Dict[str, Any]]
 
+    __lazy__ = {"games": _games}
+
     def __init__(self, **data: Dict[str, Any]):
         super().__init__(**data)
         self.board_scores = {
             f"player{i + 1}": val for i, val in enumerate(self.board_scores.values())
         }
         self.board_scores = MatchBoardScore(**self.board_scores)
-        self.games = [MatchBoardGame(**x) for x in self.games]
 
 
-class LiveMatchDetails(BaseModel):
+class LiveMatchDetails(Model):
     """Live match details.
 
     Args:
@@ -270,7 +271,7 @@ class LiveMatchDetails(BaseModel):
         self.teams = MatchTeams(**self.teams)
 
 
-class MatchResults(BaseModel):
+class MatchResults(Model):
     """Match results.
 
     Args:
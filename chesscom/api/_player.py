@@ -1,10 +1,14 @@
+import io
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel
+import chess.pgn
+from pydantic import PrivateAttr
 
+from ._base import Model
 from ._match import MatchResults
 from ._tournaments import TournamentResults, TournamentsSummary
+from .pgn import PGNHeaders, iter_headers
 
 
 class PlayerAccountStatus(Enum):
@@ -34,7 +38,7 @@ class GameResults(Enum):
     bughousepartnerlose = "Bughouse partner lost"
 
 
-class ClubDetails(BaseModel):
+class ClubDetails(Model):
     """Details about club and user's club activity.
 
     Args:
@@ -54,7 +58,7 @@ class ClubDetails(BaseModel):
     joined: int
 
 
-class PlayerProfile(BaseModel):
+class PlayerProfile(Model):
     """Player profile.
 
     Args:
@@ -94,7 +98,7 @@ class PlayerProfile(BaseModel):
     fide: int = None
 
 
-class CurrentDailyChess(BaseModel):
+class CurrentDailyChess(Model):
     """Current daily chess game details.
 
     Args:
@@ -132,7 +136,7 @@ class CurrentDailyChess(BaseModel):
     match: str = None
 
 
-class ToMoveDailyChess(BaseModel):
+class ToMoveDailyChess(Model):
     """Daily chess game details for game where it's user's turn to move.
 
     Args:
@@ -148,7 +152,7 @@ class ToMoveDailyChess(BaseModel):
     last_activity: int
 
 
-class Player(BaseModel):
+class Player(Model):
     """Player information for a game.
 
     Args:
@@ -164,7 +168,7 @@ class Player(BaseModel):
     id: str
 
 
-class MonthlyArchive(BaseModel):
+class MonthlyArchive(Model):
     """Monthly archived game details.
 
     Args:
@@ -181,6 +185,9 @@ class MonthlyArchive(BaseModel):
         tournament (str, optional): URL pointing to tournament.
         match (str, optional): URL pointing to team match.
         time_class (str): Time class.
+
+    The game's moves are available as a ``chess.pgn.Game`` through ``game``, which is parsed from ``pgn``
+    on first access only. Its tags alone are available through ``headers``, which is much cheaper.
     """
 
     white: Dict[str, Any]
@@ -197,16 +204,35 @@ class MonthlyArchive(BaseModel):
     match: str = None
     time_class: str
 
+    _game: Optional[chess.pgn.Game] = PrivateAttr(default=None)
+
     def __init__(self, **data: Dict[str, Any]):
         super().__init__(**data)
-        self.white["id"] = self.white.pop("@id")
-        self.black["id"] = self.black.pop("@id")
+        self.white = Player(id=self.white["@id"], **self.white)
+        self.black = Player(id=self.black["@id"], **self.black)
+
+    @property
+    def game(self) -> chess.pgn.Game:
+        """Game parsed from the PGN, cached after first access.
+
+        Returns:
+            chess.pgn.Game: Loaded PGN game.
+        """
+        if self._game is None:
+            self._game = chess.pgn.read_game(io.StringIO(self.pgn))
+        return self._game
 
-        self.white = Player(**self.white)
-        self.black = Player(**self.black)
+    @property
+    def headers(self) -> PGNHeaders:
+        """Tags of the PGN, read without parsing the game's moves.
 
+        Returns:
+            PGNHeaders: Tags and raw move text of the game.
+        """
+        return next(iter_headers(io.StringIO(self.pgn)))
 
-class RatingLog(BaseModel):
+
+class RatingLog(Model):
     """Rating log for amount and date first achieved.
 
     Args:
@@ -218,7 +244,7 @@ class RatingLog(BaseModel):
     date: int
 
 
-class LastRating(BaseModel):
+class LastRating(Model):
     """Current player rating, date achieved and Glicko RD value.
 
     Args:
@@ -232,7 +258,7 @@ class LastRating(BaseModel):
     rd: int
 
 
-class BestRating(BaseModel):
+class BestRating(Model):
     """Best player rating, URL to game and date achieved.
 
     Args:
@@ -246,7 +272,7 @@ class BestRating(BaseModel):
     game: str
 
 
-class GamesRecord(BaseModel):
+class GamesRecord(Model):
     """Summary of all games played.
 
     Args:
@@ -264,7 +290,11 @@ class GamesRecord(BaseModel):
     timeout_percent: float = None
 
 
-class PlayerMatches(BaseModel):
+def _matches(matches: List[Dict[str, Any]]) -> List[MatchResults]:
+    return [MatchResults(id=x["@id"], **x) for x in matches]
+
+
+class PlayerMatches(Model):
     """Player matches separated by status (registered, in progress, finished).
 
     Args:
@@ -277,17 +307,14 @@ class PlayerMatches(BaseModel):
     in_progress: List[Dict[str, Any]]
     registered: List[Dict[str, Any]]
 
-    def __init__(self, **data: Dict[str, Any]):
-        super().__init__(**data)
-        for match_type in ("finished", "in_progress", "registered"):
-            matches = []
-            for match in getattr(self, match_type):
-                match["id"] = match.pop("@id")
-                matches.append(MatchResults(**match))
-            setattr(self, match_type, matches)
+    __lazy__ = {
+        "finished": _matches,
+        "in_progress": _matches,
+        "registered": _matches,
+    }
 
 
-class ChessModeStats(BaseModel):
+class ChessModeStats(Model):
     """Basic statistics for player for a chess mode.
 
     Args:
@@ -311,7 +338,7 @@ class ChessModeStats(BaseModel):
             self.tournament = TournamentsSummary(**self.tournament)
 
 
-class ChessModeRatings(BaseModel):
+class ChessModeRatings(Model):
     """Player rating information for a chess mode.
 
     Args:
@@ -330,7 +357,11 @@ class ChessModeRatings(BaseModel):
             self.lowest = RatingLog(**self.lowest)
 
 
-class PlayerTournaments(BaseModel):
+def _tournaments(tournaments: List[Dict[str, Any]]) -> List[TournamentResults]:
+    return [TournamentResults(id=x["@id"], **x) for x in tournaments]
+
+
+class PlayerTournaments(Model):
     """List of matches in tournaments for player based on progress status.
 
     Args:
@@ -343,11 +374,8 @@ class PlayerTournaments(BaseModel):
     in_progress: List[Dict[str, Any]]
     registered: List[Dict[str, Any]]
 
-    def __init__(self, **data: Dict[str, Any]):
-        super().__init__(**data)
-        for match_type in ("finished", "in_progress", "registered"):
-            matches = []
-            for match in getattr(self, match_type):
-                match["id"] = match.pop("@id")
-                matches.append(TournamentResults(**match))
-            setattr(self, match_type, matches)
+    __lazy__ = {
+        "finished": _tournaments,
+        "in_progress": _tournaments,
+        "registered": _tournaments,
+    }
@@ -1,7 +1,7 @@
-from pydantic.main import BaseModel
+from ._base import Model
 
 
-class PuzzleDetails(BaseModel):
+class PuzzleDetails(Model):
     """Puzzle details.
 
     Args:
@@ -0,0 +1,157 @@
+from sys import intern
+from typing import Any, Dict, NamedTuple, Optional
+
+from ._player import MonthlyArchive, Player
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else intern(value)
+
+
+class PlayerRecord(NamedTuple):
+    """Compact player information for an archived game.
+
+    Args:
+        username (str): Username.
+        rating (int): Player's rating at the start of the game.
+        result (str): Game result.
+        id (str): URL of this player's profile.
+
+    Strings are interned, so the username and profile URL of a player are stored once however many games
+    reference them.
+    """
+
+    username: str
+    rating: int
+    result: str
+    id: str
+
+    @classmethod
+    def from_response(cls, response: Dict[str, Any]) -> "PlayerRecord":
+        """Build a record from the player details of an archived game, as returned by the API.
+
+        Args:
+            response (Dict[str, Any]): Player details.
+
+        Returns:
+            PlayerRecord: Player record.
+        """
+        return cls(
+            intern(response["username"]),
+            response["rating"],
+            intern(response["result"]),
+            intern(response["@id"] if "@id" in response else response["id"]),
+        )
+
+    @classmethod
+    def from_model(cls, player: Player) -> "PlayerRecord":
+        """Build a record from a player model.
+
+        Args:
+            player (Player): Player model.
+
+        Returns:
+            PlayerRecord: Player record.
+        """
+        return cls(
+            intern(player.username),
+            player.rating,
+            intern(player.result),
+            intern(player.id),
+        )
+
+    def to_model(self) -> Player:
+        """Build the equivalent player model.
+
+        Returns:
+            Player: Player model.
+        """
+        return Player(**self._asdict())
+
+
+class GameRecord(NamedTuple):
+    """Compact archived game, a lightweight alternative to :class:`MonthlyArchive`.
+
+    Takes the same fields as :class:`MonthlyArchive`, with ``white`` and ``black`` as
+    :class:`PlayerRecord`. Strings shared between games (time control, rules, time class, ECO,
+    tournament and match URLs) are interned.
+    """
+
+    white: PlayerRecord
+    black: PlayerRecord
+    url: str
+    fen: str
+    pgn: str
+    start_time: Optional[int]
+    end_time: int
+    time_control: str
+    rules: str
+    eco: Optional[str]
+    tournament: Optional[str]
+    match: Optional[str]
+    time_class: str
+
+    @classmethod
+    def from_response(cls, response: Dict[str, Any]) -> "GameRecord":
+        """Build a record from an archived game as returned by the API, without validating it.
+
+        Args:
+            response (Dict[str, Any]): Archived game.
+
+        Returns:
+            GameRecord: Game record.
+        """
+        return cls(
+            PlayerRecord.from_response(response["white"]),
+            PlayerRecord.from_response(response["black"]),
+            response["url"],
+            response["fen"],
+            response["pgn"],
+            response.get("start_time"),
+            response["end_time"],
+            intern(response["time_control"]),
+            intern(response["rules"]),
+            _intern(response.get("eco")),
+            _intern(response.get("tournament")),
+            _intern(response.get("match")),
+            intern(response["time_class"]),
+        )
+
+    @classmethod
+    def from_model(cls, game: MonthlyArchive) -> "GameRecord":
+        """Build a record from an archived game model.
+
+        Args:
+            game (MonthlyArchive): Archived game.
+
+        Returns:
+            GameRecord: Game record.
+        """
+        return cls(
+            PlayerRecord.from_model(game.white),
+            PlayerRecord.from_model(game.black),
+            game.url,
+            game.fen,
+            game.pgn,
+            game.start_time,
+            game.end_time,
+            intern(game.time_control),
+            intern(game.rules),
+            _intern(game.eco),
+            _intern(game.tournament),
+            _intern(game.match),
+            intern(game.time_class),
+        )
+
+    def to_model(self) -> MonthlyArchive:
+        """Build the equivalent archived game model.
+
+        Returns:
+            MonthlyArchive: Archived game.
+        """
+        data = self._asdict()
+        for color in ("white", "black"):
+            player = data[color]._asdict()
+            player["@id"] = player.pop("id")
+            data[color] = player
+        return MonthlyArchive(**data)
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from ._base import Model
 
 
-class StreamerDetails(BaseModel):
+class StreamerDetails(Model):
     """Streamer details.
 
     Args:
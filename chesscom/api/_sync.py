@@ -0,0 +1,31 @@
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+
+class MonthCheckpoint(BaseModel):
+    """Incremental archive sync state of a month still in progress.
+
+    Args:
+        last_end_time (int, optional): Latest ``end_time`` of the games synced from the month.
+        last_urls (List[str]): URLs of the games synced from the month that ended at ``last_end_time``.
+    """
+
+    last_end_time: int = None
+    last_urls: List[str] = []
+
+
+class SyncCheckpoint(BaseModel):
+    """Incremental archive sync state of a player.
+
+    Args:
+        username (str): Username.
+        completed (str, optional): Last month (``YYYY/MM``) whose archive was final when fully synced.
+        months (Dict[str, MonthCheckpoint]): State of each month (``YYYY/MM``) still in progress when
+            last synced. Several months can be in progress at once, e.g. the previous month during its
+            grace period and the current one.
+    """
+
+    username: str
+    completed: str = None
+    months: Dict[str, MonthCheckpoint] = {}
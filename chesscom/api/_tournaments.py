@@ -1,9 +1,9 @@
 from typing import Any, Dict, List, Union
 
-from pydantic import BaseModel
+from ._base import Model
 
 
-class TournamentSettings(BaseModel):
+class TournamentSettings(Model):
     """Tournament settings.
 
     Args:
@@ -43,7 +43,7 @@ class TournamentSettings(BaseModel):
     concurrent_games_per_opponent: int
 
 
-class TournamentPlayerStatus(BaseModel):
+class TournamentPlayerStatus(Model):
     """Tournament player status.
 
     Args:
@@ -55,7 +55,11 @@ class TournamentPlayerStatus(BaseModel):
     status: str
 
 
-class TournamentDetails(BaseModel):
+def _players(players: List[Dict[str, Any]]) -> List[TournamentPlayerStatus]:
+    return [TournamentPlayerStatus(**x) for x in players]
+
+
+class TournamentDetails(Model):
     """Tournament details.
 
     Args:
@@ -80,13 +84,14 @@ class TournamentDetails(BaseModel):
     players: List[Dict[str, str]]
     rounds: List[str]
 
+    __lazy__ = {"players": _players}
+
     def __init__(self, **data: Dict[str, Any]):
         super().__init__(**data)
         self.settings = TournamentSettings(**self.settings)
-        self.players = [TournamentPlayerStatus(**x) for x in self.players]
 
 
-class TournamentRoundPlayerAdvancement(BaseModel):
+class TournamentRoundPlayerAdvancement(Model):
     """Information on whether player advances from tournament round.
 
     Args:
@@ -98,7 +103,13 @@ class TournamentRoundPlayerAdvancement(BaseModel):
     is_advancing: bool = None
 
 
-class TournamentRoundDetails(BaseModel):
+def _round_players(
+    players: List[Dict[str, Any]],
+) -> List[TournamentRoundPlayerAdvancement]:
+    return [TournamentRoundPlayerAdvancement(**x) for x in players]
+
+
+class TournamentRoundDetails(Model):
     """Tournament round groups and players.
 
     Args:
@@ -109,12 +120,10 @@ class TournamentRoundDetails(BaseModel):
     groups: List[str]
     players: List[Dict[str, Union[str, bool]]]
 
-    def __init__(self, **data: Dict[str, Any]):
-        super().__init__(**data)
-        self.players = [TournamentRoundPlayerAdvancement(**x) for x in self.players]
+    __lazy__ = {"players": _round_players}
 
 
-class TournamentRoundGroupPlayer(BaseModel):
+class TournamentRoundGroupPlayer(Model):
     """Information on player in tournament round's group.
 
     Args:
@@ -130,7 +139,7 @@ class TournamentRoundGroupPlayer(BaseModel):
     username: str
 
 
-class TournamentRoundGroupGames(BaseModel):
+class TournamentRoundGroupGames(Model):
     """Information on tournament round group games.
 
     Args:
@@ -169,14 +178,11 @@ class TournamentRoundGroupGames(BaseModel):
 
     def __init__(self, **data: Dict[str, Any]):
         super().__init__(**data)
-        self.white["id"] = self.white.pop("@id")
-        self.black["id"] = self.black.pop("@id")
+        self.white = TournamentRoundGroupPlayer(id=self.white["@id"], **self.white)
+        self.black = TournamentRoundGroupPlayer(id=self.black["@id"], **self.black)
 
-        self.white = TournamentRoundGroupPlayer(**self.white)
-        self.black = TournamentRoundGroupPlayer(**self.black)
 
-
-class TournamentRoundGroupPlayer(BaseModel):
+class TournamentRoundGroupPlayer(Model):
     """
     username (str): Username.
     points (str): Points earned by player in this group adjusted in case of fair play recalculations. Defaults to "0".
@@ -195,7 +201,15 @@ class TournamentRoundGroupPlayer(BaseModel):
         self.tie_break = float(self.tie_break)
 
 
-class TournamentRoundGroupDetails(BaseModel):
+def _group_games(games: List[Dict[str, Any]]) -> List[TournamentRoundGroupGames]:
+    return [TournamentRoundGroupGames(**x) for x in games]
+
+
+def _group_players(players: List[Dict[str, Any]]) -> List[TournamentRoundGroupPlayer]:
+    return [TournamentRoundGroupPlayer(**x) for x in players]
+
+
+class TournamentRoundGroupDetails(Model):
     """List of games, players and fair play removals in tournament round group.
 
     Args:
@@ -208,13 +222,10 @@ class TournamentRoundGroupDetails(BaseModel):
     games: List[Dict[str, Any]]
     players: List[Dict[str, Union[str, int, bool]]]
 
-    def __init__(self, **data: Dict[str, Any]):
-        super().__init__(**data)
-        self.games = [TournamentRoundGroupGames(**x) for x in self.games]
-        self.players = [TournamentRoundGroupPlayer(**x) for x in self.players]
+    __lazy__ = {"games": _group_games, "players": _group_players}
 
 
-class TournamentResults(BaseModel):
+class TournamentResults(Model):
     """Tournament results of player.
 
     Args:
@@ -240,7 +251,7 @@ class TournamentResults(BaseModel):
     total_players: int
 
 
-class TournamentStatus(BaseModel):
+class TournamentStatus(Model):
     """Tournament status.
 
     Args:
@@ -254,7 +265,7 @@ class TournamentStatus(BaseModel):
     status: str
 
 
-class TournamentsSummary(BaseModel):
+class TournamentsSummary(Model):
     """Summary of tournaments participated in.
 
     Args:
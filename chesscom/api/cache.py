@@ -0,0 +1,367 @@
+import calendar
+import math
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+DEFAULT_VALIDATOR_STORE_SIZE = 256
+DEFAULT_MEMORY_CACHE_SIZE = 64 * 2**20
+
+MINUTE = 60.0
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+IMMUTABLE = math.inf
+
+DEFAULT_TTLS = {
+    r"/pub/club/[^/]+/members$": 12 * HOUR,
+    r"/pub/country/[^/]+/(players|clubs)$": 12 * HOUR,
+    r"/pub/streamers$": 5 * MINUTE,
+}
+ARCHIVE_PATTERN = re.compile(r"/pub/player/[^/]+/games/(\d{4})/(\d{2})(/pgn)?$")
+
+
+class Validators(NamedTuple):
+    """Validators of a response, its body and the values parsed from it.
+
+    Args:
+        etag (str, optional): ``ETag`` header of the response.
+        last_modified (str, optional): ``Last-Modified`` header of the response.
+        body (bytes): Response body.
+        parsed (Dict[Any, Any]): Values parsed from the body by the clients, by parser.
+    """
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    parsed: Dict[Any, Any]
+
+    def headers(self) -> Dict[str, str]:
+        """Conditional request headers revalidating the response.
+
+        Returns:
+            Dict[str, str]: ``If-None-Match`` and/or ``If-Modified-Since`` headers.
+        """
+        return _conditional_headers(self.etag, self.last_modified)
+
+
+class CacheEntry(NamedTuple):
+    """Cached response.
+
+    Args:
+        body (bytes): Response body.
+        etag (str, optional): ``ETag`` header of the response.
+        last_modified (str, optional): ``Last-Modified`` header of the response.
+        expires (float): Timestamp after which the response must be revalidated.
+    """
+
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires: float
+
+    def is_fresh(self) -> bool:
+        """Whether the response can be used without revalidating it.
+
+        Returns:
+            bool: Whether the response is fresh.
+        """
+        return time.time() < self.expires
+
+    def headers(self) -> Dict[str, str]:
+        """Conditional request headers revalidating the response.
+
+        Returns:
+            Dict[str, str]: ``If-None-Match`` and/or ``If-Modified-Since`` headers.
+        """
+        return _conditional_headers(self.etag, self.last_modified)
+
+
+def _conditional_headers(
+    etag: Optional[str], last_modified: Optional[str]
+) -> Dict[str, str]:
+    headers = {}
+    if etag is not None:
+        headers["If-None-Match"] = etag
+    if last_modified is not None:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+class ValidatorStore:
+    """Thread-safe LRU store of response validators and bodies keyed by URL.
+
+    Lets the clients send conditional requests and, when the server answers 304 (Not Modified), reuse
+    the stored body, and the values already parsed from it, without downloading or parsing it again.
+    Entries are evicted least recently used first once either limit is reached. By default only the
+    number of URLs is bounded, so that the largest responses, e.g. country players or club members of
+    several MB, are kept and revalidated too.
+
+    Args:
+        maxsize (int): Maximum number of URLs kept. Defaults to 256.
+        max_bytes (int, optional): Maximum total size of kept bodies in bytes. Defaults to None (no
+            limit).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_VALIDATOR_STORE_SIZE,
+        max_bytes: Optional[int] = None,
+    ):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Validators]:
+        """Get validators stored for a URL.
+
+        Args:
+            url (str): Endpoint URL.
+
+        Returns:
+            Optional[Validators]: Validators, if stored.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def put(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body: bytes,
+    ) -> None:
+        """Store the validators and body of a response, if it has validators and the body fits.
+
+        Args:
+            url (str): Endpoint URL.
+            etag (str, optional): ``ETag`` header of the response.
+            last_modified (str, optional): ``Last-Modified`` header of the response.
+            body (bytes): Response body.
+        """
+        max_bytes = math.inf if self.max_bytes is None else self.max_bytes
+        with self._lock:
+            self._pop(url)
+            if etag is None and last_modified is None or len(body) > max_bytes:
+                return
+            self._entries[url] = Validators(etag, last_modified, body, {})
+            self.size += len(body)
+            while len(self._entries) > self.maxsize or self.size > max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted.body)
+
+    def clear(self) -> None:
+        """Remove all stored validators."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _pop(self, url: str) -> None:
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self.size -= len(entry.body)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CachePolicy:
+    """Time-to-live of cached responses per endpoint.
+
+    By default, endpoints documented to refresh at most every 12 hours (club members, country players
+    and clubs) are kept for 12 hours and streamers for 5 minutes. Monthly archives (JSON and PGN) of
+    months that are over are immutable; the current month is always revalidated. Other endpoints are
+    not cached.
+
+    Args:
+        ttls (Dict[str, float], optional): TTL in seconds per URL regular expression, replacing the
+            defaults. A TTL of 0 stores the response but revalidates it on every use.
+        default (float, optional): TTL of endpoints not matched by ``ttls``. Defaults to None (not cached).
+        archive_grace (float): Seconds after the end of a month during which its archive is still
+            revalidated, to allow for games being archived late. Defaults to one day.
+    """
+
+    def __init__(
+        self,
+        ttls: Dict[str, float] = None,
+        default: Optional[float] = None,
+        archive_grace: float = DAY,
+    ):
+        ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls.items()]
+        self.default = default
+        self.archive_grace = archive_grace
+
+    def ttl(self, url: str) -> Optional[float]:
+        """Get the TTL of a URL.
+
+        Args:
+            url (str): Endpoint URL.
+
+        Returns:
+            Optional[float]: TTL in seconds, ``IMMUTABLE``, or None if the response is not cached.
+        """
+        url = url.split("?", 1)[0]
+        for pattern, ttl in self.ttls:
+            if pattern.search(url):
+                return ttl
+
+        match = ARCHIVE_PATTERN.search(url)
+        if match is not None:
+            year, month = int(match.group(1)), int(match.group(2))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            month_end = calendar.timegm((year, month, 1, 0, 0, 0))
+            return IMMUTABLE if time.time() >= month_end + self.archive_grace else 0
+
+        return self.default
+
+    def expires(self, url: str) -> Optional[float]:
+        """Get the expiry timestamp of a response fetched now.
+
+        Args:
+            url (str): Endpoint URL.
+
+        Returns:
+            Optional[float]: Expiry timestamp, or None if the response is not cached.
+        """
+        ttl = self.ttl(url)
+        return None if ttl is None else time.time() + ttl
+
+
+class BaseCache(ABC):
+    """Interface of response cache backends."""
+
+    @abstractmethod
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Get the cached response for a URL.
+
+        Args:
+            url (str): Endpoint URL.
+
+        Returns:
+            Optional[CacheEntry]: Cached response, fresh or not.
+        """
+
+    @abstractmethod
+    def set(self, url: str, entry: CacheEntry) -> None:
+        """Cache a response.
+
+        Args:
+            url (str): Endpoint URL.
+            entry (CacheEntry): Response.
+        """
+
+    @abstractmethod
+    def delete(self, url: str) -> None:
+        """Remove the cached response for a URL.
+
+        Args:
+            url (str): Endpoint URL.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached responses."""
+
+
+class MemoryCache(BaseCache):
+    """In-memory LRU response cache, evicting least recently used responses by total body size.
+
+    Args:
+        maxsize (int): Maximum total size of cached bodies in bytes. Defaults to 64 MiB.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MEMORY_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def set(self, url: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._pop(url)
+            if len(entry.body) > self.maxsize:
+                return
+            self._entries[url] = entry
+            self.size += len(entry.body)
+            while self.size > self.maxsize:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted.body)
+
+    def delete(self, url: str) -> None:
+        with self._lock:
+            self._pop(url)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _pop(self, url: str) -> None:
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self.size -= len(entry.body)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(BaseCache):
+    """Persistent response cache stored in an SQLite database, shared across processes and restarts.
+
+    Args:
+        path (str): Database file path.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, "
+                "last_modified TEXT, expires REAL NOT NULL)"
+            )
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, expires FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        return None if row is None else CacheEntry(bytes(row[0]), *row[1:])
+
+    def set(self, url: str, entry: CacheEntry) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (url, *entry),
+            )
+
+    def delete(self, url: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
@@ -0,0 +1,656 @@
+import asyncio
+import io
+import json
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ._base import _trusted, trusted
+from .cache import BaseCache, CacheEntry, CachePolicy, Validators, ValidatorStore
+from .ratelimit import AsyncRateLimiter, RateLimiter, parse_retry_after
+
+DEFAULT_HEADERS = {
+    "User-Agent": "chesscom-python (https://github.com/jeffreywardman/chesscom)",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+}
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_CONCURRENCY = 100
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_CHUNK_SIZE = 64 * 2**10
+# Number of parsers whose values are kept per stored response.
+_MAX_PARSERS = 4
+
+T = TypeVar("T")
+
+
+def default_loads() -> Callable[[bytes], Any]:
+    """Get the fastest available JSON decoder.
+
+    Returns:
+        Callable[[bytes], Any]: ``orjson.loads`` if ``orjson`` is installed (``pip install
+            chesscom[fast]``), which decodes straight from the response bytes, otherwise ``json.loads``.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+class _BodyReader(io.RawIOBase):
+    """Raw stream over a streamed response body.
+
+    Keeps reporting end of file once the body is consumed (urllib3 marks it closed), and optionally keeps
+    a copy of the body that is handed to ``on_complete`` once fully read.
+    """
+
+    def __init__(self, raw: BinaryIO, on_complete: Callable[[bytes], Any] = None):
+        self.raw = raw
+        self.on_complete = on_complete
+        self.chunks = [] if on_complete is not None else None
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray) -> int:
+        data = self.raw.read(len(buffer))
+        n = len(data)
+        buffer[:n] = data
+        if self.chunks is not None:
+            if n:
+                self.chunks.append(data)
+            else:
+                self.on_complete(b"".join(self.chunks))
+                self.chunks = None
+        return n
+
+
+async def _chunks(body: bytes) -> AsyncIterator[bytes]:
+    yield body
+
+
+def _parser_key(parse: Callable[[Any], Any]) -> Any:
+    # Functions without closure or defaults, e.g. the lambdas of the API wrappers, behave the same each
+    # time their definition is run, so they are keyed by their code to share the parsed values.
+    code = getattr(parse, "__code__", None)
+    if code is None or parse.__closure__ or parse.__defaults__ or parse.__kwdefaults__:
+        return parse
+    return code
+
+
+class _BaseClient:
+    """Response cache and revalidation logic shared by the clients."""
+
+    def __init__(
+        self,
+        validators: Optional[ValidatorStore],
+        cache: Optional[BaseCache],
+        cache_policy: Optional[CachePolicy],
+        trusted: bool,
+        loads: Optional[Callable[[bytes], Any]],
+    ):
+        self.validators = ValidatorStore() if validators is None else validators
+        self.cache = cache
+        self.cache_policy = CachePolicy() if cache_policy is None else cache_policy
+        self.trusted = trusted
+        self.loads = default_loads() if loads is None else loads
+
+    def _lookup(self, url: str) -> Tuple[Optional[float], Optional[CacheEntry]]:
+        expires = None if self.cache is None else self.cache_policy.expires(url)
+        entry = None if expires is None else self.cache.get(url)
+        return expires, entry
+
+    def _not_modified(
+        self,
+        url: str,
+        expires: Optional[float],
+        entry: Optional[CacheEntry],
+        validators: Optional[Validators],
+    ) -> bytes:
+        if entry is not None:
+            self.cache.set(url, entry._replace(expires=expires))
+            return entry.body
+        return validators.body
+
+    def _modified(
+        self,
+        url: str,
+        expires: Optional[float],
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> CacheEntry:
+        entry = CacheEntry(
+            body,
+            headers.get("ETag"),
+            headers.get("Last-Modified"),
+            0.0 if expires is None else expires,
+        )
+        if expires is not None:
+            self.cache.set(url, entry)
+        return entry
+
+    def _conditional(
+        self, url: str, entry: Optional[CacheEntry]
+    ) -> Tuple[Optional[Validators], Optional[Dict[str, str]]]:
+        # Cached responses are revalidated from the cache, others from the validator store.
+        validators = None if entry is not None else self.validators.get(url)
+        conditional = entry if entry is not None else validators
+        return validators, None if conditional is None else conditional.headers()
+
+    def _store(self, url: str, expires: Optional[float], entry: CacheEntry) -> bytes:
+        if expires is None:
+            self.validators.put(url, entry.etag, entry.last_modified, entry.body)
+        return entry.body
+
+    def _parse(
+        self, url: str, body: bytes, parse: Optional[Callable[[Any], T]]
+    ) -> Union[T, Any]:
+        validators = None if parse is None else self.validators.get(url)
+        # Only bodies stored in the validator store, e.g. returned on 304, have their values kept.
+        if validators is None or validators.body is not body:
+            return self.decode(body, parse)
+        key = (_parser_key(parse), self.trusted or _trusted.get())
+        parsed = validators.parsed
+        if key in parsed:
+            return parsed[key]
+        value = self.decode(body, parse)
+        if len(parsed) >= _MAX_PARSERS:
+            parsed.pop(next(iter(parsed)), None)
+        parsed[key] = value
+        return value
+
+    def decode(self, body: bytes, parse: Callable[[Any], T] = None) -> Union[T, Any]:
+        """Decode a JSON response body as :meth:`get` does.
+
+        Args:
+            body (bytes): Response body, e.g. returned by ``fetch``.
+            parse (Callable[[Any], T], optional): Function converting the decoded JSON body.
+
+        Returns:
+            Union[T, Any]: Parsed value, or the decoded JSON body if ``parse`` is not given.
+        """
+        response = self.loads(body)
+        if parse is None:
+            return response
+        if self.trusted:
+            with trusted():
+                return parse(response)
+        return parse(response)
+
+
+class Client(_BaseClient):
+    """HTTP client shared by the API wrappers.
+
+    Requests are sent through one ``requests.Session`` so that TCP/TLS connections are kept alive and
+    reused between calls instead of being re-established for every endpoint.
+
+    Args:
+        pool_connections (int): Number of per-host connection pools to cache. Defaults to 10.
+        pool_maxsize (int): Maximum number of keep-alive connections per host. Defaults to 10.
+        timeout (Union[float, Tuple[float, float]]): Timeout in seconds, or (connect, read) timeouts.
+            Defaults to 30.
+        headers (Dict[str, str], optional): Headers sent with every request, on top of the defaults.
+        rate_limiter (RateLimiter, optional): Governor every request goes through. Defaults to a new
+            :class:`~chesscom.api.ratelimit.RateLimiter`.
+        max_retries (int): Number of retries of a throttled (429) request. Defaults to 5.
+        validators (ValidatorStore, optional): Store of the validators and bodies of uncached responses,
+            used for conditional requests. Defaults to a new :class:`~chesscom.api.cache.ValidatorStore`.
+        cache (BaseCache, optional): Response cache backend, e.g. :class:`~chesscom.api.cache.MemoryCache`
+            or :class:`~chesscom.api.cache.SQLiteCache`. Defaults to None (no caching).
+        cache_policy (CachePolicy, optional): TTL of cached responses per endpoint. Defaults to a new
+            :class:`~chesscom.api.cache.CachePolicy`.
+        trusted (bool): Build models from responses without validating them, as in
+            :func:`~chesscom.api._base.trusted` mode. Defaults to False.
+        loads (Callable[[bytes], Any], optional): JSON decoder applied to response bodies, e.g.
+            ``msgspec.json.decode``. Defaults to :func:`default_loads`.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_SIZE,
+        pool_maxsize: int = DEFAULT_POOL_SIZE,
+        timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+        headers: Dict[str, str] = None,
+        rate_limiter: RateLimiter = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        validators: ValidatorStore = None,
+        cache: BaseCache = None,
+        cache_policy: CachePolicy = None,
+        trusted: bool = False,
+        loads: Callable[[bytes], Any] = None,
+    ):
+        super().__init__(validators, cache, cache_policy, trusted, loads)
+        self.timeout = timeout
+        self.rate_limiter = RateLimiter() if rate_limiter is None else rate_limiter
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers is not None:
+            self.session.headers.update(headers)
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self, url: str, headers: Dict[str, str] = None, stream: bool = False
+    ) -> requests.Response:
+        """Send a GET request.
+
+        Throttled (429) requests are retried after the delay given by ``Retry-After``, or after a
+        jittered exponential backoff.
+
+        Args:
+            url (str): Endpoint URL.
+            headers (Dict[str, str], optional): Extra headers for this request.
+            stream (bool): Whether to defer downloading the body until it is read. Defaults to False.
+
+        Raises:
+            requests.HTTPError: If the final response is an error.
+
+        Returns:
+            requests.Response: Raw response.
+        """
+        for attempt in range(self.max_retries + 1):
+            token = self.rate_limiter.acquire()
+            try:
+                response = self.session.get(
+                    url, headers=headers, timeout=self.timeout, stream=stream
+                )
+            except Exception:
+                self.rate_limiter.release(token)
+                raise
+            throttled = response.status_code == 429
+            self.rate_limiter.release(token, throttled)
+            if not throttled or attempt == self.max_retries:
+                break
+            self.rate_limiter.backoff(attempt, parse_retry_after(response.headers))
+            response.close()
+
+        response.raise_for_status()
+        return response
+
+    def fetch(self, url: str) -> bytes:
+        """Get the body of an endpoint, from the response cache if it holds a fresh copy.
+
+        Stale cached responses, and responses whose validators (``ETag``, ``Last-Modified``) and body
+        are in the validator store, are revalidated with a conditional request. If the server answers
+        304 (Not Modified), the stored body is returned without being downloaded again.
+
+        Args:
+            url (str): Endpoint URL.
+
+        Returns:
+            bytes: Response body.
+        """
+        expires, entry = self._lookup(url)
+        if entry is not None and entry.is_fresh():
+            return entry.body
+
+        validators, headers = self._conditional(url, entry)
+        response = self.request(url, headers)
+        if response.status_code == 304:
+            return self._not_modified(url, expires, entry, validators)
+        entry = self._modified(url, expires, response.headers, response.content)
+        return self._store(url, expires, entry)
+
+    @contextmanager
+    def stream(self, url: str) -> Iterator[BinaryIO]:
+        """Open the body of an endpoint as a binary file object that is downloaded as it is read.
+
+        Fresh cached responses are read from the response cache. Otherwise the body is streamed from the
+        server and, if the endpoint is cached, stored in the cache once it has been read to the end.
+
+        Args:
+            url (str): Endpoint URL.
+
+        Yields:
+            BinaryIO: Response body.
+        """
+        expires, entry = self._lookup(url)
+        if entry is not None and entry.is_fresh():
+            yield io.BytesIO(entry.body)
+            return
+
+        response = self.request(
+            url, None if entry is None else entry.headers(), stream=True
+        )
+        try:
+            if response.status_code == 304:
+                yield io.BytesIO(self._not_modified(url, expires, entry, None))
+                return
+
+            response.raw.decode_content = True
+            on_complete = None
+            if expires is not None:
+                on_complete = lambda body: self._modified(
+                    url, expires, response.headers, body
+                )
+            yield io.BufferedReader(_BodyReader(response.raw, on_complete))
+        finally:
+            response.close()
+
+    def get(self, url: str, parse: Callable[[Any], T] = None) -> Union[T, Any]:
+        """Get an endpoint and decode the JSON body.
+
+        The body is fetched with :meth:`fetch`, so that a response unchanged since the previous request
+        for the same URL is not downloaded again. The value parsed from a body in the validator store is
+        kept next to it, per ``parse`` function, and returned again while the server answers 304 (Not
+        Modified), without decoding or parsing the body again. Such values are shared between callers
+        and must not be modified. The decoded JSON body (no ``parse``) is never kept.
+
+        Args:
+            url (str): Endpoint URL.
+            parse (Callable[[Any], T], optional): Function converting the decoded JSON body.
+
+        Returns:
+            Union[T, Any]: Parsed value, or the decoded JSON body if ``parse`` is not given.
+        """
+        return self._parse(url, self.fetch(url), parse)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncClient(_BaseClient):
+    """Asynchronous HTTP client shared by the async API wrappers.
+
+    Requests are sent through one pooled ``aiohttp.ClientSession``. Any number of calls can be awaited
+    concurrently; the rate limiter lets at most ``max_concurrency`` of them be in flight at once and
+    shrinks that number while the server is throttling. Requires the optional ``aiohttp`` dependency
+    (``pip install chesscom[async]``).
+
+    Args:
+        pool_maxsize (int): Maximum number of keep-alive connections per host. Defaults to 10.
+        max_concurrency (int): Maximum number of requests in flight. Defaults to 100.
+        timeout (Union[float, Tuple[float, float]]): Timeout in seconds, or (connect, read) timeouts.
+            Defaults to 30.
+        headers (Dict[str, str], optional): Headers sent with every request, on top of the defaults.
+        rate_limiter (AsyncRateLimiter, optional): Governor every request goes through. Defaults to a new
+            :class:`~chesscom.api.ratelimit.AsyncRateLimiter` bounded by ``max_concurrency``.
+        max_retries (int): Number of retries of a throttled (429) request. Defaults to 5.
+        validators (ValidatorStore, optional): Store of the validators and bodies of uncached responses,
+            used for conditional requests. Defaults to a new :class:`~chesscom.api.cache.ValidatorStore`.
+        cache (BaseCache, optional): Response cache backend, e.g. :class:`~chesscom.api.cache.MemoryCache`
+            or :class:`~chesscom.api.cache.SQLiteCache`. Defaults to None (no caching).
+        cache_policy (CachePolicy, optional): TTL of cached responses per endpoint. Defaults to a new
+            :class:`~chesscom.api.cache.CachePolicy`.
+        trusted (bool): Build models from responses without validating them, as in
+            :func:`~chesscom.api._base.trusted` mode. Defaults to False.
+        loads (Callable[[bytes], Any], optional): JSON decoder applied to response bodies, e.g.
+            ``msgspec.json.decode``. Defaults to :func:`default_loads`.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = DEFAULT_POOL_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+        headers: Dict[str, str] = None,
+        rate_limiter: AsyncRateLimiter = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        validators: ValidatorStore = None,
+        cache: BaseCache = None,
+        cache_policy: CachePolicy = None,
+        trusted: bool = False,
+        loads: Callable[[bytes], Any] = None,
+    ):
+        super().__init__(validators, cache, cache_policy, trusted, loads)
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.rate_limiter = (
+            AsyncRateLimiter(max_concurrency=max_concurrency)
+            if rate_limiter is None
+            else rate_limiter
+        )
+        self.max_retries = max_retries
+        self.headers = dict(DEFAULT_HEADERS)
+        if headers is not None:
+            self.headers.update(headers)
+
+        self.session = None
+        self._loop = None
+
+    async def _ensure_session(self) -> None:
+        # Sessions are bound to the event loop they are created in.
+        loop = asyncio.get_event_loop()
+        if self.session is not None and self._loop is loop and not self.session.closed:
+            return
+        if self.session is not None and not self.session.closed:
+            # Left open by a previous event loop, e.g. an earlier ``asyncio.run``.
+            await self.session.close()
+
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError(
+                "AsyncClient requires aiohttp: pip install chesscom[async]"
+            ) from e
+
+        if isinstance(self.timeout, tuple):
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.timeout[0], sock_read=self.timeout[1]
+            )
+        else:
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        connector = aiohttp.TCPConnector(limit_per_host=self.pool_maxsize)
+        self.session = aiohttp.ClientSession(
+            connector=connector, headers=self.headers, timeout=timeout
+        )
+        self._loop = loop
+
+    async def _send(
+        self, url: str, headers: Dict[str, str] = None
+    ) -> Tuple[Any, bytes]:
+        await self._ensure_session()
+        for attempt in range(self.max_retries + 1):
+            token = await self.rate_limiter.acquire()
+            throttled = False
+            try:
+                async with self.session.get(url, headers=headers) as response:
+                    throttled = response.status == 429
+                    if not throttled or attempt == self.max_retries:
+                        response.raise_for_status()
+                        return response, await response.read()
+                    retry_after = parse_retry_after(response.headers)
+            finally:
+                await self.rate_limiter.release(token, throttled)
+            await self.rate_limiter.backoff(attempt, retry_after)
+
+    async def request(self, url: str) -> bytes:
+        """Send a GET request.
+
+        Throttled (429) requests are retried after the delay given by ``Retry-After``, or after a
+        jittered exponential backoff.
+
+        Args:
+            url (str): Endpoint URL.
+
+        Raises:
+            aiohttp.ClientResponseError: If the final response is an error.
+
+        Returns:
+            bytes: Raw response body.
+        """
+        _, body = await self._send(url)
+        return body
+
+    async def fetch(self, url: str) -> bytes:
+        """Get the body of an endpoint, from the response cache if it holds a fresh copy.
+
+        Responses are revalidated in the same way as :meth:`Client.fetch`.
+
+        Args:
+            url (str): Endpoint URL.
+
+        Returns:
+            bytes: Response body.
+        """
+        expires, entry = self._lookup(url)
+        if entry is not None and entry.is_fresh():
+            return entry.body
+
+        validators, headers = self._conditional(url, entry)
+        response, body = await self._send(url, headers)
+        if response.status == 304:
+            return self._not_modified(url, expires, entry, validators)
+        entry = self._modified(url, expires, response.headers, body)
+        return self._store(url, expires, entry)
+
+    @asynccontextmanager
+    async def stream(self, url: str) -> AsyncIterator[AsyncIterator[bytes]]:
+        """Open the body of an endpoint as chunks that are downloaded as they are iterated over.
+
+        Fresh cached responses are read from the response cache. Otherwise the body is streamed from the
+        server and, if the endpoint is cached, stored in the cache once it has been read to the end.
+
+        Args:
+            url (str): Endpoint URL.
+
+        Yields:
+            AsyncIterator[bytes]: Chunks of the response body.
+        """
+        expires, entry = self._lookup(url)
+        if entry is not None and entry.is_fresh():
+            yield _chunks(entry.body)
+            return
+
+        headers = None if entry is None else entry.headers()
+        await self._ensure_session()
+        for attempt in range(self.max_retries + 1):
+            token = await self.rate_limiter.acquire()
+            throttled = False
+            try:
+                async with self.session.get(url, headers=headers) as response:
+                    throttled = response.status == 429
+                    if not throttled or attempt == self.max_retries:
+                        response.raise_for_status()
+                        if response.status == 304:
+                            body = self._not_modified(url, expires, entry, None)
+                            yield _chunks(body)
+                        else:
+                            yield self._read_chunks(url, expires, response)
+                        return
+                    retry_after = parse_retry_after(response.headers)
+            finally:
+                await self.rate_limiter.release(token, throttled)
+            await self.rate_limiter.backoff(attempt, retry_after)
+
+    async def _read_chunks(
+        self, url: str, expires: Optional[float], response: Any
+    ) -> AsyncIterator[bytes]:
+        chunks = [] if expires is not None else None
+        async for chunk in response.content.iter_chunked(DEFAULT_CHUNK_SIZE):
+            if chunks is not None:
+                chunks.append(chunk)
+            yield chunk
+        if chunks is not None:
+            self._modified(url, expires, response.headers, b"".join(chunks))
+
+    async def get(self, url: str, parse: Callable[[Any], T] = None) -> Union[T, Any]:
+        """Get an endpoint and decode the JSON body.
+
+        Responses are cached and revalidated in the same way as :meth:`Client.get`.
+
+        Args:
+            url (str): Endpoint URL.
+            parse (Callable[[Any], T], optional): Function converting the decoded JSON body.
+
+        Returns:
+            Union[T, Any]: Parsed value, or the decoded JSON body if ``parse`` is not given.
+        """
+        return self._parse(url, await self.fetch(url), parse)
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+_default_client = None
+_default_async_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_client() -> Client:
+    """Get the client used by the API wrappers, creating it on first use.
+
+    Returns:
+        Client: Default client.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = Client()
+    return _default_client
+
+
+def set_client(client: Client) -> None:
+    """Replace the client used by the API wrappers (e.g. to tune pool size, timeouts or headers).
+
+    Args:
+        client (Client): Client to route requests through.
+    """
+    global _default_client
+    with _default_client_lock:
+        _default_client = client
+
+
+def get_async_client() -> AsyncClient:
+    """Get the client used by the async API wrappers, creating it on first use.
+
+    Returns:
+        AsyncClient: Default async client.
+    """
+    global _default_async_client
+    if _default_async_client is None:
+        with _default_client_lock:
+            if _default_async_client is None:
+                _default_async_client = AsyncClient()
+    return _default_async_client
+
+
+def set_async_client(client: AsyncClient) -> None:
+    """Replace the client used by the async API wrappers.
+
+    Args:
+        client (AsyncClient): Client to route requests through.
+    """
+    global _default_async_client
+    with _default_client_lock:
+        _default_async_client = client
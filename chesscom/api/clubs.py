@@ -1,8 +1,208 @@
-import requests
+import asyncio
+from functools import reduce
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
 
-from ._clubs import ClubDetails, ClubMatches, ClubMembers
+import numpy as np
+
+from ._clubs import ClubDetails, ClubMatches, ClubMembers, UserJoinClub
+from ._concurrency import prefetch
+from .client import get_async_client, get_client
+from .jsonstream import aiter_arrays, iter_arrays
 
 BASE_CLUB_URL = "https://api.chess.com/pub/club"
+TIMEFRAMES = ("weekly", "monthly", "all_time")
+DEFAULT_MEMBERSHIP_WORKERS = 8
+
+
+def _details(response: Dict[str, Any]) -> ClubDetails:
+    response["id"] = response.pop("@id")
+    return ClubDetails(**response)
+
+
+def _member_usernames(response: Dict[str, Any]) -> List[str]:
+    return [x["username"] for timeframe in TIMEFRAMES for x in response[timeframe]]
+
+
+class MembershipIndex:
+    """Members of many clubs, stored as sorted arrays of integer user IDs.
+
+    Usernames are mapped to IDs once, case-insensitively, so that set operations across clubs run on
+    NumPy arrays instead of Python objects. An index built from a ``previous`` one shares its user IDs,
+    so that snapshots of the same clubs taken at different times can be compared directly.
+
+    Args:
+        previous (MembershipIndex, optional): Index whose user IDs are shared.
+    """
+
+    def __init__(self, previous: Optional["MembershipIndex"] = None):
+        if previous is None:
+            self._ids: Dict[str, int] = {}
+            self._usernames: List[str] = []
+        else:
+            self._ids, self._usernames = previous._ids, previous._usernames
+        self._clubs: Dict[str, np.ndarray] = {}
+
+    def _to_ids(self, usernames: Iterable[str]) -> np.ndarray:
+        ids = []
+        for username in usernames:
+            key = username.lower()
+            user_id = self._ids.get(key)
+            if user_id is None:
+                user_id = self._ids[key] = len(self._usernames)
+                self._usernames.append(username)
+            ids.append(user_id)
+        return np.unique(np.array(ids, dtype=np.int32))
+
+    def _to_usernames(self, ids: np.ndarray) -> List[str]:
+        usernames = self._usernames
+        return [usernames[i] for i in ids.tolist()]
+
+    def add(self, club_id: str, usernames: Iterable[str]) -> None:
+        """Set the members of a club, replacing any previous ones.
+
+        Args:
+            club_id (str): Club ID.
+            usernames (Iterable[str]): Usernames of the members.
+        """
+        self._clubs[club_id] = self._to_ids(usernames)
+
+    def clubs(self) -> List[str]:
+        """Get the indexed clubs.
+
+        Returns:
+            List[str]: Club IDs.
+        """
+        return list(self._clubs)
+
+    def members(self, club_id: str) -> List[str]:
+        """Get the members of a club.
+
+        Args:
+            club_id (str): Club ID.
+
+        Returns:
+            List[str]: Usernames of the members.
+        """
+        return self._to_usernames(self._clubs[club_id])
+
+    def clubs_of(self, username: str) -> List[str]:
+        """Get the indexed clubs a player is a member of.
+
+        Args:
+            username (str): Username, in any case.
+
+        Returns:
+            List[str]: Club IDs.
+        """
+        user_id = self._ids.get(username.lower())
+        if user_id is None:
+            return []
+        clubs = []
+        for club_id, ids in self._clubs.items():
+            i = np.searchsorted(ids, user_id)
+            if i < len(ids) and ids[i] == user_id:
+                clubs.append(club_id)
+        return clubs
+
+    def intersection(self, *club_ids: str) -> List[str]:
+        """Get the players who are members of all given clubs.
+
+        Args:
+            *club_ids (str): Club IDs.
+
+        Returns:
+            List[str]: Usernames, none if no club is given, as with :meth:`union`.
+        """
+        if not club_ids:
+            return []
+        ids = reduce(
+            lambda a, b: np.intersect1d(a, b, assume_unique=True),
+            (self._clubs[x] for x in club_ids),
+        )
+        return self._to_usernames(ids)
+
+    def union(self, *club_ids: str) -> List[str]:
+        """Get the players who are members of any of the given clubs.
+
+        Args:
+            *club_ids (str): Club IDs.
+
+        Returns:
+            List[str]: Usernames.
+        """
+        return self._to_usernames(np.unique(self._union(club_ids)))
+
+    def _union(self, club_ids: Sequence[str]) -> np.ndarray:
+        arrays = [self._clubs[x] for x in club_ids]
+        return np.concatenate(arrays) if arrays else np.empty(0, dtype=np.int32)
+
+    def difference(self, club_id: str, *club_ids: str) -> List[str]:
+        """Get the members of a club who are not members of any of the other clubs.
+
+        Args:
+            club_id (str): Club ID.
+            *club_ids (str): Club IDs of the other clubs.
+
+        Returns:
+            List[str]: Usernames.
+        """
+        ids = np.setdiff1d(self._clubs[club_id], self._union(club_ids))
+        return self._to_usernames(ids)
+
+    def overlap(self, club_ids: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Count the members shared by each pair of clubs.
+
+        Args:
+            club_ids (Sequence[str], optional): Club IDs. Defaults to all indexed clubs.
+
+        Returns:
+            np.ndarray: Symmetric matrix of member counts, in the order of ``club_ids``; the diagonal
+                holds the number of members of each club.
+        """
+        club_ids = self.clubs() if club_ids is None else club_ids
+        arrays = [self._clubs[x] for x in club_ids]
+        counts = np.zeros((len(arrays), len(arrays)), dtype=np.int64)
+        # One membership mask per club, then each other club is a single gather from it.
+        mask = np.zeros(len(self._usernames), dtype=bool)
+        for i, a in enumerate(arrays):
+            mask[a] = True
+            for j in range(i, len(arrays)):
+                counts[i, j] = counts[j, i] = np.count_nonzero(mask[arrays[j]])
+            mask[a] = False
+        return counts
+
+    def new_since(self, previous: "MembershipIndex", club_id: str) -> List[str]:
+        """Get the members of a club who were not members in a previous snapshot.
+
+        Args:
+            previous (MembershipIndex): Previous snapshot, ideally built with this index as ``previous``
+                (or the other way around) so that user IDs need no mapping.
+            club_id (str): Club ID.
+
+        Returns:
+            List[str]: Usernames of the new members.
+        """
+        old = previous._clubs.get(club_id, np.empty(0, dtype=np.int32))
+        if previous._ids is not self._ids:
+            ids = (self._ids.get(x.lower()) for x in previous._to_usernames(old))
+            old = np.array([x for x in ids if x is not None], dtype=np.int32)
+        ids = np.setdiff1d(self._clubs[club_id], old)
+        return self._to_usernames(ids)
+
+    def __contains__(self, club_id: str) -> bool:
+        return club_id in self._clubs
+
+    def __len__(self) -> int:
+        return len(self._clubs)
 
 
 class Club:
@@ -19,9 +219,7 @@ class Club:
             ClubDetails: Club details class.
         """
         api_url = f"{BASE_CLUB_URL}/{club_id}"
-        response = requests.get(api_url).json()
-        response["id"] = response.pop("@id")
-        return ClubDetails(**response)
+        return get_client().get(api_url, _details)
 
     @staticmethod
     def members(club_id: str) -> ClubMembers:
@@ -36,8 +234,62 @@ class Club:
             ClubMembers: Club members class.
         """
         api_url = f"{BASE_CLUB_URL}/{club_id}/members"
-        response = requests.get(api_url).json()
-        return ClubMembers(**response)
+        return get_client().get(api_url, lambda response: ClubMembers(**response))
+
+    @staticmethod
+    def iter_members(
+        club_id: str, timeframes: Sequence[str] = TIMEFRAMES
+    ) -> Iterator[UserJoinClub]:
+        """Iterate over club members, parsing the response as it is downloaded.
+
+        Members are yielded as soon as they are received, so memory use does not grow with the size of
+        the club.
+
+        Note: Endpoint refreshes at most every 12 hours.
+
+        Args:
+            club_id (str): Club ID.
+            timeframes (Sequence[str]): Timeframes of the members yielded, among "weekly", "monthly" and
+                "all_time". Defaults to all of them.
+
+        Yields:
+            UserJoinClub: Member and their join date.
+        """
+        api_url = f"{BASE_CLUB_URL}/{club_id}/members"
+        with get_client().stream(api_url) as body:
+            for _, member in iter_arrays(body, timeframes):
+                yield UserJoinClub(**member)
+
+    @staticmethod
+    def membership_index(
+        club_ids: Sequence[str],
+        previous: Optional[MembershipIndex] = None,
+        max_workers: int = DEFAULT_MEMBERSHIP_WORKERS,
+    ) -> MembershipIndex:
+        """Get an index of the members of many clubs.
+
+        Members are fetched concurrently and indexed without building ``ClubMembers``.
+
+        Note: Endpoint refreshes at most every 12 hours.
+
+        Args:
+            club_ids (Sequence[str]): Club IDs.
+            previous (MembershipIndex, optional): Previous snapshot whose user IDs are shared, e.g. to
+                query :meth:`MembershipIndex.new_since` against it.
+            max_workers (int): Number of clubs fetched concurrently. Defaults to 8.
+
+        Returns:
+            MembershipIndex: Membership index class.
+        """
+        client = get_client()
+        api_urls = [f"{BASE_CLUB_URL}/{club_id}/members" for club_id in club_ids]
+        members = prefetch(
+            api_urls, lambda url: client.get(url, _member_usernames), max_workers
+        )
+        index = MembershipIndex(previous)
+        for club_id, usernames in zip(club_ids, members):
+            index.add(club_id, usernames)
+        return index
 
     @staticmethod
     def matches(club_id: str) -> ClubMatches:
@@ -50,5 +302,115 @@ class Club:
             ClubMatches: Club matches class.
         """
         api_url = f"{BASE_CLUB_URL}/{club_id}/matches"
-        response = requests.get(api_url).json()
-        return ClubMatches(**response)
+        return get_client().get(api_url, lambda response: ClubMatches(**response))
+
+
+class AsyncClub:
+    """Asynchronous club API wrapper.
+
+    Mirrors :class:`Club`, returning the same models.
+    """
+
+    @staticmethod
+    async def details(club_id: str) -> ClubDetails:
+        """Get club details.
+
+        Args:
+            club_id (str): Club ID.
+
+        Returns:
+            ClubDetails: Club details class.
+        """
+        api_url = f"{BASE_CLUB_URL}/{club_id}"
+        return await get_async_client().get(api_url, _details)
+
+    @staticmethod
+    async def members(club_id: str) -> ClubMembers:
+        """Get club members.
+
+        Note: Endpoint refreshes at most every 12 hours.
+
+        Args:
+            club_id (str): Club ID.
+
+        Returns:
+            ClubMembers: Club members class.
+        """
+        api_url = f"{BASE_CLUB_URL}/{club_id}/members"
+        return await get_async_client().get(
+            api_url, lambda response: ClubMembers(**response)
+        )
+
+    @staticmethod
+    async def iter_members(
+        club_id: str, timeframes: Sequence[str] = TIMEFRAMES
+    ) -> AsyncIterator[UserJoinClub]:
+        """Iterate over club members, parsing the response as it is downloaded.
+
+        Members are yielded as soon as they are received, so memory use does not grow with the size of
+        the club.
+
+        Note: Endpoint refreshes at most every 12 hours.
+
+        Args:
+            club_id (str): Club ID.
+            timeframes (Sequence[str]): Timeframes of the members yielded, among "weekly", "monthly" and
+                "all_time". Defaults to all of them.
+
+        Yields:
+            UserJoinClub: Member and their join date.
+        """
+        api_url = f"{BASE_CLUB_URL}/{club_id}/members"
+        async with get_async_client().stream(api_url) as chunks:
+            async for _, member in aiter_arrays(chunks, timeframes):
+                yield UserJoinClub(**member)
+
+    @staticmethod
+    async def membership_index(
+        club_ids: Sequence[str],
+        previous: Optional[MembershipIndex] = None,
+        max_concurrency: int = DEFAULT_MEMBERSHIP_WORKERS,
+    ) -> MembershipIndex:
+        """Get an index of the members of many clubs.
+
+        Members are fetched concurrently and indexed without building ``ClubMembers``.
+
+        Note: Endpoint refreshes at most every 12 hours.
+
+        Args:
+            club_ids (Sequence[str]): Club IDs.
+            previous (MembershipIndex, optional): Previous snapshot whose user IDs are shared, e.g. to
+                query :meth:`MembershipIndex.new_since` against it.
+            max_concurrency (int): Number of clubs fetched concurrently. Defaults to 8.
+
+        Returns:
+            MembershipIndex: Membership index class.
+        """
+        client = get_async_client()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(club_id: str) -> List[str]:
+            async with semaphore:
+                api_url = f"{BASE_CLUB_URL}/{club_id}/members"
+                return await client.get(api_url, _member_usernames)
+
+        members = await asyncio.gather(*(fetch(club_id) for club_id in club_ids))
+        index = MembershipIndex(previous)
+        for club_id, usernames in zip(club_ids, members):
+            index.add(club_id, usernames)
+        return index
+
+    @staticmethod
+    async def matches(club_id: str) -> ClubMatches:
+        """Get club matches.
+
+        Args:
+            club_id (str): Club ID.
+
+        Returns:
+            ClubMatches: Club matches class.
+        """
+        api_url = f"{BASE_CLUB_URL}/{club_id}/matches"
+        return await get_async_client().get(
+            api_url, lambda response: ClubMatches(**response)
+        )
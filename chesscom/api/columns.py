@@ -0,0 +1,184 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+RESULTS = (
+    "win",
+    "checkmated",
+    "agreed",
+    "repetition",
+    "timeout",
+    "resigned",
+    "stalemate",
+    "lose",
+    "insufficient",
+    "50move",
+    "abandoned",
+    "kingofthehill",
+    "threecheck",
+    "timevsinsufficient",
+    "bughousepartnerlose",
+)
+TIME_CLASSES = ("daily", "rapid", "blitz", "bullet")
+RULES = (
+    "chess",
+    "chess960",
+    "bughouse",
+    "kingofthehill",
+    "threecheck",
+    "crazyhouse",
+    "oddschess",
+)
+CATEGORIES = {
+    "white_result": RESULTS,
+    "black_result": RESULTS,
+    "time_class": TIME_CLASSES,
+    "rules": RULES,
+}
+UNKNOWN = -1
+ECO_REGEX = re.compile(r'^\[ECO\s+"([^"]*)"\]', re.MULTILINE)
+
+ARCHIVE_DTYPE = np.dtype(
+    [
+        ("end_time", "i8"),
+        ("start_time", "i8"),
+        ("white_rating", "i4"),
+        ("black_rating", "i4"),
+        ("white_result", "i1"),
+        ("black_result", "i1"),
+        ("time_class", "i1"),
+        ("rules", "i1"),
+        ("white", "O"),
+        ("black", "O"),
+        ("time_control", "O"),
+        ("eco", "O"),
+        ("eco_url", "O"),
+        ("url", "O"),
+        ("player", "O"),
+        ("month", "O"),
+    ]
+)
+
+_CODES = {
+    name: {value: code for code, value in enumerate(values)}
+    for name, values in CATEGORIES.items()
+}
+
+
+def _code(name: str, value: str) -> int:
+    return _CODES[name].get(value, UNKNOWN)
+
+
+def _eco(pgn: str) -> Optional[str]:
+    match = ECO_REGEX.search(pgn)
+    return match.group(1) if match else None
+
+
+class ArchiveColumns:
+    """Columnar builder of monthly archive games, fed directly from API responses.
+
+    Games are appended column by column without building ``MonthlyArchive`` models, and exported as a
+    NumPy structured array (:data:`ARCHIVE_DTYPE`) or an Arrow table. Results, time classes and rules
+    are stored as categorical codes indexing :data:`RESULTS`, :data:`TIME_CLASSES` and :data:`RULES`,
+    or :data:`UNKNOWN`; a missing ``start_time`` is stored as -1. ``eco`` is the ECO code from the
+    game's PGN headers and ``eco_url`` the opening page linked by the API, either None when missing.
+    """
+
+    def __init__(self):
+        self._columns: Dict[str, List[Any]] = {name: [] for name in ARCHIVE_DTYPE.names}
+
+    def add(
+        self,
+        games: Iterable[Dict[str, Any]],
+        player: Optional[str] = None,
+        month: Optional[str] = None,
+    ) -> None:
+        """Append games of a monthly archive.
+
+        Args:
+            games (Iterable[Dict[str, Any]]): Games, as in the ``games`` list of the monthly archive
+                endpoint.
+            player (str, optional): Username the archive belongs to, used to partition Parquet output.
+            month (str, optional): Month of the archive as ``YYYY-MM``, used to partition Parquet output.
+        """
+        columns = self._columns
+        for game in games:
+            white, black = game["white"], game["black"]
+            columns["end_time"].append(game["end_time"])
+            columns["start_time"].append(game.get("start_time", -1))
+            columns["white_rating"].append(white["rating"])
+            columns["black_rating"].append(black["rating"])
+            columns["white_result"].append(_code("white_result", white["result"]))
+            columns["black_result"].append(_code("black_result", black["result"]))
+            columns["time_class"].append(_code("time_class", game["time_class"]))
+            columns["rules"].append(_code("rules", game["rules"]))
+            columns["white"].append(white["username"])
+            columns["black"].append(black["username"])
+            columns["time_control"].append(game["time_control"])
+            columns["eco"].append(_eco(game.get("pgn", "")))
+            columns["eco_url"].append(game.get("eco"))
+            columns["url"].append(game["url"])
+            columns["player"].append(player)
+            columns["month"].append(month)
+
+    def __len__(self) -> int:
+        return len(self._columns["url"])
+
+    def to_numpy(self) -> np.ndarray:
+        """Export the games as a NumPy structured array.
+
+        Returns:
+            np.ndarray: Array of :data:`ARCHIVE_DTYPE` records.
+        """
+        array = np.empty(len(self), dtype=ARCHIVE_DTYPE)
+        for name, values in self._columns.items():
+            array[name] = values
+        return array
+
+    def to_arrow(self) -> "pyarrow.Table":  # noqa: F821
+        """Export the games as an Arrow table, with categorical columns dictionary-encoded.
+
+        Requires the optional ``pyarrow`` dependency (``pip install chesscom[arrow]``).
+
+        Returns:
+            pyarrow.Table: Table of games.
+        """
+        pa = _import_pyarrow()
+        arrays = {}
+        for name, values in self._columns.items():
+            if name in CATEGORIES:
+                codes = np.array(values, dtype=ARCHIVE_DTYPE[name])
+                arrays[name] = pa.DictionaryArray.from_arrays(
+                    pa.array(codes, mask=codes == UNKNOWN),
+                    pa.array(CATEGORIES[name], pa.string()),
+                )
+            elif ARCHIVE_DTYPE[name] == np.dtype("O"):
+                arrays[name] = pa.array(values, pa.string())
+            else:
+                codes = np.array(values, dtype=ARCHIVE_DTYPE[name])
+                arrays[name] = pa.array(codes)
+        return pa.table(arrays)
+
+    def write_parquet(self, root_path: str) -> None:
+        """Write the games as a Parquet dataset partitioned by player and month.
+
+        Requires the optional ``pyarrow`` dependency (``pip install chesscom[arrow]``).
+
+        Args:
+            root_path (str): Root directory of the dataset.
+        """
+        table = self.to_arrow()
+        import pyarrow.parquet as pq
+
+        pq.write_to_dataset(table, root_path, partition_cols=["player", "month"])
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "Arrow export requires pyarrow: pip install chesscom[arrow]"
+        ) from e
+    return pyarrow
@@ -1,9 +1,10 @@
-from typing import List
+from typing import Any, AsyncIterator, Dict, Iterator, List
 
 import pycountry
-import requests
 
 from ._country import CountryDetails
+from .client import get_async_client, get_client
+from .jsonstream import aiter_arrays, iter_arrays
 
 BASE_COUNTRY_URL = "https://api.chess.com/pub/country"
 
@@ -23,6 +24,23 @@ AVAILABLE_COUNTRIES = [
 ]
 
 
+def _details(response: Dict[str, Any]) -> CountryDetails:
+    response["id"] = response.pop("@id")
+    return CountryDetails(**response)
+
+
+def _iter_array(api_url: str, key: str) -> Iterator[Any]:
+    with get_client().stream(api_url) as body:
+        for _, item in iter_arrays(body, [key]):
+            yield item
+
+
+async def _aiter_array(api_url: str, key: str) -> AsyncIterator[Any]:
+    async with get_async_client().stream(api_url) as chunks:
+        async for _, item in aiter_arrays(chunks, [key]):
+            yield item
+
+
 class Country:
     """Country API wrapper."""
 
@@ -38,9 +56,7 @@ class Country:
         """
         assert len(country_alpha_2) == 2
         api_url = f"{BASE_COUNTRY_URL}/{country_alpha_2}"
-        response = requests.get(api_url).json()
-        response["id"] = response.pop("@id")
-        return CountryDetails(**response)
+        return get_client().get(api_url, _details)
 
     @staticmethod
     def players(country_alpha_2: str) -> List[str]:
@@ -56,8 +72,23 @@ class Country:
         """
         assert len(country_alpha_2) == 2
         api_url = f"{BASE_COUNTRY_URL}/{country_alpha_2}/players"
-        response = requests.get(api_url).json()
-        return response["players"]
+        return get_client().get(api_url, lambda response: response["players"])
+
+    @staticmethod
+    def iter_players(country_alpha_2: str) -> Iterator[str]:
+        """Iterate over players from country, parsing the response as it is downloaded.
+
+        Note: Endpoint refreshes at most every 12 hours.
+
+        Args:
+            country_alpha_2 (str): Country alpha-2 code.
+
+        Yields:
+            str: Player username.
+        """
+        assert len(country_alpha_2) == 2
+        api_url = f"{BASE_COUNTRY_URL}/{country_alpha_2}/players"
+        yield from _iter_array(api_url, "players")
 
     @staticmethod
     def clubs(country_alpha_2: str) -> List[str]:
@@ -73,5 +104,109 @@ class Country:
         """
         assert len(country_alpha_2) == 2
         api_url = f"{BASE_COUNTRY_URL}/{country_alpha_2}/clubs"
-        response = requests.get(api_url).json()
-        return response["clubs"]
+        return get_client().get(api_url, lambda response: response["clubs"])
+
+    @staticmethod
+    def iter_clubs(country_alpha_2: str) -> Iterator[str]:
+        """Iterate over clubs from country, parsing the response as it is downloaded.
+
+        Note: Endpoint refreshes at most every 12 hours.
+
+        Args:
+            country_alpha_2 (str): Country alpha-2 code.
+
+        Yields:
+            str: Club URL.
+        """
+        assert len(country_alpha_2) == 2
+        api_url = f"{BASE_COUNTRY_URL}/{country_alpha_2}/clubs"
+        yield from _iter_array(api_url, "clubs")
+
+
+class AsyncCountry:
+    """Asynchronous country API wrapper.
+
+    Mirrors :class:`Country`, returning the same models.
+    """
+
+    @staticmethod
+    async def details(country_alpha_2: str) -> CountryDetails:
+        """Get country details.
+
+        Args:
+            country_alpha_2 (str): Country alpha-2 code.
+
+        Returns:
+            CountryDetails: Country details class.
+        """
+        assert len(country_alpha_2) == 2
+        api_url = f"{BASE_COUNTRY_URL}/{country_alpha_2}"
+        return await get_async_client().get(api_url, _details)
+
+    @staticmethod
+    async def players(country_alpha_2: str) -> List[str]:
+        """Get list of players from country.
+
+        Note: Endpoint refreshes at most every 12 hours.
+
+        Args:
+            country_alpha_2 (str): Country alpha-2 code.
+
+        Returns:
+            List[str]: List of players from country.
+        """
+        assert len(country_alpha_2) == 2
+        api_url = f"{BASE_COUNTRY_URL}/{country_alpha_2}/players"
+        return await get_async_client().get(
+            api_url, lambda response: response["players"]
+        )
+
+    @staticmethod
+    async def iter_players(country_alpha_2: str) -> AsyncIterator[str]:
+        """Iterate over players from country, parsing the response as it is downloaded.
+
+        Note: Endpoint refreshes at most every 12 hours.
+
+        Args:
+            country_alpha_2 (str): Country alpha-2 code.
+
+        Yields:
+            str: Player username.
+        """
+        assert len(country_alpha_2) == 2
+        api_url = f"{BASE_COUNTRY_URL}/{country_alpha_2}/players"
+        async for item in _aiter_array(api_url, "players"):
+            yield item
+
+    @staticmethod
+    async def clubs(country_alpha_2: str) -> List[str]:
+        """Get list of clubs from country.
+
+        Note: Endpoint refreshes at most every 12 hours.
+
+        Args:
+            country_alpha_2 (str): Country alpha-2 code.
+
+        Returns:
+            List[str]: List of clubs from country.
+        """
+        assert len(country_alpha_2) == 2
+        api_url = f"{BASE_COUNTRY_URL}/{country_alpha_2}/clubs"
+        return await get_async_client().get(api_url, lambda response: response["clubs"])
+
+    @staticmethod
+    async def iter_clubs(country_alpha_2: str) -> AsyncIterator[str]:
+        """Iterate over clubs from country, parsing the response as it is downloaded.
+
+        Note: Endpoint refreshes at most every 12 hours.
+
+        Args:
+            country_alpha_2 (str): Country alpha-2 code.
+
+        Yields:
+            str: Club URL.
+        """
+        assert len(country_alpha_2) == 2
+        api_url = f"{BASE_COUNTRY_URL}/{country_alpha_2}/clubs"
+        async for item in _aiter_array(api_url, "clubs"):
+            yield item
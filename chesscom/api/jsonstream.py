@@ -0,0 +1,193 @@
+import codecs
+import io
+import json
+import re
+from typing import Any, AsyncIterator, BinaryIO, Iterable, Iterator, List, Tuple
+
+DEFAULT_CHUNK_SIZE = 64 * 2**10
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+_MORE = object()
+
+(
+    _START,
+    _FIRST_KEY,
+    _KEY,
+    _COLON,
+    _VALUE,
+    _FIRST_ITEM,
+    _ITEM,
+    _ITEM_END,
+    _VALUE_END,
+    _DONE,
+) = range(10)
+
+
+class ArrayParser:
+    """Incremental parser of the arrays of a JSON object.
+
+    Text is fed as it arrives and the items of the arrays stored under ``keys`` at the top level of the
+    object are returned as soon as they are complete, so that only the current item is held in memory.
+    Other values of the object are parsed and discarded.
+
+    Args:
+        keys (Iterable[str]): Keys of the arrays whose items are returned.
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        self.keys = set(keys)
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key = None
+
+    def feed(self, text: str, final: bool = False) -> List[Tuple[str, Any]]:
+        """Parse more text.
+
+        Args:
+            text (str): Next part of the JSON document.
+            final (bool): Whether this is the end of the document. Defaults to False.
+
+        Raises:
+            json.JSONDecodeError: If the document is not a valid JSON object, or is incomplete at the end.
+
+        Returns:
+            List[Tuple[str, Any]]: Key of the array and item, for each item completed by ``text``.
+        """
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        items = []
+        while self._step(items, final):
+            pass
+        if final and self._state != _DONE:
+            raise json.JSONDecodeError("Unexpected end of document", self._buffer, 0)
+        return items
+
+    def _decode(self, final: bool) -> Any:
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return _MORE
+        if not final and isinstance(value, (int, float)):
+            # The number may continue in the next text, e.g. "1.5e" followed by "3".
+            if end == len(self._buffer) or self._buffer[end] in _NUMBER_CHARS:
+                return _MORE
+        self._pos = end
+        return value
+
+    def _expect(self, char: str, chars: str) -> None:
+        if char not in chars:
+            raise json.JSONDecodeError(
+                f"Expecting one of {chars!r}", self._buffer, self._pos
+            )
+        self._pos += 1
+
+    def _step(self, items: List[Tuple[str, Any]], final: bool) -> bool:
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        if self._pos == len(self._buffer):
+            return False
+        char = self._buffer[self._pos]
+
+        if self._state == _START:
+            self._expect(char, "{")
+            self._state = _FIRST_KEY
+        elif self._state == _FIRST_KEY and char == "}":
+            self._pos += 1
+            self._state = _DONE
+        elif self._state in (_FIRST_KEY, _KEY):
+            if char != '"':
+                self._expect(char, '"')
+            key = self._decode(final)
+            if key is _MORE:
+                return False
+            self._key = key
+            self._state = _COLON
+        elif self._state == _COLON:
+            self._expect(char, ":")
+            self._state = _VALUE
+        elif self._state == _VALUE and self._key in self.keys:
+            self._expect(char, "[")
+            self._state = _FIRST_ITEM
+        elif self._state == _FIRST_ITEM and char == "]":
+            self._pos += 1
+            self._state = _VALUE_END
+        elif self._state == _VALUE:
+            if self._decode(final) is _MORE:
+                return False
+            self._state = _VALUE_END
+        elif self._state in (_FIRST_ITEM, _ITEM):
+            return self._items(items, final)
+        elif self._state == _ITEM_END:
+            self._expect(char, ",]")
+            self._state = _ITEM if char == "," else _VALUE_END
+        elif self._state == _VALUE_END:
+            self._expect(char, ",}")
+            self._state = _KEY if char == "," else _DONE
+        else:
+            raise json.JSONDecodeError("Extra data", self._buffer, self._pos)
+        return True
+
+    def _items(self, items: List[Tuple[str, Any]], final: bool) -> bool:
+        # Tight loop over the items of an array, the bulk of the documents parsed.
+        buffer, key = self._buffer, self._key
+        while True:
+            value = self._decode(final)
+            if value is _MORE:
+                return False
+            items.append((key, value))
+            pos = _WHITESPACE.match(buffer, self._pos).end()
+            if pos == len(buffer) or buffer[pos] != ",":
+                self._state = _ITEM_END
+                return True
+            self._pos = _WHITESPACE.match(buffer, pos + 1).end()
+            self._state = _ITEM
+            if self._pos == len(buffer):
+                return False
+
+
+def iter_arrays(
+    body: BinaryIO, keys: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[str, Any]]:
+    """Iterate over the items of arrays of a JSON object read from a binary file.
+
+    Args:
+        body (BinaryIO): JSON object, e.g. a response body opened with ``Client.stream``.
+        keys (Iterable[str]): Keys of the arrays whose items are yielded.
+        chunk_size (int): Number of characters read at a time. Defaults to 64 KiB.
+
+    Yields:
+        Tuple[str, Any]: Key of the array and item.
+    """
+    parser = ArrayParser(keys)
+    text = io.TextIOWrapper(body, encoding="utf-8")
+    while True:
+        chunk = text.read(chunk_size)
+        yield from parser.feed(chunk, final=not chunk)
+        if not chunk:
+            return
+
+
+async def aiter_arrays(
+    chunks: AsyncIterator[bytes], keys: Iterable[str]
+) -> AsyncIterator[Tuple[str, Any]]:
+    """Iterate over the items of arrays of a JSON object received in chunks.
+
+    Args:
+        chunks (AsyncIterator[bytes]): JSON object, e.g. a response body opened with
+            ``AsyncClient.stream``.
+        keys (Iterable[str]): Keys of the arrays whose items are yielded.
+
+    Yields:
+        Tuple[str, Any]: Key of the array and item.
+    """
+    parser = ArrayParser(keys)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    async for chunk in chunks:
+        for item in parser.feed(decoder.decode(chunk)):
+            yield item
+    for item in parser.feed(decoder.decode(b"", final=True), final=True):
+        yield item
@@ -1,10 +1,185 @@
-import requests
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
-from ._leaderboards import LeaderboardDetails
+from ._leaderboards import AVAILABLE_LEADERBOARDS, LeaderboardDetails
+from .client import get_async_client, get_client
 
 BASE_LEADERBOARD_URL = "https://api.chess.com/pub/leaderboards"
 
 
+class LeaderboardEntry(NamedTuple):
+    """Rank of a player on a leaderboard.
+
+    Args:
+        board (str): Leaderboard, one of ``AVAILABLE_LEADERBOARDS``.
+        username (str): Username.
+        player_id (str): Player ID.
+        rank (int): Leaderboard rank.
+        score (int): Score.
+    """
+
+    board: str
+    username: str
+    player_id: str
+    rank: int
+    score: int
+
+
+class LeaderboardChange(NamedTuple):
+    """Change of a player's entry on a leaderboard between two snapshots.
+
+    Args:
+        old (LeaderboardEntry, optional): Entry in the old snapshot, None if the player entered the board.
+        new (LeaderboardEntry, optional): Entry in the new snapshot, None if the player left the board.
+    """
+
+    old: Optional[LeaderboardEntry]
+    new: Optional[LeaderboardEntry]
+
+    @property
+    def rank_delta(self) -> Optional[int]:
+        """Number of places gained, negative if lost, or None if the player entered or left."""
+        if self.old is None or self.new is None:
+            return None
+        return self.old.rank - self.new.rank
+
+    @property
+    def score_delta(self) -> Optional[int]:
+        """Score gained, negative if lost, or None if the player entered or left."""
+        if self.old is None or self.new is None:
+            return None
+        return self.new.score - self.old.score
+
+
+class LeaderboardDiff(NamedTuple):
+    """Changes between two leaderboard snapshots.
+
+    Args:
+        entries (List[LeaderboardChange]): Players who entered a board.
+        exits (List[LeaderboardChange]): Players who left a board.
+        changes (List[LeaderboardChange]): Players whose rank or score changed on a board.
+    """
+
+    entries: List[LeaderboardChange]
+    exits: List[LeaderboardChange]
+    changes: List[LeaderboardChange]
+
+
+def _entries(response: Dict[str, Any]) -> Iterator[LeaderboardEntry]:
+    for board in AVAILABLE_LEADERBOARDS:
+        for x in response[board]:
+            yield LeaderboardEntry(
+                board, x["username"], str(x["player_id"]), x["rank"], x["score"]
+            )
+
+
+class LeaderboardIndex:
+    """Ranks of players on all leaderboards of a snapshot, by username and by player ID.
+
+    Args:
+        entries (Iterable[LeaderboardEntry]): Entries of all leaderboards.
+    """
+
+    def __init__(self, entries: Iterable[LeaderboardEntry]):
+        self._entries: Dict[Tuple[str, str], LeaderboardEntry] = {}
+        self._players: Dict[str, Dict[str, LeaderboardEntry]] = {}
+        self._ids: Dict[str, str] = {}
+        for entry in entries:
+            key = entry.username.lower()
+            self._entries[entry.board, key] = entry
+            self._players.setdefault(key, {})[entry.board] = entry
+            self._ids[entry.player_id] = key
+
+    @classmethod
+    def from_details(cls, details: LeaderboardDetails) -> "LeaderboardIndex":
+        """Index a leaderboards snapshot.
+
+        Args:
+            details (LeaderboardDetails): Leaderboards snapshot.
+
+        Returns:
+            LeaderboardIndex: Leaderboard index class.
+        """
+        return cls(
+            LeaderboardEntry(board, x.username, str(x.player_id), x.rank, x.score)
+            for board in AVAILABLE_LEADERBOARDS
+            for x in getattr(details, board)
+        )
+
+    def ranks(self, username: str) -> Dict[str, LeaderboardEntry]:
+        """Get the entries of a player on all leaderboards.
+
+        Args:
+            username (str): Username, in any case.
+
+        Returns:
+            Dict[str, LeaderboardEntry]: Entry per leaderboard the player is on.
+        """
+        return dict(self._players.get(username.lower(), {}))
+
+    def ranks_by_id(self, player_id: str) -> Dict[str, LeaderboardEntry]:
+        """Get the entries of a player on all leaderboards.
+
+        Args:
+            player_id (str): Player ID.
+
+        Returns:
+            Dict[str, LeaderboardEntry]: Entry per leaderboard the player is on.
+        """
+        username = self._ids.get(str(player_id))
+        return {} if username is None else self.ranks(username)
+
+    def entries(self) -> List[LeaderboardEntry]:
+        """Get all entries.
+
+        Returns:
+            List[LeaderboardEntry]: Entries of all leaderboards.
+        """
+        return list(self._entries.values())
+
+    def diff(self, new: "LeaderboardIndex") -> LeaderboardDiff:
+        """Compare with a newer snapshot.
+
+        Args:
+            new (LeaderboardIndex): Newer snapshot.
+
+        Returns:
+            LeaderboardDiff: Changes from this snapshot to ``new``.
+        """
+        entries, exits, changes = [], [], []
+        for key, entry in new._entries.items():
+            old = self._entries.get(key)
+            if old is None:
+                entries.append(LeaderboardChange(None, entry))
+            elif old.rank != entry.rank or old.score != entry.score:
+                changes.append(LeaderboardChange(old, entry))
+        for key, entry in self._entries.items():
+            if key not in new._entries:
+                exits.append(LeaderboardChange(entry, None))
+        return LeaderboardDiff(entries, exits, changes)
+
+    def apply(self, diff: LeaderboardDiff) -> "LeaderboardIndex":
+        """Rebuild the newer snapshot a diff was computed against.
+
+        Args:
+            diff (LeaderboardDiff): Changes from this snapshot.
+
+        Returns:
+            LeaderboardIndex: Newer snapshot.
+        """
+        entries = dict(self._entries)
+        for change in diff.exits:
+            del entries[change.old.board, change.old.username.lower()]
+        for change in diff.entries + diff.changes:
+            entries[change.new.board, change.new.username.lower()] = change.new
+        return LeaderboardIndex(entries.values())
+
+    def __contains__(self, username: str) -> bool:
+        return username.lower() in self._players
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+
 class Leaderboards:
     """Leaderboards API wrapper."""
 
@@ -17,5 +192,56 @@ class Leaderboards:
         Returns:
             LeaderboardDetails: Leaderboard details class.
         """
-        response = requests.get(BASE_LEADERBOARD_URL).json()
-        return LeaderboardDetails(**response)
+        return get_client().get(
+            BASE_LEADERBOARD_URL, lambda response: LeaderboardDetails(**response)
+        )
+
+    @staticmethod
+    def index() -> LeaderboardIndex:
+        """Get an index of the ranks of players on all leaderboards.
+
+        The index is built from the response without building ``LeaderboardDetails``.
+
+        Note: Endpoint refreshes when one of the leaderboards is updated.
+
+        Returns:
+            LeaderboardIndex: Leaderboard index class.
+        """
+        return get_client().get(
+            BASE_LEADERBOARD_URL, lambda response: LeaderboardIndex(_entries(response))
+        )
+
+
+class AsyncLeaderboards:
+    """Asynchronous leaderboards API wrapper.
+
+    Mirrors :class:`Leaderboards`, returning the same models.
+    """
+
+    @staticmethod
+    async def get_all() -> LeaderboardDetails:
+        """Get leaderboards information for all game modes.
+
+        Note: Endpoint refreshes when one of the leaderboards is updated.
+
+        Returns:
+            LeaderboardDetails: Leaderboard details class.
+        """
+        return await get_async_client().get(
+            BASE_LEADERBOARD_URL, lambda response: LeaderboardDetails(**response)
+        )
+
+    @staticmethod
+    async def index() -> LeaderboardIndex:
+        """Get an index of the ranks of players on all leaderboards.
+
+        The index is built from the response without building ``LeaderboardDetails``.
+
+        Note: Endpoint refreshes when one of the leaderboards is updated.
+
+        Returns:
+            LeaderboardIndex: Leaderboard index class.
+        """
+        return await get_async_client().get(
+            BASE_LEADERBOARD_URL, lambda response: LeaderboardIndex(_entries(response))
+        )
@@ -1,8 +1,159 @@
-import requests
+import asyncio
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
-from ._match import LiveMatchDetails, MatchBoardDetails, MatchDetails, MatchResults
+from ._concurrency import prefetch
+from ._match import (
+    LiveMatchDetails,
+    MatchBoardDetails,
+    MatchBoardGame,
+    MatchDetails,
+    MatchResults,
+)
+from .client import get_async_client, get_client
 
 BASE_MATCH_URL = "https://api.chess.com/pub/match"
+DEFAULT_BOARD_WORKERS = 8
+DRAW_RESULTS = {
+    "agreed",
+    "repetition",
+    "stalemate",
+    "insufficient",
+    "50move",
+    "timevsinsufficient",
+}
+
+
+def _daily_match(response: Dict[str, Any]) -> MatchDetails:
+    return MatchDetails(**response)
+
+
+def _live_match(response: Dict[str, Any]) -> LiveMatchDetails:
+    response["id"] = response.pop("@id")
+    return LiveMatchDetails(**response)
+
+
+def _board(response: Dict[str, Any]) -> MatchBoardDetails:
+    return MatchBoardDetails(**response)
+
+
+class MatchBoard(NamedTuple):
+    """Board of a match.
+
+    Args:
+        number (int): Board number, from 1.
+        details (MatchBoardDetails): Scores and games of the board.
+    """
+
+    number: int
+    details: MatchBoardDetails
+
+
+class TeamAggregate(NamedTuple):
+    """Totals of a team over the games of all boards of a match.
+
+    Args:
+        id (str): API URL of the club.
+        name (str): Club name.
+        score (float): Points from finished games, one per win and half per draw.
+        wins (int): Number of games won.
+        draws (int): Number of games drawn.
+        losses (int): Number of games lost.
+        in_progress (int): Number of games not finished.
+        average_rating (float, optional): Average rating of the team's players over all games.
+    """
+
+    id: str
+    name: str
+    score: float
+    wins: int
+    draws: int
+    losses: int
+    in_progress: int
+    average_rating: Optional[float]
+
+
+class MatchTree(NamedTuple):
+    """Match with all its boards.
+
+    Args:
+        details (Union[MatchDetails, LiveMatchDetails]): Match details.
+        boards (List[MatchBoard]): Boards, by board number.
+        teams (Tuple[TeamAggregate, TeamAggregate]): Totals of team 1 and team 2.
+    """
+
+    details: Union[MatchDetails, LiveMatchDetails]
+    boards: List[MatchBoard]
+    teams: Tuple[TeamAggregate, TeamAggregate]
+
+    def games(self) -> List[MatchBoardGame]:
+        """Games of all boards.
+
+        Returns:
+            List[MatchBoardGame]: Games, board by board.
+        """
+        return [game for board in self.boards for game in board.details.games]
+
+
+def _match_tree(
+    details: Union[MatchDetails, LiveMatchDetails], boards: List[MatchBoardDetails]
+) -> MatchTree:
+    teams = (details.teams.team1, details.teams.team2)
+    team_ids = {team.id: i for i, team in enumerate(teams)}
+    members = {
+        player.username.lower(): i
+        for i, team in enumerate(teams)
+        for player in team.players
+    }
+
+    # Columns: score, wins, draws, losses, in progress, rating total, rated games.
+    totals = [[0.0, 0, 0, 0, 0, 0, 0] for _ in teams]
+    for board in boards:
+        for game in board.games:
+            for player in (game.white, game.black):
+                i = team_ids.get(player.team, members.get(player.username.lower()))
+                if i is None:
+                    continue
+                total = totals[i]
+                if player.result is None:
+                    total[4] += 1
+                elif player.result == "win":
+                    total[0] += 1
+                    total[1] += 1
+                elif player.result in DRAW_RESULTS:
+                    total[0] += 0.5
+                    total[2] += 1
+                else:
+                    total[3] += 1
+                total[5] += player.rating
+                total[6] += 1
+
+    aggregates = tuple(
+        TeamAggregate(
+            team.id,
+            team.name,
+            *total[:5],
+            total[5] / total[6] if total[6] else None,
+        )
+        for team, total in zip(teams, totals)
+    )
+    return MatchTree(
+        details,
+        [MatchBoard(i + 1, board) for i, board in enumerate(boards)],
+        aggregates,
+    )
+
+
+async def _gather_boards(
+    api_urls: List[str], max_concurrency: int
+) -> List[MatchBoardDetails]:
+    client = get_async_client()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(url: str) -> MatchBoardDetails:
+        async with semaphore:
+            return await client.get(url, _board)
+
+    return await asyncio.gather(*(fetch(url) for url in api_urls))
 
 
 class Match:
@@ -19,8 +170,7 @@ class Match:
             MatchDetails: Match details class.
         """
         api_url = f"{BASE_MATCH_URL}/{match_id}"
-        response = requests.get(api_url).json()
-        return MatchDetails(**response)
+        return get_client().get(api_url, _daily_match)
 
     @staticmethod
     def team_match_board(match_id: str, board: int) -> MatchBoardDetails:
@@ -34,8 +184,31 @@ class Match:
             MatchBoardDetails: Match board details class.
         """
         api_url = f"{BASE_MATCH_URL}/{match_id}/{board}"
-        response = requests.get(api_url).json()
-        return MatchBoardDetails(**response)
+        return get_client().get(api_url, _board)
+
+    @staticmethod
+    def daily_team_match_boards(
+        match_id: str, max_workers: int = DEFAULT_BOARD_WORKERS
+    ) -> MatchTree:
+        """Get a daily team match with all its boards.
+
+        Boards are fetched concurrently once the match is fetched, and team totals are computed from
+        their games.
+
+        Args:
+            match_id (str): Match ID.
+            max_workers (int): Number of boards fetched concurrently. Defaults to 8.
+
+        Returns:
+            MatchTree: Match tree class.
+        """
+        details = Match.daily_team_matches(match_id)
+        api_urls = [
+            f"{BASE_MATCH_URL}/{match_id}/{i + 1}" for i in range(details.boards)
+        ]
+        client = get_client()
+        boards = prefetch(api_urls, lambda url: client.get(url, _board), max_workers)
+        return _match_tree(details, list(boards))
 
     @staticmethod
     def live_match(live_match_id: str) -> LiveMatchDetails:
@@ -48,9 +221,7 @@ class Match:
             LiveMatchDetails: Live match details class.
         """
         api_url = f"{BASE_MATCH_URL}/live/{live_match_id}"
-        response = requests.get(api_url).json()
-        response["id"] = response.pop("@id")
-        return LiveMatchDetails(**response)
+        return get_client().get(api_url, _live_match)
 
     @staticmethod
     def live_match_board(live_match_id: str, board: int) -> MatchBoardDetails:
@@ -64,5 +235,135 @@ class Match:
             MatchBoardDetails: Match board details.
         """
         api_url = f"{BASE_MATCH_URL}/live/{live_match_id}/{board}"
-        response = requests.get(api_url).json()
-        return MatchBoardDetails(**response)
+        return get_client().get(api_url, _board)
+
+    @staticmethod
+    def live_match_boards(
+        live_match_id: str, max_workers: int = DEFAULT_BOARD_WORKERS
+    ) -> MatchTree:
+        """Get a live match with all its boards.
+
+        Boards are fetched concurrently once the match is fetched, and team totals are computed from
+        their games.
+
+        Args:
+            live_match_id (str): Live match ID.
+            max_workers (int): Number of boards fetched concurrently. Defaults to 8.
+
+        Returns:
+            MatchTree: Match tree class.
+        """
+        details = Match.live_match(live_match_id)
+        api_urls = [
+            f"{BASE_MATCH_URL}/live/{live_match_id}/{i + 1}"
+            for i in range(details.boards)
+        ]
+        client = get_client()
+        boards = prefetch(api_urls, lambda url: client.get(url, _board), max_workers)
+        return _match_tree(details, list(boards))
+
+
+class AsyncMatch:
+    """Asynchronous match API wrapper.
+
+    Mirrors :class:`Match`, returning the same models.
+    """
+
+    @staticmethod
+    async def daily_team_matches(match_id: str) -> MatchDetails:
+        """Get daily team matches.
+
+        Args:
+            match_id (str): Match ID.
+
+        Returns:
+            MatchDetails: Match details class.
+        """
+        api_url = f"{BASE_MATCH_URL}/{match_id}"
+        return await get_async_client().get(api_url, _daily_match)
+
+    @staticmethod
+    async def team_match_board(match_id: str, board: int) -> MatchBoardDetails:
+        """Get team match board.
+
+        Args:
+            match_id (str): Match ID.
+            board (int): Board number.
+
+        Returns:
+            MatchBoardDetails: Match board details class.
+        """
+        api_url = f"{BASE_MATCH_URL}/{match_id}/{board}"
+        return await get_async_client().get(api_url, _board)
+
+    @staticmethod
+    async def daily_team_match_boards(
+        match_id: str, max_concurrency: int = DEFAULT_BOARD_WORKERS
+    ) -> MatchTree:
+        """Get a daily team match with all its boards.
+
+        Boards are fetched concurrently once the match is fetched, and team totals are computed from
+        their games.
+
+        Args:
+            match_id (str): Match ID.
+            max_concurrency (int): Number of boards fetched concurrently. Defaults to 8.
+
+        Returns:
+            MatchTree: Match tree class.
+        """
+        details = await AsyncMatch.daily_team_matches(match_id)
+        api_urls = [
+            f"{BASE_MATCH_URL}/{match_id}/{i + 1}" for i in range(details.boards)
+        ]
+        return _match_tree(details, await _gather_boards(api_urls, max_concurrency))
+
+    @staticmethod
+    async def live_match(live_match_id: str) -> LiveMatchDetails:
+        """Get live match details.
+
+        Args:
+            live_match_id (str): Live match ID.
+
+        Returns:
+            LiveMatchDetails: Live match details class.
+        """
+        api_url = f"{BASE_MATCH_URL}/live/{live_match_id}"
+        return await get_async_client().get(api_url, _live_match)
+
+    @staticmethod
+    async def live_match_board(live_match_id: str, board: int) -> MatchBoardDetails:
+        """Get live match board.
+
+        Args:
+            live_match_id (str): Live match ID.
+            board (int): Board number.
+
+        Returns:
+            MatchBoardDetails: Match board details.
+        """
+        api_url = f"{BASE_MATCH_URL}/live/{live_match_id}/{board}"
+        return await get_async_client().get(api_url, _board)
+
+    @staticmethod
+    async def live_match_boards(
+        live_match_id: str, max_concurrency: int = DEFAULT_BOARD_WORKERS
+    ) -> MatchTree:
+        """Get a live match with all its boards.
+
+        Boards are fetched concurrently once the match is fetched, and team totals are computed from
+        their games.
+
+        Args:
+            live_match_id (str): Live match ID.
+            max_concurrency (int): Number of boards fetched concurrently. Defaults to 8.
+
+        Returns:
+            MatchTree: Match tree class.
+        """
+        details = await AsyncMatch.live_match(live_match_id)
+        api_urls = [
+            f"{BASE_MATCH_URL}/live/{live_match_id}/{i + 1}"
+            for i in range(details.boards)
+        ]
+        return _match_tree(details, await _gather_boards(api_urls, max_concurrency))
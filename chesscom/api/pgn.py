@@ -0,0 +1,200 @@
+import io
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Union
+
+import chess
+import chess.pgn
+
+TAG_REGEX = re.compile(r'^\[([A-Za-z0-9_+#=:-]+)\s+"(.*)"\]\s*$')
+
+DEFAULT_BATCH_SIZE = 64
+
+
+class PGNHeaders(dict):
+    """Tags of a PGN game, read without parsing its moves.
+
+    Behaves as a ``dict`` of tag names to values, e.g. ``headers["White"]``. The move text is kept as a
+    raw string and only parsed when ``game`` is called.
+
+    Args:
+        movetext (str): Move text of the game.
+    """
+
+    __slots__ = ("movetext",)
+
+    def __init__(self, movetext: str = ""):
+        super().__init__()
+        self.movetext = movetext
+
+    def game(self) -> chess.pgn.Game:
+        """Parse the full game, including its moves.
+
+        Returns:
+            chess.pgn.Game: Loaded PGN game.
+        """
+        tags = "".join(f'[{name} "{value}"]\n' for name, value in self.items())
+        return chess.pgn.read_game(io.StringIO(f"{tags}\n{self.movetext}"))
+
+
+def _finish(headers: PGNHeaders, movetext: List[str]) -> PGNHeaders:
+    headers.movetext = "".join(movetext)
+    return headers
+
+
+def iter_headers(pgn_file: TextIO) -> Iterator[PGNHeaders]:
+    """Iterate over the tags of the games of a PGN file without parsing their moves.
+
+    Tag pairs are matched line by line, which is many times faster than ``chess.pgn.read_game`` as no
+    board is set up and no move is replayed.
+
+    Args:
+        pgn_file (TextIO): PGN file.
+
+    Yields:
+        PGNHeaders: Tags and raw move text of a game.
+    """
+    headers: Optional[PGNHeaders] = None
+    movetext: List[str] = []
+
+    for line in pgn_file:
+        match = TAG_REGEX.match(line) if line.startswith("[") else None
+        if match is not None:
+            if movetext:  # Tag pair after move text: start of the next game
+                yield _finish(headers, movetext)
+                headers, movetext = None, []
+            if headers is None:
+                headers = PGNHeaders()
+            name, value = match.groups()
+            headers[name] = value
+        elif line.strip() and not line.startswith("%"):
+            if headers is None:  # Game without tags
+                headers = PGNHeaders()
+            movetext.append(line)
+
+    if headers is not None:
+        yield _finish(headers, movetext)
+
+
+def read_headers(content: str) -> List[PGNHeaders]:
+    """Read the tags of all games of a PGN string without parsing their moves.
+
+    Args:
+        content (str): PGN text.
+
+    Returns:
+        List[PGNHeaders]: Tags and raw move text of each game.
+    """
+    return list(iter_headers(io.StringIO(content)))
+
+
+class CompactGame(NamedTuple):
+    """Main line of a game extracted from PGN, cheap to pickle and to rebuild.
+
+    Args:
+        headers (Dict[str, str]): Tags of the game.
+        moves (List[str]): Main line moves in UCI notation.
+        comments (List[str]): Comment of each main line move, e.g. its clock.
+    """
+
+    headers: Dict[str, str]
+    moves: List[str]
+    comments: List[str]
+
+    def game(self) -> chess.pgn.Game:
+        """Rebuild the game without parsing PGN again.
+
+        Returns:
+            chess.pgn.Game: Loaded PGN game.
+        """
+        game = chess.pgn.Game(self.headers)
+        node = game
+        for move, comment in zip(self.moves, self.comments):
+            node = node.add_variation(chess.Move.from_uci(move), comment=comment)
+        return game
+
+
+def _compact(game: chess.pgn.Game) -> CompactGame:
+    moves, comments = [], []
+    for node in game.mainline():
+        moves.append(node.move.uci())
+        comments.append(node.comment)
+    return CompactGame(dict(game.headers), moves, comments)
+
+
+def _parse_batch(games: List[str]) -> List[CompactGame]:
+    return [_compact(chess.pgn.read_game(io.StringIO(game))) for game in games]
+
+
+def split_games(content: str) -> List[str]:
+    """Split a PGN string into the PGN of each of its games, without parsing them.
+
+    Args:
+        content (str): PGN text, e.g. a monthly archive or ``MonthlyArchive.pgn``.
+
+    Returns:
+        List[str]: PGN text of each game.
+    """
+    games = []
+    lines: List[str] = []
+    in_movetext = False
+
+    for line in content.splitlines(keepends=True):
+        if line.startswith("[") and TAG_REGEX.match(line):
+            if in_movetext:  # Tag pair after move text: start of the next game
+                games.append("".join(lines))
+                lines, in_movetext = [], False
+        elif line.strip() and not line.startswith("%"):
+            in_movetext = True
+        lines.append(line)
+
+    if in_movetext or any(line.strip() for line in lines):
+        games.append("".join(lines))
+    return games
+
+
+def parse_games(
+    contents: Iterable[str],
+    max_workers: Optional[int] = None,
+    compact: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Union[chess.pgn.Game, CompactGame]]:
+    """Parse PGN games across a pool of processes.
+
+    Each PGN string is split into games, which are parsed in batches by worker processes while
+    ``contents`` keeps being consumed, so downloads can proceed while earlier games are parsed. Games
+    are yielded in input order and at most a few batches per worker are pending at any time.
+
+    Workers send back the main line of each game as a :class:`CompactGame`, since deep
+    ``chess.pgn.Game`` trees cannot be pickled; ``chess.pgn.Game`` objects are rebuilt from it without
+    parsing the PGN again. Variations and annotations other than main line comments are not kept.
+    Rebuilding takes about a sixth of the time of parsing, in the calling process; use ``compact`` for
+    parsing to scale with the number of workers.
+
+    Args:
+        contents (Iterable[str]): PGN texts, e.g. monthly archives or ``MonthlyArchive.pgn`` strings.
+        max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        compact (bool): Yield :class:`CompactGame` instead of ``chess.pgn.Game``. Defaults to False.
+        batch_size (int): Number of games parsed per task. Defaults to 64.
+
+    Yields:
+        Union[chess.pgn.Game, CompactGame]: Loaded PGN game.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    pending = deque()
+
+    def results():
+        for game in pending.popleft().result():
+            yield game if compact else game.game()
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        for content in contents:
+            games = split_games(content)
+            for i in range(0, len(games), batch_size):
+                pending.append(executor.submit(_parse_batch, games[i : i + batch_size]))
+                while len(pending) > 2 * max_workers:
+                    yield from results()
+        while pending:
+            yield from results()
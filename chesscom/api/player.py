@@ -1,9 +1,25 @@
+import asyncio
+import datetime
 import io
-from typing import List, Union
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TextIO,
+    Union,
+)
 
 import chess.pgn
-import requests
 
+from ._concurrency import prefetch, submit
 from ._player import (
     ChessModeRatings,
     ChessModeStats,
@@ -15,8 +31,168 @@ from ._player import (
     PlayerTournaments,
     ToMoveDailyChess,
 )
+from ._records import GameRecord
+from .client import get_async_client, get_client
+from .columns import ArchiveColumns
+from .pgn import CompactGame, PGNHeaders, iter_headers, parse_games
 
+PGNGame = Union[chess.pgn.Game, PGNHeaders]
 BASE_PLAYER_URL = "https://api.chess.com/pub/player"
+DEFAULT_DOWNLOAD_WORKERS = 4
+DEFAULT_BULK_WORKERS = 8
+DEFAULT_BULK_CONCURRENCY = 32
+BULK_ENDPOINTS = (
+    "profile",
+    "clubs",
+    "tournaments",
+    "matches",
+    "online_status",
+    "stats",
+    "current_daily_chess_games",
+    "to_move_daily_chess_games",
+    "monthly_archive_urls",
+)
+DEFAULT_BULK_ENDPOINTS = ("profile", "stats", "online_status", "clubs")
+
+
+def _archive_url(username: str, year: Union[int, str], month: Union[int, str]) -> str:
+    if isinstance(year, (int, float)):
+        year = str(int(year))
+
+    assert 1 <= int(month) <= 12
+
+    if isinstance(month, (int, float)):
+        month = str(int(month))
+
+    if len(month) == 1:
+        month = "0" + month
+
+    return f"{BASE_PLAYER_URL}/{username}/games/{year}/{month}"
+
+
+def _archive_range(
+    urls: List[str],
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+) -> List[str]:
+    months = []
+    for url in urls:
+        year, month = url.rstrip("/").split("/")[-2:]
+        months.append(((int(year), int(month)), url))
+
+    first = (0, 0) if start is None else (start.year, start.month)
+    last = (9999, 12) if end is None else (end.year, end.month)
+    return [url for month, url in sorted(months) if first <= month <= last]
+
+
+def _profile(response: Dict[str, Any]) -> PlayerProfile:
+    response["id"] = response.pop("@id")
+    return PlayerProfile(**response)
+
+
+def _clubs(response: Dict[str, Any]) -> List[ClubDetails]:
+    clubs = []
+    for club in response["clubs"]:
+        club["id"] = club.pop("@id")
+        clubs.append(ClubDetails(**club))
+    return clubs
+
+
+def _stats(
+    response: Dict[str, Any],
+) -> Dict[str, Union[ChessModeStats, ChessModeRatings]]:
+    for mode in response:
+        if "chess" in mode:
+            response[mode] = ChessModeStats(**response[mode])
+        elif mode in ("tactics", "lessons", "puzzle_rush"):
+            response[mode] = ChessModeRatings(**response[mode])
+    return response
+
+
+def _iter_pgns(pgn_file: TextIO, headers_only: bool = False) -> Iterator[PGNGame]:
+    if headers_only:
+        yield from iter_headers(pgn_file)
+        return
+    while True:
+        game = chess.pgn.read_game(pgn_file)
+        if game is None:  # End of file
+            break
+        yield game
+
+
+def _current_daily_chess(response: Dict[str, Any]) -> List[CurrentDailyChess]:
+    return [CurrentDailyChess(**x) for x in response["games"]]
+
+
+def _monthly_archive(response: Dict[str, Any]) -> List[MonthlyArchive]:
+    return [MonthlyArchive(**x) for x in response["games"]]
+
+
+def _monthly_records(response: Dict[str, Any]) -> List[GameRecord]:
+    return [GameRecord.from_response(x) for x in response["games"]]
+
+
+def _archive_games(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return response["games"]
+
+
+def _archive_month(url: str) -> str:
+    return "-".join(url.rstrip("/").split("/")[-2:])
+
+
+def _pgns(content: bytes, headers_only: bool = False) -> List[PGNGame]:
+    # Decode lazily from a view of the body rather than copying it into a string.
+    pgn_file = io.TextIOWrapper(io.BytesIO(content), encoding="utf-8")
+    return list(_iter_pgns(pgn_file, headers_only))
+
+
+class PlayerResult(NamedTuple):
+    """Endpoints of a player fetched in bulk.
+
+    Args:
+        username (str): Username.
+        values (Dict[str, Any]): Value returned by each endpoint that succeeded, keyed by method name,
+            e.g. ``values["profile"]``.
+        errors (Dict[str, Exception]): Exception raised by each endpoint that failed, e.g. an HTTP 404
+            for a closed account.
+    """
+
+    username: str
+    values: Dict[str, Any]
+    errors: Dict[str, Exception]
+
+
+class _BulkResults:
+    """Results of the endpoints of players being fetched, completed as their futures finish."""
+
+    def __init__(self, endpoints: Sequence[str]):
+        for endpoint in endpoints:
+            assert endpoint in BULK_ENDPOINTS, f"Unsupported endpoint: {endpoint}"
+        self.endpoints = endpoints
+        self._results: Dict[int, PlayerResult] = {}
+        self._remaining: Dict[int, int] = {}
+        self._count = 0
+
+    def add(self, username: str) -> int:
+        key = self._count
+        self._count += 1
+        self._results[key] = PlayerResult(username, {}, {})
+        self._remaining[key] = len(self.endpoints)
+        return key
+
+    def complete(
+        self, key: int, endpoint: str, future: Union[Future, asyncio.Future]
+    ) -> Optional[PlayerResult]:
+        result = self._results[key]
+        try:
+            result.values[endpoint] = future.result()
+        except Exception as e:
+            result.errors[endpoint] = e
+        self._remaining[key] -= 1
+        if self._remaining[key] > 0:
+            return None
+        del self._remaining[key]
+        return self._results.pop(key)
 
 
 class Player:
@@ -33,9 +209,7 @@ class Player:
             PlayerProfile: Player profile class.
         """
         api_url = f"{BASE_PLAYER_URL}/{username}"
-        response = requests.get(api_url).json()
-        response["id"] = response.pop("@id")
-        return PlayerProfile(**response)
+        return get_client().get(api_url, _profile)
 
     @staticmethod
     def clubs(username: str) -> List[ClubDetails]:
@@ -48,13 +222,7 @@ class Player:
             List[ClubDetails]: List of club details class.
         """
         api_url = f"{BASE_PLAYER_URL}/{username}/clubs"
-        response = requests.get(api_url).json()
-
-        clubs = []
-        for club in response["clubs"]:
-            club["id"] = club.pop("@id")
-            clubs.append(ClubDetails(**club))
-        return clubs
+        return get_client().get(api_url, _clubs)
 
     @staticmethod
     def tournaments(username: str) -> PlayerTournaments:
@@ -67,8 +235,7 @@ class Player:
             PlayerTournaments: Player tournaments class.
         """
         api_url = f"{BASE_PLAYER_URL}/{username}/tournaments"
-        response = requests.get(api_url).json()
-        return PlayerTournaments(**response)
+        return get_client().get(api_url, lambda response: PlayerTournaments(**response))
 
     @staticmethod
     def matches(username: str) -> PlayerMatches:
@@ -81,8 +248,7 @@ class Player:
             PlayerMatches: Player matches class.
         """
         api_url = f"{BASE_PLAYER_URL}/{username}/matches"
-        response = requests.get(api_url).json()
-        return PlayerMatches(**response)
+        return get_client().get(api_url, lambda response: PlayerMatches(**response))
 
     @staticmethod
     def online_status(username: str) -> bool:
@@ -95,8 +261,7 @@ class Player:
             bool: Whether player is online.
         """
         api_url = f"{BASE_PLAYER_URL}/{username}/is-online"
-        response = requests.get(api_url).json()
-        return response["online"]
+        return get_client().get(api_url, lambda response: response["online"])
 
     @staticmethod
     def stats(username: str) -> List[Union[ChessModeStats, ChessModeRatings]]:
@@ -109,13 +274,7 @@ class Player:
             List[Union[ChessModeStats, ChessModeRatings]]: List of player stats for game modes.
         """
         api_url = f"{BASE_PLAYER_URL}/{username}/stats"
-        response = requests.get(api_url).json()
-        for mode in response:
-            if "chess" in mode:
-                response[mode] = ChessModeStats(**response[mode])
-            elif mode in ("tactics", "lessons", "puzzle_rush"):
-                response[mode] = ChessModeRatings(**response[mode])
-        return response
+        return get_client().get(api_url, _stats)
 
     @staticmethod
     def current_daily_chess_games(username: str) -> List[CurrentDailyChess]:
@@ -128,8 +287,7 @@ class Player:
             List[CurrentDailyChess]: List of current daily chess class.
         """
         api_url = f"{BASE_PLAYER_URL}/{username}/games"
-        response = requests.get(api_url).json()
-        return [CurrentDailyChess(**x) for x in response["games"]]
+        return get_client().get(api_url, _current_daily_chess)
 
     @staticmethod
     def to_move_daily_chess_games(username: str) -> List[CurrentDailyChess]:
@@ -142,8 +300,9 @@ class Player:
             List[CurrentDailyChess]: List of current daily chess class (one per game).
         """
         api_url = f"{BASE_PLAYER_URL}/{username}/games/to-move"
-        response = requests.get(api_url).json()
-        return [ToMoveDailyChess(**x) for x in response["games"]]
+        return get_client().get(
+            api_url, lambda response: [ToMoveDailyChess(**x) for x in response["games"]]
+        )
 
     @staticmethod
     def monthly_archive_urls(username: str) -> List[str]:
@@ -156,8 +315,55 @@ class Player:
             List[str]: List of URLs of monthly archives for player games.
         """
         api_url = f"{BASE_PLAYER_URL}/{username}/games/archives"
-        response = requests.get(api_url).json()
-        return response["archives"]
+        return get_client().get(api_url, lambda response: response["archives"])
+
+    @staticmethod
+    def bulk(
+        usernames: Iterable[str],
+        endpoints: Sequence[str] = DEFAULT_BULK_ENDPOINTS,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> Iterator[PlayerResult]:
+        """Fetch endpoints of many players concurrently.
+
+        Every endpoint of every player is fetched as a separate request, up to ``max_workers`` at a
+        time. ``usernames`` is consumed as requests complete, so it can be a lazy iterator, e.g.
+        ``Country.iter_players``. An endpoint that fails is reported in the player's result without
+        stopping the others. Requests still go through the client's rate limiter and connection pool,
+        which may need to be enlarged for many workers.
+
+        Args:
+            usernames (Iterable[str]): Usernames.
+            endpoints (Sequence[str]): Names of the ``Player`` methods fetched for each player, among
+                ``BULK_ENDPOINTS``. Defaults to "profile", "stats", "online_status" and "clubs".
+            max_workers (int): Number of requests sent concurrently. Defaults to 8.
+
+        Yields:
+            PlayerResult: Results of a player, as soon as all its endpoints are fetched.
+        """
+        results = _BulkResults(endpoints)
+        usernames = iter(usernames)
+        pending = {}
+        with ThreadPoolExecutor(max_workers) as executor:
+            try:
+                while True:
+                    for username in usernames:
+                        key = results.add(username)
+                        for endpoint in endpoints:
+                            fetch = getattr(Player, endpoint)
+                            future = submit(executor, fetch, username)
+                            pending[future] = key, endpoint
+                        if len(pending) >= 2 * max_workers:
+                            break
+                    if not pending:
+                        return
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = results.complete(*pending.pop(future), future)
+                        if result is not None:
+                            yield result
+            finally:
+                for future in pending:
+                    future.cancel()
 
     @staticmethod
     def monthly_archive(
@@ -165,6 +371,9 @@ class Player:
     ) -> List[MonthlyArchive]:
         """Get list of games from monthly archive URL of player.
 
+        Each game's ``pgn`` is also available parsed as ``MonthlyArchive.game``, so the games and their
+        moves are loaded from a single request, unlike with ``monthly_pgns``.
+
         Args:
             username (str): Username.
             year (Union[int, str]): Year.
@@ -173,55 +382,500 @@ class Player:
         Returns:
             List[MonthlyArchive]: List of games.
         """
-        if isinstance(year, (int, float)):
-            year = str(int(year))
+        api_url = _archive_url(username, year, month)
+        return get_client().get(api_url, _monthly_archive)
 
-        assert 1 <= int(month) <= 12
+    @staticmethod
+    def monthly_records(
+        username: str, year: Union[int, str], month: Union[int, str]
+    ) -> List[GameRecord]:
+        """Get list of games from monthly archive URL of player as compact records.
+
+        Records take a fraction of the memory of ``MonthlyArchive`` models and are built without
+        validation; convert them with ``GameRecord.to_model`` when needed.
+
+        Args:
+            username (str): Username.
+            year (Union[int, str]): Year.
+            month (Union[int, str]): Month.
 
-        if isinstance(month, (int, float)):
-            month = str(int(month))
+        Returns:
+            List[GameRecord]: List of game records.
+        """
+        api_url = _archive_url(username, year, month)
+        return get_client().get(api_url, _monthly_records)
 
-        if len(month) == 1:
-            month = "0" + month
+    @staticmethod
+    def archives(
+        username: str,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    ) -> Iterator[MonthlyArchive]:
+        """Iterate over the games of a player's monthly archives within a range of months.
+
+        Only the archives of months from ``start`` to ``end`` (inclusive) are downloaded, up to
+        ``max_workers`` at a time. Games are yielded in chronological order of their archives, as soon
+        as each archive and all earlier ones are downloaded.
 
-        api_url = f"{BASE_PLAYER_URL}/{username}/games/{year}/{month}"
-        response = requests.get(api_url).json()
+        Args:
+            username (str): Username.
+            start (datetime.date, optional): Date in the first month. Defaults to the first archive.
+            end (datetime.date, optional): Date in the last month. Defaults to the last archive.
+            max_workers (int): Number of archives downloaded concurrently. Defaults to 4.
 
-        return [MonthlyArchive(**x) for x in response["games"]]
+        Yields:
+            MonthlyArchive: Archived game.
+        """
+        urls = _archive_range(Player.monthly_archive_urls(username), start, end)
+        client = get_client()
+        for games in prefetch(
+            urls, lambda url: client.get(url, _monthly_archive), max_workers
+        ):
+            yield from games
+
+    @staticmethod
+    def archive_columns(
+        username: str,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    ) -> ArchiveColumns:
+        """Get the games of a player's monthly archives within a range of months as columns.
+
+        Games are appended to the columns straight from the JSON responses, without building
+        ``MonthlyArchive`` models. Archives are downloaded as in :meth:`archives`.
+
+        Args:
+            username (str): Username.
+            start (datetime.date, optional): Date in the first month. Defaults to the first archive.
+            end (datetime.date, optional): Date in the last month. Defaults to the last archive.
+            max_workers (int): Number of archives downloaded concurrently. Defaults to 4.
+
+        Returns:
+            ArchiveColumns: Columns of the games, partitioned by player and month.
+        """
+        urls = _archive_range(Player.monthly_archive_urls(username), start, end)
+        client = get_client()
+        columns = ArchiveColumns()
+        games = prefetch(urls, lambda url: client.get(url, _archive_games), max_workers)
+        for url, month_games in zip(urls, games):
+            columns.add(month_games, username, _archive_month(url))
+        return columns
 
     @staticmethod
     def monthly_pgns(
-        username: str, year: Union[int, str], month: Union[int, str]
-    ) -> List[chess.pgn.Game]:
+        username: str,
+        year: Union[int, str],
+        month: Union[int, str],
+        headers_only: bool = False,
+    ) -> List[PGNGame]:
         """List of player games loaded from PGN format for a given month.
 
+        Args:
+            username (str): Username.
+            year (Union[int, str]): Year.
+            month (Union[int, str]): Month.
+            headers_only (bool): Only read the tags of each game, leaving its moves unparsed. Defaults
+                to False.
+
+        Returns:
+            List[Union[chess.pgn.Game, PGNHeaders]]: List of loaded PGN games, or of their tags if
+                ``headers_only``.
+        """
+        return list(Player.iter_monthly_pgns(username, year, month, headers_only))
+
+    @staticmethod
+    def iter_monthly_pgns(
+        username: str,
+        year: Union[int, str],
+        month: Union[int, str],
+        headers_only: bool = False,
+    ) -> Iterator[PGNGame]:
+        """Iterate over player games loaded from PGN format for a given month.
+
+        The PGN file is parsed as it is downloaded and games are yielded one at a time, so memory use
+        does not grow with the number of games in the month.
+
+        Args:
+            username (str): Username.
+            year (Union[int, str]): Year.
+            month (Union[int, str]): Month.
+            headers_only (bool): Only read the tags of each game, leaving its moves unparsed. Defaults
+                to False.
+
+        Yields:
+            Union[chess.pgn.Game, PGNHeaders]: Loaded PGN game, or its tags if ``headers_only``.
+        """
+        api_url = f"{_archive_url(username, year, month)}/pgn"
+        with get_client().stream(api_url) as body:
+            yield from _iter_pgns(
+                io.TextIOWrapper(body, encoding="utf-8"), headers_only
+            )
+
+    @staticmethod
+    def iter_all_pgns(username: str, headers_only: bool = False) -> Iterator[PGNGame]:
+        """Iterate over all player games loaded from PGN format, month by month.
+
+        Args:
+            username (str): Username.
+            headers_only (bool): Only read the tags of each game, leaving its moves unparsed. Defaults
+                to False.
+
+        Yields:
+            Union[chess.pgn.Game, PGNHeaders]: Loaded PGN game, or its tags if ``headers_only``.
+        """
+        for archive_url in Player.monthly_archive_urls(username):
+            with get_client().stream(f"{archive_url}/pgn") as body:
+                yield from _iter_pgns(
+                    io.TextIOWrapper(body, encoding="utf-8"), headers_only
+                )
+
+    @staticmethod
+    def parse_all_pgns(
+        username: str,
+        max_workers: Optional[int] = None,
+        compact: bool = False,
+        download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    ) -> Iterator[Union[chess.pgn.Game, CompactGame]]:
+        """Iterate over all player games loaded from PGN format, parsed across a pool of processes.
+
+        Monthly PGN archives are downloaded concurrently while earlier months are being parsed. Games
+        are yielded in chronological order of their archives, as with ``iter_all_pgns``. Only the main
+        line of each game is kept (see :func:`~chesscom.api.pgn.parse_games`).
+
+        Args:
+            username (str): Username.
+            max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+            compact (bool): Yield ``CompactGame`` instead of ``chess.pgn.Game``. Defaults to False.
+            download_workers (int): Number of archives downloaded concurrently. Defaults to 4.
+
+        Yields:
+            Union[chess.pgn.Game, CompactGame]: Loaded PGN game.
+        """
+        urls = [f"{url}/pgn" for url in Player.monthly_archive_urls(username)]
+        contents = (
+            body.decode()
+            for body in prefetch(urls, get_client().fetch, download_workers)
+        )
+        yield from parse_games(contents, max_workers, compact)
+
+
+class AsyncPlayer:
+    """Asynchronous player API wrapper.
+
+    Mirrors :class:`Player`, returning the same models.
+    """
+
+    @staticmethod
+    async def profile(username: str) -> PlayerProfile:
+        """Get player profile.
+
+        Args:
+            username (str): Username.
+
+        Returns:
+            PlayerProfile: Player profile class.
+        """
+        api_url = f"{BASE_PLAYER_URL}/{username}"
+        return await get_async_client().get(api_url, _profile)
+
+    @staticmethod
+    async def clubs(username: str) -> List[ClubDetails]:
+        """Get list of clubs player is in.
+
+        Args:
+            username (str): Username.
+
+        Returns:
+            List[ClubDetails]: List of club details class.
+        """
+        api_url = f"{BASE_PLAYER_URL}/{username}/clubs"
+        return await get_async_client().get(api_url, _clubs)
+
+    @staticmethod
+    async def tournaments(username: str) -> PlayerTournaments:
+        """Get list of tournaments player is in.
+
+        Args:
+            username (str): Username.
+
+        Returns:
+            PlayerTournaments: Player tournaments class.
+        """
+        api_url = f"{BASE_PLAYER_URL}/{username}/tournaments"
+        return await get_async_client().get(
+            api_url, lambda response: PlayerTournaments(**response)
+        )
+
+    @staticmethod
+    async def matches(username: str) -> PlayerMatches:
+        """Get list of matches player is in.
+
+        Args:
+            username (str): Username.
+
+        Returns:
+            PlayerMatches: Player matches class.
+        """
+        api_url = f"{BASE_PLAYER_URL}/{username}/matches"
+        return await get_async_client().get(
+            api_url, lambda response: PlayerMatches(**response)
+        )
+
+    @staticmethod
+    async def online_status(username: str) -> bool:
+        """Get online status of player (if they have been online in the last five minutes).
+
+        Args:
+            username (str): Username
+
+        Returns:
+            bool: Whether player is online.
+        """
+        api_url = f"{BASE_PLAYER_URL}/{username}/is-online"
+        return await get_async_client().get(
+            api_url, lambda response: response["online"]
+        )
+
+    @staticmethod
+    async def stats(username: str) -> List[Union[ChessModeStats, ChessModeRatings]]:
+        """Get player stats for game modes.
+
+        Args:
+            username (str): Username.
+
+        Returns:
+            List[Union[ChessModeStats, ChessModeRatings]]: List of player stats for game modes.
+        """
+        api_url = f"{BASE_PLAYER_URL}/{username}/stats"
+        return await get_async_client().get(api_url, _stats)
+
+    @staticmethod
+    async def current_daily_chess_games(username: str) -> List[CurrentDailyChess]:
+        """Get current daily chess games of player.
+
+        Args:
+            username (str): Username.
+
+        Returns:
+            List[CurrentDailyChess]: List of current daily chess class.
+        """
+        api_url = f"{BASE_PLAYER_URL}/{username}/games"
+        return await get_async_client().get(api_url, _current_daily_chess)
+
+    @staticmethod
+    async def to_move_daily_chess_games(username: str) -> List[CurrentDailyChess]:
+        """Get list of daily chess games where it is the player's turn to move.
+
+        Args:
+            username (str): Username.
+
+        Returns:
+            List[CurrentDailyChess]: List of current daily chess class (one per game).
+        """
+        api_url = f"{BASE_PLAYER_URL}/{username}/games/to-move"
+        return await get_async_client().get(
+            api_url, lambda response: [ToMoveDailyChess(**x) for x in response["games"]]
+        )
+
+    @staticmethod
+    async def monthly_archive_urls(username: str) -> List[str]:
+        """Get list of URLs of monthly archives for player games.
+
+        Args:
+            username (str): Username.
+
+        Returns:
+            List[str]: List of URLs of monthly archives for player games.
+        """
+        api_url = f"{BASE_PLAYER_URL}/{username}/games/archives"
+        return await get_async_client().get(
+            api_url, lambda response: response["archives"]
+        )
+
+    @staticmethod
+    async def bulk(
+        usernames: Iterable[str],
+        endpoints: Sequence[str] = DEFAULT_BULK_ENDPOINTS,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> AsyncIterator[PlayerResult]:
+        """Fetch endpoints of many players concurrently.
+
+        Every endpoint of every player is fetched as a separate request, up to ``max_concurrency`` at a
+        time. ``usernames`` is consumed as requests complete, so it can be a lazy iterator. An endpoint
+        that fails is reported in the player's result without stopping the others.
+
+        Args:
+            usernames (Iterable[str]): Usernames.
+            endpoints (Sequence[str]): Names of the ``AsyncPlayer`` methods fetched for each player, among
+                ``BULK_ENDPOINTS``. Defaults to "profile", "stats", "online_status" and "clubs".
+            max_concurrency (int): Number of requests sent concurrently. Defaults to 32.
+
+        Yields:
+            PlayerResult: Results of a player, as soon as all its endpoints are fetched.
+        """
+        results = _BulkResults(endpoints)
+        usernames = iter(usernames)
+        pending = {}
+        try:
+            while True:
+                for username in usernames:
+                    key = results.add(username)
+                    for endpoint in endpoints:
+                        fetch = getattr(AsyncPlayer, endpoint)
+                        pending[asyncio.ensure_future(fetch(username))] = key, endpoint
+                    if len(pending) >= max_concurrency:
+                        break
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result = results.complete(*pending.pop(task), task)
+                    if result is not None:
+                        yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    async def monthly_archive(
+        username: str, year: Union[int, str], month: Union[int, str]
+    ) -> List[MonthlyArchive]:
+        """Get list of games from monthly archive URL of player.
+
+        Each game's ``pgn`` is also available parsed as ``MonthlyArchive.game``, so the games and their
+        moves are loaded from a single request, unlike with ``monthly_pgns``.
+
         Args:
             username (str): Username.
             year (Union[int, str]): Year.
             month (Union[int, str]): Month.
 
         Returns:
-            List[chess.pgn.Game]: List of loaded PGN games.
+            List[MonthlyArchive]: List of games.
         """
-        if isinstance(year, (int, float)):
-            year = str(int(year))
+        api_url = _archive_url(username, year, month)
+        return await get_async_client().get(api_url, _monthly_archive)
 
-        assert 1 <= int(month) <= 12
+    @staticmethod
+    async def monthly_records(
+        username: str, year: Union[int, str], month: Union[int, str]
+    ) -> List[GameRecord]:
+        """Get list of games from monthly archive URL of player as compact records.
 
-        if isinstance(month, (int, float)):
-            month = str(int(month))
+        Records take a fraction of the memory of ``MonthlyArchive`` models and are built without
+        validation; convert them with ``GameRecord.to_model`` when needed.
 
-        if len(month) == 1:
-            month = "0" + month
+        Args:
+            username (str): Username.
+            year (Union[int, str]): Year.
+            month (Union[int, str]): Month.
+
+        Returns:
+            List[GameRecord]: List of game records.
+        """
+        api_url = _archive_url(username, year, month)
+        return await get_async_client().get(api_url, _monthly_records)
+
+    @staticmethod
+    async def archives(
+        username: str,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    ) -> AsyncIterator[MonthlyArchive]:
+        """Iterate over the games of a player's monthly archives within a range of months.
+
+        Only the archives of months from ``start`` to ``end`` (inclusive) are downloaded, up to
+        ``max_workers`` at a time. Games are yielded in chronological order of their archives, as soon
+        as each archive and all earlier ones are downloaded.
 
-        api_url = f"{BASE_PLAYER_URL}/{username}/games/{year}/{month}/pgn"
-        response = requests.get(api_url)
+        Args:
+            username (str): Username.
+            start (datetime.date, optional): Date in the first month. Defaults to the first archive.
+            end (datetime.date, optional): Date in the last month. Defaults to the last archive.
+            max_workers (int): Number of archives downloaded concurrently. Defaults to 4.
+
+        Yields:
+            MonthlyArchive: Archived game.
+        """
+        urls = _archive_range(
+            await AsyncPlayer.monthly_archive_urls(username), start, end
+        )
+        client = get_async_client()
+        pending = deque()
+        try:
+            for url in urls:
+                pending.append(asyncio.ensure_future(client.get(url, _monthly_archive)))
+                if len(pending) >= max_workers:
+                    for game in await pending.popleft():
+                        yield game
+            while pending:
+                for game in await pending.popleft():
+                    yield game
+        finally:
+            for task in pending:
+                task.cancel()
 
-        pgn_file = io.StringIO(response.content.decode())
-        pgns = []
-        while True:
-            game = chess.pgn.read_game(pgn_file)
-            if game is None:  # End of file
-                break
-            pgns.append(game)
-        return pgns
+    @staticmethod
+    async def archive_columns(
+        username: str,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    ) -> ArchiveColumns:
+        """Get the games of a player's monthly archives within a range of months as columns.
+
+        Games are appended to the columns straight from the JSON responses, without building
+        ``MonthlyArchive`` models. Archives are downloaded as in :meth:`archives`.
+
+        Args:
+            username (str): Username.
+            start (datetime.date, optional): Date in the first month. Defaults to the first archive.
+            end (datetime.date, optional): Date in the last month. Defaults to the last archive.
+            max_workers (int): Number of archives downloaded concurrently. Defaults to 4.
+
+        Returns:
+            ArchiveColumns: Columns of the games, partitioned by player and month.
+        """
+        urls = _archive_range(
+            await AsyncPlayer.monthly_archive_urls(username), start, end
+        )
+        client = get_async_client()
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(url: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await client.get(url, _archive_games)
+
+        columns = ArchiveColumns()
+        games = await asyncio.gather(*(fetch(url) for url in urls))
+        for url, month_games in zip(urls, games):
+            columns.add(month_games, username, _archive_month(url))
+        return columns
+
+    @staticmethod
+    async def monthly_pgns(
+        username: str,
+        year: Union[int, str],
+        month: Union[int, str],
+        headers_only: bool = False,
+    ) -> List[PGNGame]:
+        """List of player games loaded from PGN format for a given month.
+
+        Args:
+            username (str): Username.
+            year (Union[int, str]): Year.
+            month (Union[int, str]): Month.
+            headers_only (bool): Only read the tags of each game, leaving its moves unparsed. Defaults
+                to False.
+
+        Returns:
+            List[Union[chess.pgn.Game, PGNHeaders]]: List of loaded PGN games, or of their tags if
+                ``headers_only``.
+        """
+        api_url = f"{_archive_url(username, year, month)}/pgn"
+        return _pgns(await get_async_client().fetch(api_url), headers_only)
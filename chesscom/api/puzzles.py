@@ -1,6 +1,5 @@
-import requests
-
 from ._puzzles import PuzzleDetails
+from .client import get_async_client, get_client
 
 BASE_PUZZLE_URL = "https://api.chess.com/pub/puzzle"
 
@@ -15,8 +14,9 @@ class Puzzles:
         Returns:
             PuzzleDetails: Puzzle details class.
         """
-        response = requests.get(BASE_PUZZLE_URL).json()
-        return PuzzleDetails(**response)
+        return get_client().get(
+            BASE_PUZZLE_URL, lambda response: PuzzleDetails(**response)
+        )
 
     @staticmethod
     def random() -> PuzzleDetails:
@@ -26,5 +26,34 @@ class Puzzles:
             PuzzleDetails: Puzzle details class.
         """
         api_url = f"{BASE_PUZZLE_URL}/random"
-        response = requests.get(api_url).json()
-        return PuzzleDetails(**response)
+        return get_client().get(api_url, lambda response: PuzzleDetails(**response))
+
+
+class AsyncPuzzles:
+    """Asynchronous puzzles API wrapper.
+
+    Mirrors :class:`Puzzles`, returning the same models.
+    """
+
+    @staticmethod
+    async def daily() -> PuzzleDetails:
+        """Get daily puzzle.
+
+        Returns:
+            PuzzleDetails: Puzzle details class.
+        """
+        return await get_async_client().get(
+            BASE_PUZZLE_URL, lambda response: PuzzleDetails(**response)
+        )
+
+    @staticmethod
+    async def random() -> PuzzleDetails:
+        """Get random puzzle.
+
+        Returns:
+            PuzzleDetails: Puzzle details class.
+        """
+        api_url = f"{BASE_PUZZLE_URL}/random"
+        return await get_async_client().get(
+            api_url, lambda response: PuzzleDetails(**response)
+        )
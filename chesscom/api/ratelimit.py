@@ -0,0 +1,269 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+from pydantic import BaseModel
+
+DEFAULT_INITIAL_CONCURRENCY = 8
+DEFAULT_MAX_CONCURRENCY = 64
+
+
+class RateLimitMetrics(BaseModel):
+    """Snapshot of rate limiter activity.
+
+    Args:
+        requests (int): Number of requests started.
+        throttled (int): Number of 429 (Too Many Requests) responses received.
+        retries (int): Number of requests retried after being throttled.
+        throttled_time (float): Seconds spent waiting because the server throttled requests, summed over
+            all waiting requests.
+        queued_time (float): Seconds spent waiting for a free concurrency slot, summed over all waiting
+            requests.
+        concurrency (float): Current number of requests allowed in flight.
+        in_flight (int): Number of requests in flight.
+    """
+
+    requests: int
+    throttled: int
+    retries: int
+    throttled_time: float
+    queued_time: float
+    concurrency: float
+    in_flight: int
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Get the delay requested by a ``Retry-After`` header.
+
+    Args:
+        headers (Mapping[str, str]): Response headers.
+
+    Returns:
+        Optional[float]: Seconds to wait, if the header is present and valid.
+    """
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class _AIMD:
+    """Additive-increase/multiplicative-decrease concurrency governor state.
+
+    The number of requests allowed in flight grows by ``increase`` per window of successful requests and
+    is multiplied by ``decrease`` when the server answers 429. Requests that were already in flight when
+    the limit was cut do not cut it again, so a burst of 429s counts as a single congestion event.
+    """
+
+    def __init__(
+        self,
+        initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+        min_concurrency: int = 1,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ):
+        assert 1 <= min_concurrency <= max_concurrency
+        assert 0 < decrease < 1
+
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.increase = increase
+        self.decrease = decrease
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._limit = float(
+            min(max(initial_concurrency, min_concurrency), max_concurrency)
+        )
+        self._in_flight = 0
+        self._epoch = 0
+        self._resume_at = 0.0
+
+        self._requests = 0
+        self._throttled = 0
+        self._retries = 0
+        self._throttled_time = 0.0
+        self._queued_time = 0.0
+
+    def _has_slot(self) -> bool:
+        return self._in_flight < int(self._limit)
+
+    def _start(self) -> int:
+        self._in_flight += 1
+        self._requests += 1
+        return self._epoch
+
+    def _finish(self, epoch: int, throttled: bool) -> None:
+        self._in_flight -= 1
+        if throttled:
+            self._throttled += 1
+            if epoch == self._epoch:
+                self._limit = max(self.min_concurrency, self._limit * self.decrease)
+                self._epoch += 1
+        else:
+            self._limit = min(
+                self.max_concurrency, self._limit + self.increase / self._limit
+            )
+
+    def _pause(self, attempt: int, retry_after: Optional[float]) -> None:
+        if retry_after is None:
+            # Exponential backoff with jitter so that throttled clients do not retry in lockstep.
+            delay = min(self.backoff_max, self.backoff_base * 2**attempt)
+            delay = delay / 2 + random.uniform(0, delay / 2)
+        else:
+            delay = retry_after
+        self._retries += 1
+        self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    def metrics(self) -> RateLimitMetrics:
+        """Get a snapshot of the limiter's activity.
+
+        Returns:
+            RateLimitMetrics: Rate limit metrics class.
+        """
+        return RateLimitMetrics(
+            requests=self._requests,
+            throttled=self._throttled,
+            retries=self._retries,
+            throttled_time=self._throttled_time,
+            queued_time=self._queued_time,
+            concurrency=self._limit,
+            in_flight=self._in_flight,
+        )
+
+
+class RateLimiter(_AIMD):
+    """Thread-safe rate-limit governor used by :class:`~chesscom.api.client.Client`.
+
+    Args:
+        initial_concurrency (int): Requests allowed in flight at start. Defaults to 8.
+        min_concurrency (int): Lower bound of requests allowed in flight. Defaults to 1.
+        max_concurrency (int): Upper bound of requests allowed in flight. Defaults to 64.
+        increase (float): Slots added per window of successful requests. Defaults to 1.
+        decrease (float): Factor applied to the allowed concurrency on a 429. Defaults to 0.5.
+        backoff_base (float): Backoff in seconds for the first retry without ``Retry-After``. Defaults to 1.
+        backoff_max (float): Maximum backoff in seconds. Defaults to 60.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._condition = threading.Condition()
+
+    def acquire(self) -> int:
+        """Block until a request may be sent.
+
+        Returns:
+            int: Token to pass to :meth:`release`.
+        """
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    self._condition.wait(self._resume_at - now)
+                    self._throttled_time += time.monotonic() - now
+                elif not self._has_slot():
+                    self._condition.wait()
+                    self._queued_time += time.monotonic() - now
+                else:
+                    return self._start()
+
+    def release(self, token: int, throttled: bool = False) -> None:
+        """Record the outcome of a request started with :meth:`acquire`.
+
+        Args:
+            token (int): Token returned by :meth:`acquire`.
+            throttled (bool): Whether the server answered 429. Defaults to False.
+        """
+        with self._condition:
+            self._finish(token, throttled)
+            self._condition.notify_all()
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> None:
+        """Pause all requests before retrying a throttled one.
+
+        Args:
+            attempt (int): Number of retries already made for the request.
+            retry_after (Optional[float]): Delay requested by the server, in seconds.
+        """
+        with self._condition:
+            self._pause(attempt, retry_after)
+            self._condition.notify_all()
+
+
+class AsyncRateLimiter(_AIMD):
+    """Rate-limit governor used by :class:`~chesscom.api.client.AsyncClient`.
+
+    Takes the same arguments as :class:`RateLimiter`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._condition = None
+        self._loop = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_event_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+    async def acquire(self) -> int:
+        """Wait until a request may be sent.
+
+        Returns:
+            int: Token to pass to :meth:`release`.
+        """
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    try:
+                        await asyncio.wait_for(condition.wait(), self._resume_at - now)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._throttled_time += time.monotonic() - now
+                elif not self._has_slot():
+                    await condition.wait()
+                    self._queued_time += time.monotonic() - now
+                else:
+                    return self._start()
+
+    async def release(self, token: int, throttled: bool = False) -> None:
+        """Record the outcome of a request started with :meth:`acquire`.
+
+        Args:
+            token (int): Token returned by :meth:`acquire`.
+            throttled (bool): Whether the server answered 429. Defaults to False.
+        """
+        condition = self._get_condition()
+        async with condition:
+            self._finish(token, throttled)
+            condition.notify_all()
+
+    async def backoff(self, attempt: int, retry_after: Optional[float] = None) -> None:
+        """Pause all requests before retrying a throttled one.
+
+        Args:
+            attempt (int): Number of retries already made for the request.
+            retry_after (Optional[float]): Delay requested by the server, in seconds.
+        """
+        condition = self._get_condition()
+        async with condition:
+            self._pause(attempt, retry_after)
+            condition.notify_all()
@@ -1,12 +1,15 @@
-from typing import List
-
-import requests
+from typing import Any, Dict, List
 
 from ._streamers import StreamerDetails
+from .client import get_async_client, get_client
 
 BASE_STREAMERS_URL = f"https://api.chess.com/pub/streamers"
 
 
+def _streamers(response: Dict[str, Any]) -> List[StreamerDetails]:
+    return [StreamerDetails(**x) for x in response["streamers"]]
+
+
 class Streamers:
     """Streamers API wrapper."""
 
@@ -19,6 +22,22 @@ class Streamers:
         Returns:
             List[StreamerDetails]: List of all streamers.
         """
-        response = requests.get(BASE_STREAMERS_URL).json()
-        streamers = response["streamers"]
-        return [StreamerDetails(**x) for x in streamers]
+        return get_client().get(BASE_STREAMERS_URL, _streamers)
+
+
+class AsyncStreamers:
+    """Asynchronous streamers API wrapper.
+
+    Mirrors :class:`Streamers`, returning the same models.
+    """
+
+    @staticmethod
+    async def list_all() -> List[StreamerDetails]:
+        """List all streamers.
+
+        Note: Endpoint refreshes at most every 5 minutes.
+
+        Returns:
+            List[StreamerDetails]: List of all streamers.
+        """
+        return await get_async_client().get(BASE_STREAMERS_URL, _streamers)
@@ -0,0 +1,248 @@
+import asyncio
+import calendar
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from ._concurrency import prefetch
+from ._player import MonthlyArchive
+from ._sync import MonthCheckpoint, SyncCheckpoint
+from .cache import DAY
+from .client import get_async_client, get_client
+from .player import (
+    DEFAULT_DOWNLOAD_WORKERS,
+    AsyncPlayer,
+    Player,
+    _monthly_archive,
+)
+
+
+class BaseCheckpointStore(ABC):
+    """Interface of sync checkpoint storage backends."""
+
+    @abstractmethod
+    def get(self, username: str) -> Optional[SyncCheckpoint]:
+        """Get the checkpoint of a player.
+
+        Args:
+            username (str): Username.
+
+        Returns:
+            Optional[SyncCheckpoint]: Checkpoint, if the player was synced before.
+        """
+
+    @abstractmethod
+    def set(self, checkpoint: SyncCheckpoint) -> None:
+        """Store the checkpoint of a player.
+
+        Args:
+            checkpoint (SyncCheckpoint): Checkpoint.
+        """
+
+    @abstractmethod
+    def delete(self, username: str) -> None:
+        """Remove the checkpoint of a player, so that their archives are synced from the start.
+
+        Args:
+            username (str): Username.
+        """
+
+
+class MemoryCheckpointStore(BaseCheckpointStore):
+    """In-memory checkpoint store."""
+
+    def __init__(self):
+        self._checkpoints: Dict[str, SyncCheckpoint] = {}
+        self._lock = threading.Lock()
+
+    def get(self, username: str) -> Optional[SyncCheckpoint]:
+        with self._lock:
+            checkpoint = self._checkpoints.get(username.lower())
+            return None if checkpoint is None else checkpoint.copy(deep=True)
+
+    def set(self, checkpoint: SyncCheckpoint) -> None:
+        with self._lock:
+            self._checkpoints[checkpoint.username.lower()] = checkpoint.copy(deep=True)
+
+    def delete(self, username: str) -> None:
+        with self._lock:
+            self._checkpoints.pop(username.lower(), None)
+
+
+class SQLiteCheckpointStore(BaseCheckpointStore):
+    """Persistent checkpoint store in an SQLite database.
+
+    Args:
+        path (str): Database file path.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                "username TEXT PRIMARY KEY, checkpoint TEXT NOT NULL)"
+            )
+
+    def get(self, username: str) -> Optional[SyncCheckpoint]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT checkpoint FROM checkpoints WHERE username = ?",
+                (username.lower(),),
+            ).fetchone()
+        return None if row is None else SyncCheckpoint.parse_raw(row[0])
+
+    def set(self, checkpoint: SyncCheckpoint) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)",
+                (checkpoint.username.lower(), checkpoint.json()),
+            )
+
+    def delete(self, username: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM checkpoints WHERE username = ?", (username.lower(),)
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+def _month(url: str) -> str:
+    return "/".join(url.rstrip("/").split("/")[-2:])
+
+
+def _is_final(month: str, grace: float) -> bool:
+    year, month = map(int, month.split("/"))
+    year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return time.time() >= calendar.timegm((year, month, 1, 0, 0, 0)) + grace
+
+
+class ArchiveSync:
+    """Incremental sync of players' monthly archives.
+
+    Each run only downloads the archives of months not fully synced before and yields the games not
+    yielded by previous runs. A player's checkpoint is stored after all games of each month have been
+    consumed, so games of a month whose iteration was interrupted are yielded again by the next run.
+
+    Months in progress are downloaded again on every run; with the client's conditional requests (and
+    a cache), an unchanged archive costs a 304 (Not Modified) response. Each of them keeps its own
+    checkpoint, since a month stays in progress during ``grace`` while the next one already has games.
+
+    Args:
+        store (BaseCheckpointStore): Checkpoint store.
+        max_workers (int): Number of archives downloaded concurrently. Defaults to 4.
+        grace (float): Seconds after the end of a month during which its archive is still considered in
+            progress, to allow for games being archived late. Defaults to one day.
+    """
+
+    def __init__(
+        self,
+        store: BaseCheckpointStore,
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        grace: float = DAY,
+    ):
+        self.store = store
+        self.max_workers = max_workers
+        self.grace = grace
+
+    def _pending(
+        self, username: str, urls: List[str]
+    ) -> Tuple[SyncCheckpoint, List[str]]:
+        checkpoint = self.store.get(username) or SyncCheckpoint(username=username)
+        urls = sorted(urls, key=_month)
+        if checkpoint.completed is not None:
+            urls = [url for url in urls if _month(url) > checkpoint.completed]
+        return checkpoint, urls
+
+    def _advance(
+        self, checkpoint: SyncCheckpoint, url: str, games: List[MonthlyArchive]
+    ) -> List[MonthlyArchive]:
+        month = _month(url)
+        progress = checkpoint.months.get(month)
+        if progress is not None and progress.last_end_time is not None:
+            seen = set(progress.last_urls)
+            games = [
+                game
+                for game in games
+                if game.end_time > progress.last_end_time
+                or (game.end_time == progress.last_end_time and game.url not in seen)
+            ]
+
+        if _is_final(month, self.grace):
+            checkpoint.months.pop(month, None)
+            # Months are synced in order, so earlier months still in progress cannot be skipped yet.
+            if not any(x < month for x in checkpoint.months):
+                checkpoint.completed = month
+        elif games:
+            progress = checkpoint.months.setdefault(month, MonthCheckpoint())
+            last_end_time = max(game.end_time for game in games)
+            if last_end_time != progress.last_end_time:
+                progress.last_urls = []
+            progress.last_end_time = last_end_time
+            progress.last_urls += [
+                game.url for game in games if game.end_time == last_end_time
+            ]
+        return games
+
+    def sync(self, username: str) -> Iterator[MonthlyArchive]:
+        """Iterate over the games of a player not synced before.
+
+        Args:
+            username (str): Username.
+
+        Yields:
+            MonthlyArchive: Archived game, in chronological order of archives.
+        """
+        checkpoint, urls = self._pending(
+            username, Player.monthly_archive_urls(username)
+        )
+        client = get_client()
+        fetches = prefetch(
+            urls, lambda url: client.get(url, _monthly_archive), self.max_workers
+        )
+        for url, games in zip(urls, fetches):
+            yield from self._advance(checkpoint, url, games)
+            self.store.set(checkpoint)
+
+
+class AsyncArchiveSync(ArchiveSync):
+    """Incremental sync of players' monthly archives, for use with ``asyncio``.
+
+    Takes the same arguments as :class:`ArchiveSync`.
+    """
+
+    async def sync(self, username: str) -> AsyncIterator[MonthlyArchive]:
+        """Iterate over the games of a player not synced before.
+
+        Args:
+            username (str): Username.
+
+        Yields:
+            MonthlyArchive: Archived game, in chronological order of archives.
+        """
+        checkpoint, urls = self._pending(
+            username, await AsyncPlayer.monthly_archive_urls(username)
+        )
+        client = get_async_client()
+        tasks = deque()
+        started = 0
+        try:
+            for url in urls:
+                while len(tasks) < self.max_workers and started < len(urls):
+                    fetch = client.get(urls[started], _monthly_archive)
+                    tasks.append(asyncio.ensure_future(fetch))
+                    started += 1
+                for game in self._advance(checkpoint, url, await tasks.popleft()):
+                    yield game
+                self.store.set(checkpoint)
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -1,27 +1,193 @@
-from typing import Dict, List, Union
+import asyncio
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Union
 
-import requests
+from ._concurrency import prefetch
+from .cache import DAY
+from .client import get_async_client, get_client
 
 BASE_TITLED_URL = "https://api.chess.com/pub/titled"
 VALID_TITLES = ["GM", "WGM", "IM", "WIM", "FM", "WFM", "NM", "WNM", "CM", "WCM"]
+DEFAULT_TITLE_WORKERS = len(VALID_TITLES)
+
+
+def _players(response: Dict[str, List[str]]) -> List[str]:
+    return response["players"]
+
+
+class TitleIndex:
+    """Index of the titles of titled players, by lower-cased username.
+
+    Lookups are a single dictionary access, so that games can be annotated in bulk. A player listed
+    under several titles keeps the first one in ``VALID_TITLES`` order, i.e. the highest.
+
+    Args:
+        usernames (Dict[str, List[str]]): Usernames per title, as returned by
+            :meth:`TitledPlayers.usernames`.
+    """
+
+    def __init__(self, usernames: Dict[str, List[str]]):
+        self.created = time.time()
+        self._titles: Dict[str, str] = {}
+        order = {title: i for i, title in enumerate(VALID_TITLES)}
+        for title in sorted(usernames, key=lambda x: order.get(x, len(order))):
+            for username in usernames[title]:
+                self._titles.setdefault(username.lower(), title)
+
+    def title_of(self, username: str) -> Optional[str]:
+        """Get the title of a player.
+
+        Args:
+            username (str): Username, in any case.
+
+        Returns:
+            Optional[str]: Title, or None if the player is not titled.
+        """
+        return self._titles.get(username.lower())
+
+    def titles_of(self, usernames: Iterable[str]) -> List[Optional[str]]:
+        """Get the titles of many players.
+
+        Args:
+            usernames (Iterable[str]): Usernames, in any case.
+
+        Returns:
+            List[Optional[str]]: Title of each player, or None if the player is not titled.
+        """
+        get = self._titles.get
+        return [get(username.lower()) for username in usernames]
+
+    def is_titled(self, usernames: Iterable[str]) -> List[bool]:
+        """Check whether many players are titled.
+
+        Args:
+            usernames (Iterable[str]): Usernames, in any case.
+
+        Returns:
+            List[bool]: Whether each player is titled.
+        """
+        titles = self._titles
+        return [username.lower() in titles for username in usernames]
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Whether the index was built less than ``ttl`` seconds ago.
+
+        Args:
+            ttl (float): Time-to-live in seconds.
+
+        Returns:
+            bool: Whether the index is fresh.
+        """
+        return time.time() < self.created + ttl
+
+    def __contains__(self, username: str) -> bool:
+        return username.lower() in self._titles
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+
+_index: Optional[TitleIndex] = None
+_index_lock = threading.Lock()
+_async_index_lock: Optional[asyncio.Lock] = None
+_async_index_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_async_index_lock() -> asyncio.Lock:
+    global _async_index_lock, _async_index_loop
+    loop = asyncio.get_event_loop()
+    if _async_index_lock is None or _async_index_loop is not loop:
+        _async_index_lock = asyncio.Lock()
+        _async_index_loop = loop
+    return _async_index_lock
 
 
 class TitledPlayers:
     """Titled API wrapper."""
 
     @staticmethod
-    def usernames(titles: Union[List[str], str]) -> Dict[str, List[str]]:
+    def usernames(
+        titles: Union[List[str], str], max_workers: int = DEFAULT_TITLE_WORKERS
+    ) -> Dict[str, List[str]]:
         """Usernames of titled players for given titles.
 
+        Titles are fetched concurrently.
+
         Args:
             titles (Union[List[str], str]): Titles to consider.
+            max_workers (int): Number of titles fetched concurrently. Defaults to all of them.
 
         Returns:
             Dict[str, List[str]]: Dictionary of format {title: [players]}.
         """
-        usernames = {}
-        for title in titles:
-            api_url = f"{BASE_TITLED_URL}/{title}"
-            response = requests.get(api_url).json()
-            usernames[title] = response["players"]
-        return usernames
+        client = get_client()
+        api_urls = [f"{BASE_TITLED_URL}/{title}" for title in titles]
+        players = prefetch(api_urls, lambda url: client.get(url, _players), max_workers)
+        return dict(zip(titles, players))
+
+    @staticmethod
+    def index(ttl: float = DAY) -> TitleIndex:
+        """Get the index of the titles of all titled players.
+
+        The index is shared by all callers and rebuilt from ``VALID_TITLES`` once older than ``ttl``.
+
+        Args:
+            ttl (float): Seconds the index is reused for. Defaults to one day.
+
+        Returns:
+            TitleIndex: Title index class.
+        """
+        global _index
+        with _index_lock:
+            if _index is None or not _index.is_fresh(ttl):
+                _index = TitleIndex(TitledPlayers.usernames(VALID_TITLES))
+            return _index
+
+
+class AsyncTitledPlayers:
+    """Asynchronous titled API wrapper.
+
+    Mirrors :class:`TitledPlayers`; titles are fetched concurrently.
+    """
+
+    @staticmethod
+    async def usernames(titles: Union[List[str], str]) -> Dict[str, List[str]]:
+        """Usernames of titled players for given titles.
+
+        Args:
+            titles (Union[List[str], str]): Titles to consider.
+
+        Returns:
+            Dict[str, List[str]]: Dictionary of format {title: [players]}.
+        """
+        client = get_async_client()
+        players = await asyncio.gather(
+            *(client.get(f"{BASE_TITLED_URL}/{title}", _players) for title in titles)
+        )
+        return dict(zip(titles, players))
+
+    @staticmethod
+    async def index(ttl: float = DAY) -> TitleIndex:
+        """Get the index of the titles of all titled players.
+
+        The index is shared by all callers, including :meth:`TitledPlayers.index`, and rebuilt from
+        ``VALID_TITLES`` once older than ``ttl``. Concurrent callers on the same event loop wait for a
+        single rebuild.
+
+        Args:
+            ttl (float): Seconds the index is reused for. Defaults to one day.
+
+        Returns:
+            TitleIndex: Title index class.
+        """
+        global _index
+        index = _index
+        if index is not None and index.is_fresh(ttl):
+            return index
+        async with _get_async_index_lock():
+            index = _index
+            if index is None or not index.is_fresh(ttl):
+                index = TitleIndex(await AsyncTitledPlayers.usernames(VALID_TITLES))
+                _index = index
+            return index
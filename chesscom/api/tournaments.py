@@ -1,14 +1,149 @@
-import requests
+import asyncio
+from typing import Any, Dict, List, NamedTuple, Optional
 
+from ._concurrency import prefetch
 from ._tournaments import (
     TournamentDetails,
     TournamentRoundDetails,
     TournamentRoundGroupDetails,
+    TournamentRoundGroupGames,
 )
+from .client import get_async_client, get_client
 
 BASE_TOURNAMENT_URL = "https://api.chess.com/pub/tournament"
 TOURNAMENT_STATUSES = ["winner", "eliminated", "withdrew", "removed"]
 INVITATION_STATUSES = ["invited", "registered"]
+DEFAULT_CRAWL_WORKERS = 8
+
+
+def _details(response: Dict[str, Any]) -> TournamentDetails:
+    return TournamentDetails(**response)
+
+
+def _round(response: Dict[str, Any]) -> TournamentRoundDetails:
+    return TournamentRoundDetails(**response)
+
+
+def _group(response: Dict[str, Any]) -> TournamentRoundGroupDetails:
+    return TournamentRoundGroupDetails(**response)
+
+
+class TournamentGroup(NamedTuple):
+    """Group of a crawled tournament round.
+
+    Args:
+        url (str): Group URL.
+        details (TournamentRoundGroupDetails): Games and players of the group.
+    """
+
+    url: str
+    details: TournamentRoundGroupDetails
+
+
+class TournamentRound(NamedTuple):
+    """Round of a crawled tournament.
+
+    Args:
+        url (str): Round URL.
+        details (TournamentRoundDetails): Groups and players of the round.
+        groups (List[TournamentGroup]): Groups of the round, in the order of ``details.groups``.
+    """
+
+    url: str
+    details: TournamentRoundDetails
+    groups: List[TournamentGroup]
+
+
+class TournamentStanding(NamedTuple):
+    """Results of a player over all the rounds of a tournament.
+
+    Args:
+        username (str): Username.
+        status (str, optional): Status of the player in the tournament, e.g. "winner" or "eliminated".
+        points (float): Points earned over all groups.
+        tie_break (float): Tie-break points earned over all groups.
+        rounds (int): Number of rounds the player played in.
+        is_advancing (bool): Whether the player advances from the last round they played in.
+    """
+
+    username: str
+    status: Optional[str]
+    points: float
+    tie_break: float
+    rounds: int
+    is_advancing: bool
+
+
+class TournamentTree(NamedTuple):
+    """Tournament with all its rounds, groups and games.
+
+    Args:
+        details (TournamentDetails): Tournament details.
+        rounds (List[TournamentRound]): Rounds, in the order of ``details.rounds``.
+        standings (List[TournamentStanding]): One entry per player, ordered by number of rounds played,
+            points and tie-break points.
+    """
+
+    details: TournamentDetails
+    rounds: List[TournamentRound]
+    standings: List[TournamentStanding]
+
+    def games(self) -> List[TournamentRoundGroupGames]:
+        """Games of all groups of all rounds.
+
+        Returns:
+            List[TournamentRoundGroupGames]: Games, round by round and group by group.
+        """
+        return [
+            game
+            for tournament_round in self.rounds
+            for group in tournament_round.groups
+            for game in group.details.games
+        ]
+
+
+def _standings(
+    details: TournamentDetails, rounds: List[TournamentRound]
+) -> List[TournamentStanding]:
+    # Players appear in the tournament, in every round and in every group they played: merge them by
+    # username, keeping one record per player.
+    statuses = {x.username.lower(): x.status for x in details.players}
+    standings: Dict[str, TournamentStanding] = {}
+    for tournament_round in rounds:
+        for group in tournament_round.groups:
+            for player in group.details.players:
+                key = player.username.lower()
+                standing = standings.get(key)
+                if standing is None:
+                    standing = TournamentStanding(
+                        player.username, statuses.get(key), 0.0, 0.0, 0, False
+                    )
+                standings[key] = standing._replace(
+                    points=standing.points + player.points,
+                    tie_break=standing.tie_break + player.tie_break,
+                    rounds=standing.rounds + 1,
+                    is_advancing=player.is_advancing,
+                )
+    return sorted(
+        standings.values(), key=lambda x: (-x.rounds, -x.points, -x.tie_break)
+    )
+
+
+def _tree(
+    details: TournamentDetails,
+    rounds: List[TournamentRoundDetails],
+    groups: List[TournamentRoundGroupDetails],
+) -> TournamentTree:
+    groups = iter(groups)
+    tournament_rounds = [
+        TournamentRound(
+            url, x, [TournamentGroup(group_url, next(groups)) for group_url in x.groups]
+        )
+        for url, x in zip(details.rounds, rounds)
+    ]
+    return TournamentTree(
+        details, tournament_rounds, _standings(details, tournament_rounds)
+    )
 
 
 class Tournament:
@@ -25,8 +160,7 @@ class Tournament:
             TournamentDetails: Tournament details class.
         """
         api_url = f"{BASE_TOURNAMENT_URL}/{tournament_id}"
-        response = requests.get(api_url).json()
-        return TournamentDetails(**response)
+        return get_client().get(api_url, _details)
 
     @staticmethod
     def get_round(tournament_id: str, tournament_round: str) -> TournamentRoundDetails:
@@ -40,8 +174,7 @@ class Tournament:
             TournamentRoundDetails: Tournament round details class.
         """
         api_url = f"{BASE_TOURNAMENT_URL}/{tournament_id}/{tournament_round}"
-        response = requests.get(api_url).json()
-        return TournamentRoundDetails(**response)
+        return get_client().get(api_url, _round)
 
     @staticmethod
     def get_round_group(
@@ -60,5 +193,115 @@ class Tournament:
             TournamentRoundGroupDetails: [description]
         """
         api_url = f"{BASE_TOURNAMENT_URL}/{tournament_id}/{tournament_round}/{tournament_group}"
-        response = requests.get(api_url).json()
-        return TournamentRoundGroupDetails(**response)
+        return get_client().get(api_url, _group)
+
+    @staticmethod
+    def crawl(
+        tournament_id: str, max_workers: int = DEFAULT_CRAWL_WORKERS
+    ) -> TournamentTree:
+        """Get a tournament with all its rounds, groups and games.
+
+        Rounds are fetched concurrently once the tournament is fetched, then the groups of all rounds.
+
+        Args:
+            tournament_id (str): Tournament ID.
+            max_workers (int): Number of requests sent concurrently. Defaults to 8.
+
+        Returns:
+            TournamentTree: Tournament tree class.
+        """
+        client = get_client()
+        details = Tournament.get(tournament_id)
+
+        rounds = list(
+            prefetch(details.rounds, lambda url: client.get(url, _round), max_workers)
+        )
+        group_urls = [url for x in rounds for url in x.groups]
+        groups = list(
+            prefetch(group_urls, lambda url: client.get(url, _group), max_workers)
+        )
+        return _tree(details, rounds, groups)
+
+
+class AsyncTournament:
+    """Asynchronous tournament API wrapper.
+
+    Mirrors :class:`Tournament`, returning the same models.
+    """
+
+    @staticmethod
+    async def get(tournament_id: str) -> TournamentDetails:
+        """Get tournament details.
+
+        Args:
+            tournament_id (str): Tournament ID.
+
+        Returns:
+            TournamentDetails: Tournament details class.
+        """
+        api_url = f"{BASE_TOURNAMENT_URL}/{tournament_id}"
+        return await get_async_client().get(api_url, _details)
+
+    @staticmethod
+    async def get_round(
+        tournament_id: str, tournament_round: str
+    ) -> TournamentRoundDetails:
+        """Get tournament round details.
+
+        Args:
+            tournament_id (str): Tournament ID.
+            tournament_round (str): Tournament round.
+
+        Returns:
+            TournamentRoundDetails: Tournament round details class.
+        """
+        api_url = f"{BASE_TOURNAMENT_URL}/{tournament_id}/{tournament_round}"
+        return await get_async_client().get(api_url, _round)
+
+    @staticmethod
+    async def get_round_group(
+        tournament_id: str,
+        tournament_round: str,
+        tournament_group: str,
+    ) -> TournamentRoundGroupDetails:
+        """Get tournament round group details.
+
+        Args:
+            tournament_id (str): Tournament ID.
+            tournament_round (str): Tournament round.
+            tournament_group (str): Tournament group.
+
+        Returns:
+            TournamentRoundGroupDetails: [description]
+        """
+        api_url = f"{BASE_TOURNAMENT_URL}/{tournament_id}/{tournament_round}/{tournament_group}"
+        return await get_async_client().get(api_url, _group)
+
+    @staticmethod
+    async def crawl(
+        tournament_id: str, max_concurrency: int = DEFAULT_CRAWL_WORKERS
+    ) -> TournamentTree:
+        """Get a tournament with all its rounds, groups and games.
+
+        Rounds are fetched concurrently once the tournament is fetched, then the groups of all rounds.
+
+        Args:
+            tournament_id (str): Tournament ID.
+            max_concurrency (int): Number of requests sent concurrently. Defaults to 8.
+
+        Returns:
+            TournamentTree: Tournament tree class.
+        """
+        client = get_async_client()
+        details = await AsyncTournament.get(tournament_id)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(url: str, parse: Any) -> Any:
+            async with semaphore:
+                return await client.get(url, parse)
+
+        rounds = await asyncio.gather(*(fetch(url, _round) for url in details.rounds))
+        groups = await asyncio.gather(
+            *(fetch(url, _group) for x in rounds for url in x.groups)
+        )
+        return _tree(details, rounds, groups)
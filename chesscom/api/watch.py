@@ -0,0 +1,659 @@
+import asyncio
+import heapq
+import re
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ._concurrency import prefetch
+from ._match import LiveMatchDetails
+from ._player import CurrentDailyChess
+from .cache import HOUR, MINUTE
+from .client import get_async_client, get_client
+from .match import BASE_MATCH_URL, DEFAULT_BOARD_WORKERS, _live_match
+from .player import BASE_PLAYER_URL, _current_daily_chess
+
+NEW_GAME = "new_game"
+MOVE = "move"
+DRAW_OFFER = "draw_offer"
+DEADLINE = "deadline"
+GAME_OVER = "game_over"
+ERROR = "error"
+
+DEFAULT_WATCH_RATE = 1.0
+DEFAULT_WATCH_WORKERS = 8
+DEFAULT_LIVE_INTERVAL = 5.0
+
+# Fraction of the time since the last activity on a player's games waited before polling them again.
+_ACTIVITY_FACTOR = 0.5
+
+
+def _is_to_move(game: CurrentDailyChess, username: str) -> bool:
+    player = getattr(game, game.turn, None) or ""
+    return player.rstrip("/").rsplit("/", 1)[-1].lower() == username.lower()
+
+
+class DailyGameEvent(NamedTuple):
+    """Change of a watched player's daily games.
+
+    Args:
+        kind (str): One of ``NEW_GAME``, ``MOVE`` (the FEN changed), ``DRAW_OFFER``, ``DEADLINE`` (the
+            player must move within the watcher's ``deadline``), ``GAME_OVER`` (the game is no longer
+            current) and ``ERROR`` (the games could not be fetched).
+        username (str): Username of the watched player.
+        game (CurrentDailyChess, optional): Game, as last fetched. None for ``ERROR``.
+        previous (CurrentDailyChess, optional): Game at the previous poll, for ``MOVE`` and ``DRAW_OFFER``.
+        error (Exception, optional): Exception raised while fetching the games, for ``ERROR``.
+    """
+
+    kind: str
+    username: str
+    game: Optional[CurrentDailyChess]
+    previous: Optional[CurrentDailyChess] = None
+    error: Optional[Exception] = None
+
+    @property
+    def to_move(self) -> bool:
+        """Whether it is the watched player's turn in the game."""
+        return self.game is not None and _is_to_move(self.game, self.username)
+
+
+class _Account:
+    """Last fetched games and poll schedule of a watched player."""
+
+    def __init__(self, username: str, due: float, interval: float):
+        self.username = username
+        self.games: Dict[str, CurrentDailyChess] = {}
+        self.body: Optional[bytes] = None
+        self.deadlines: Set[Tuple[str, int]] = set()
+        self.due = due
+        self.interval = interval
+
+
+class DailyGamesWatcher:
+    """Polls the current daily games of many players and reports what changed.
+
+    Each player is polled again after half the time elapsed since the last activity on their games,
+    within ``[min_interval, max_interval]``, so that busy players are polled often and idle ones rarely.
+    A player is also polled no later than the earliest ``move_by`` of the games where the opponent is to
+    move, when the game must have changed.
+    Polls of all players share a budget of ``max_rate`` requests per second; players due while the budget
+    is spent wait in order of due time. Deadlines are tracked from the games already fetched and cost no
+    request.
+
+    Games are fetched with the client's conditional requests, so that an unchanged response costs a 304
+    (Not Modified). A response body equal to the previous one is not parsed or compared again. Size the
+    client's :class:`~chesscom.api.cache.ValidatorStore` to the number of watched players for the 304s
+    to hold.
+
+    Args:
+        usernames (Iterable[str]): Players to watch. More can be added with :meth:`add`.
+        min_interval (float): Minimum seconds between polls of a player. Defaults to one minute.
+        max_interval (float): Maximum seconds between polls of a player. Defaults to one hour.
+        deadline (float): Seconds before ``move_by`` at which a ``DEADLINE`` event is reported. Defaults to
+            one hour.
+        max_rate (float): Requests per second shared by all players. Defaults to 1.
+        max_workers (int): Number of players fetched concurrently. Defaults to 8.
+    """
+
+    def __init__(
+        self,
+        usernames: Iterable[str] = (),
+        min_interval: float = MINUTE,
+        max_interval: float = HOUR,
+        deadline: float = HOUR,
+        max_rate: float = DEFAULT_WATCH_RATE,
+        max_workers: int = DEFAULT_WATCH_WORKERS,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.deadline = deadline
+        self.max_rate = max_rate
+        self.max_workers = max_workers
+        self._accounts: Dict[str, _Account] = {}
+        self._queue: List[Tuple[float, str]] = []
+        self._deadlines: List[Tuple[float, str, str, int]] = []
+        self._tokens = float(max_workers)
+        self._refilled = time.time()
+        for username in usernames:
+            self.add(username)
+
+    def add(self, username: str) -> None:
+        """Start watching a player, polling them as soon as the budget allows.
+
+        Args:
+            username (str): Username.
+        """
+        key = username.lower()
+        if key not in self._accounts:
+            self._accounts[key] = _Account(username, 0.0, self.min_interval)
+            heapq.heappush(self._queue, (0.0, key))
+
+    def remove(self, username: str) -> None:
+        """Stop watching a player.
+
+        Args:
+            username (str): Username.
+        """
+        self._accounts.pop(username.lower(), None)
+
+    def games(self, username: str) -> List[CurrentDailyChess]:
+        """Get the current daily games of a watched player, as last fetched.
+
+        Args:
+            username (str): Username, in any case.
+
+        Returns:
+            List[CurrentDailyChess]: Games.
+        """
+        return list(self._accounts[username.lower()].games.values())
+
+    def update(
+        self,
+        username: str,
+        games: Union[List[CurrentDailyChess], Exception],
+        now: float = None,
+    ) -> List[DailyGameEvent]:
+        """Compare the current daily games of a watched player with the previous ones and reschedule them.
+
+        Called by :meth:`poll` with each changed response; can also be fed games fetched elsewhere.
+
+        Args:
+            username (str): Username.
+            games (Union[List[CurrentDailyChess], Exception]): Current daily games, or the exception
+                raised while fetching them.
+            now (float, optional): Current timestamp. Defaults to ``time.time()``.
+
+        Returns:
+            List[DailyGameEvent]: Changes since the previous games.
+        """
+        now = time.time() if now is None else now
+        key = username.lower()
+        account = self._accounts[key]
+        if isinstance(games, Exception):
+            self._schedule(account, now, 2 * account.interval)
+            return [DailyGameEvent(ERROR, account.username, None, error=games)]
+
+        events = []
+        current = {game.url: game for game in games}
+        for url, game in current.items():
+            previous = account.games.get(url)
+            if previous is None:
+                events.append(DailyGameEvent(NEW_GAME, account.username, game))
+            elif game.fen != previous.fen:
+                events.append(DailyGameEvent(MOVE, account.username, game, previous))
+            if game.draw_offer and (
+                previous is None or game.draw_offer != previous.draw_offer
+            ):
+                events.append(
+                    DailyGameEvent(DRAW_OFFER, account.username, game, previous)
+                )
+            deadline = (url, game.move_by)
+            if game.move_by and deadline not in account.deadlines:
+                if _is_to_move(game, account.username):
+                    account.deadlines.add(deadline)
+                    warn_at = game.move_by - self.deadline
+                    heapq.heappush(self._deadlines, (warn_at, key, url, game.move_by))
+        for url, game in account.games.items():
+            if url not in current:
+                events.append(DailyGameEvent(GAME_OVER, account.username, game))
+
+        account.games = current
+        account.body = None
+        account.deadlines = {x for x in account.deadlines if x[0] in current}
+        self._schedule(account, now, self._interval(account, now))
+        return events
+
+    def _receive(
+        self, username: str, body: Union[bytes, Exception], decode: Callable
+    ) -> List[DailyGameEvent]:
+        now = time.time()
+        account = self._accounts[username.lower()]
+        if isinstance(body, Exception):
+            return self.update(username, body, now)
+        if body == account.body:
+            self._schedule(account, now, self._interval(account, now))
+            return []
+        try:
+            games = decode(body, _current_daily_chess)
+        except Exception as e:
+            return self.update(username, e, now)
+        events = self.update(username, games, now)
+        account.body = body
+        return events
+
+    def _interval(self, account: _Account, now: float) -> float:
+        games = account.games.values()
+        if not games:
+            return self.max_interval
+        idle = now - max(game.last_activity for game in games)
+        interval = idle * _ACTIVITY_FACTOR
+        for game in games:
+            # The opponent moves or loses on time by move_by.
+            if game.move_by and not _is_to_move(game, account.username):
+                interval = min(interval, game.move_by - now)
+        return interval
+
+    def _schedule(self, account: _Account, now: float, interval: float) -> None:
+        account.interval = min(self.max_interval, max(self.min_interval, interval))
+        account.due = now + account.interval
+        heapq.heappush(self._queue, (account.due, account.username.lower()))
+
+    def _due(self, now: float) -> List[str]:
+        self._tokens = min(
+            float(self.max_workers),
+            self._tokens + (now - self._refilled) * self.max_rate,
+        )
+        self._refilled = now
+        usernames = []
+        while self._queue and self._queue[0][0] <= now and self._tokens >= 1:
+            due, key = heapq.heappop(self._queue)
+            account = self._accounts.get(key)
+            # Entries of removed or rescheduled players are left in the queue and skipped.
+            if account is None or account.due != due:
+                continue
+            account.due = None
+            self._tokens -= 1
+            usernames.append(account.username)
+        return usernames
+
+    def _expired(self, now: float) -> List[DailyGameEvent]:
+        events = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, key, url, move_by = heapq.heappop(self._deadlines)
+            account = self._accounts.get(key)
+            game = None if account is None else account.games.get(url)
+            if game is not None and game.move_by == move_by:
+                events.append(DailyGameEvent(DEADLINE, account.username, game))
+        return events
+
+    def next_poll(self) -> float:
+        """Get when :meth:`poll` next has something to do.
+
+        Returns:
+            float: Timestamp of the next due player or deadline, taking the request budget into account.
+        """
+        wake = time.time() + self.min_interval
+        if self._queue:
+            wake = self._queue[0][0]
+            if self._tokens < 1:
+                wake = max(wake, self._refilled + (1 - self._tokens) / self.max_rate)
+        if self._deadlines:
+            wake = min(wake, self._deadlines[0][0])
+        return wake
+
+    def poll(self) -> List[DailyGameEvent]:
+        """Poll the players that are due, within the request budget, and report what changed.
+
+        Returns:
+            List[DailyGameEvent]: Changes since the previous poll.
+        """
+        now = time.time()
+        usernames = self._due(now)
+        client = get_client()
+
+        def fetch(url: str) -> Union[bytes, Exception]:
+            try:
+                return client.fetch(url)
+            except Exception as e:
+                return e
+
+        api_urls = [f"{BASE_PLAYER_URL}/{username}/games" for username in usernames]
+        events = []
+        for username, body in zip(
+            usernames, prefetch(api_urls, fetch, self.max_workers)
+        ):
+            if username.lower() in self._accounts:
+                events += self._receive(username, body, client.decode)
+        return events + self._expired(time.time())
+
+    def watch(self) -> Iterator[DailyGameEvent]:
+        """Poll the players forever, sleeping until something is due.
+
+        Yields:
+            DailyGameEvent: Change of a watched player's daily games.
+        """
+        while True:
+            yield from self.poll()
+            time.sleep(max(0.0, self.next_poll() - time.time()))
+
+    def __contains__(self, username: str) -> bool:
+        return username.lower() in self._accounts
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+
+class AsyncDailyGamesWatcher(DailyGamesWatcher):
+    """Polls the current daily games of many players and reports what changed, for use with ``asyncio``.
+
+    Takes the same arguments as :class:`DailyGamesWatcher`; ``max_workers`` bounds the number of
+    requests in flight.
+    """
+
+    async def poll(self) -> List[DailyGameEvent]:
+        """Poll the players that are due, within the request budget, and report what changed.
+
+        Returns:
+            List[DailyGameEvent]: Changes since the previous poll.
+        """
+        now = time.time()
+        usernames = self._due(now)
+        client = get_async_client()
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(username: str) -> Union[bytes, Exception]:
+            async with semaphore:
+                api_url = f"{BASE_PLAYER_URL}/{username}/games"
+                try:
+                    return await client.fetch(api_url)
+                except Exception as e:
+                    return e
+
+        results = await asyncio.gather(*(fetch(username) for username in usernames))
+        events = []
+        for username, body in zip(usernames, results):
+            if username.lower() in self._accounts:
+                events += self._receive(username, body, client.decode)
+        return events + self._expired(time.time())
+
+    async def watch(self) -> AsyncIterator[DailyGameEvent]:
+        """Poll the players forever, sleeping until something is due.
+
+        Yields:
+            DailyGameEvent: Change of a watched player's daily games.
+        """
+        while True:
+            for event in await self.poll():
+                yield event
+            await asyncio.sleep(max(0.0, self.next_poll() - time.time()))
+
+
+class GameDelta(NamedTuple):
+    """Changes of a game of a live match board since the previous poll.
+
+    Args:
+        url (str): URL of the game.
+        fen (str): Current FEN.
+        ply (int): Number of half-moves before ``moves``; 0 with all moves if the game is new or its
+            moves were replaced.
+        moves (List[str]): Moves played since the previous poll, in SAN.
+        white_result (str, optional): Result of the white player, if the game is finished.
+        black_result (str, optional): Result of the black player, if the game is finished.
+        result_changed (bool): Whether the results changed since the previous poll.
+    """
+
+    url: str
+    fen: str
+    ply: int
+    moves: List[str]
+    white_result: Optional[str]
+    black_result: Optional[str]
+    result_changed: bool
+
+
+class BoardDelta(NamedTuple):
+    """Changes of a live match board since the previous poll.
+
+    Args:
+        board (int): Board number, from 1.
+        games (List[GameDelta]): Games that changed.
+        scores (Dict[str, float], optional): Board scores by username, if they changed.
+    """
+
+    board: int
+    games: List[GameDelta]
+    scores: Optional[Dict[str, float]]
+
+
+_MOVETEXT_NOISE = re.compile(r"\{[^}]*\}|\([^)]*\)|\$\d+|\d+\.(?:\.\.)?")
+_GAME_RESULTS = {"1-0", "0-1", "1/2-1/2", "*"}
+
+
+def _moves(pgn: Optional[str]) -> List[str]:
+    if not pgn:
+        return []
+    # Tag pairs end at the first blank line; the move text follows.
+    movetext = pgn.split("\n\n", 1)[-1]
+    return [
+        x for x in _MOVETEXT_NOISE.sub(" ", movetext).split() if x not in _GAME_RESULTS
+    ]
+
+
+class _GameState:
+    """Last polled state of a game of a live match board."""
+
+    def __init__(self):
+        self.fen = None
+        self.pgn = None
+        self.moves: List[str] = []
+        self.results: Tuple[Optional[str], Optional[str]] = (None, None)
+
+    def update(self, game: Dict[str, Any]) -> Optional[GameDelta]:
+        results = (game["white"].get("result"), game["black"].get("result"))
+        pgn = game.get("pgn")
+        if game["fen"] == self.fen and pgn == self.pgn and results == self.results:
+            return None
+
+        ply, moves = len(self.moves), []
+        if pgn != self.pgn:
+            current = _moves(pgn)
+            if current[:ply] != self.moves:
+                ply = 0
+            moves = current[ply:]
+            self.moves = current
+        delta = GameDelta(
+            game["url"],
+            game["fen"],
+            ply,
+            moves,
+            *results,
+            results != self.results,
+        )
+        self.fen, self.pgn, self.results = game["fen"], pgn, results
+        return delta
+
+
+class LiveMatchTracker:
+    """Polls all boards of a live match and reports what changed on each board.
+
+    Boards are polled concurrently every ``interval`` seconds and compared with the previous poll, so
+    that only new moves, result changes and score changes are reported. Responses are compared as
+    decoded JSON, without building models, and boards whose response body is unchanged since the
+    previous poll (e.g. answered with 304 Not Modified) are skipped without being decoded.
+
+    Subscribers are called with the changes of each board as they are found; the same changes are
+    returned by :meth:`poll` and yielded by :meth:`watch`.
+
+    Args:
+        live_match_id (str): Live match ID.
+        interval (float): Seconds between the starts of two polls. Defaults to 5.
+        max_workers (int): Number of boards fetched concurrently. Defaults to 8.
+    """
+
+    def __init__(
+        self,
+        live_match_id: str,
+        interval: float = DEFAULT_LIVE_INTERVAL,
+        max_workers: int = DEFAULT_BOARD_WORKERS,
+    ):
+        self.live_match_id = live_match_id
+        self.interval = interval
+        self.max_workers = max_workers
+        self.details: Optional[LiveMatchDetails] = None
+        self._subscribers: List[Callable[[BoardDelta], Any]] = []
+        self._members: Dict[str, int] = {}
+        self._bodies: Dict[int, bytes] = {}
+        self._scores: Dict[int, Dict[str, float]] = {}
+        self._games: Dict[int, Dict[str, _GameState]] = {}
+
+    def subscribe(self, callback: Callable[[BoardDelta], Any]) -> None:
+        """Call a function with the changes of each board found by the next polls.
+
+        Args:
+            callback (Callable[[BoardDelta], Any]): Function called with each board's changes.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[BoardDelta], Any]) -> None:
+        """Stop calling a subscribed function.
+
+        Args:
+            callback (Callable[[BoardDelta], Any]): Subscribed function.
+        """
+        self._subscribers.remove(callback)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the match was finished at the last poll."""
+        return self.details is not None and self.details.status == "finished"
+
+    def scores(self) -> Tuple[float, float]:
+        """Get the scores of team 1 and team 2, summed over the board scores of the last poll.
+
+        Returns:
+            Tuple[float, float]: Scores of team 1 and team 2.
+        """
+        totals = [0.0, 0.0]
+        for scores in self._scores.values():
+            for username, score in scores.items():
+                i = self._members.get(username.lower())
+                if i is not None:
+                    totals[i] += score
+        return totals[0], totals[1]
+
+    def _board_urls(self, details: LiveMatchDetails) -> List[str]:
+        self.details = details
+        teams = (details.teams.team1, details.teams.team2)
+        self._members = {
+            player.username.lower(): i
+            for i, team in enumerate(teams)
+            for player in team.players
+        }
+        return [
+            f"{BASE_MATCH_URL}/live/{self.live_match_id}/{i + 1}"
+            for i in range(details.boards)
+        ]
+
+    def update(self, board: int, response: Dict[str, Any]) -> Optional[BoardDelta]:
+        """Compare a board with its previous state and notify subscribers of the changes.
+
+        Called by :meth:`poll` with each changed response; can also be fed boards fetched elsewhere.
+
+        Args:
+            board (int): Board number, from 1.
+            response (Dict[str, Any]): Decoded JSON response of the board endpoint.
+
+        Returns:
+            Optional[BoardDelta]: Changes of the board, or None if it is unchanged.
+        """
+        self._bodies.pop(board, None)
+        games = self._games.setdefault(board, {})
+        deltas = []
+        for game in response["games"]:
+            state = games.get(game["url"])
+            if state is None:
+                state = games[game["url"]] = _GameState()
+            delta = state.update(game)
+            if delta is not None:
+                deltas.append(delta)
+        scores = response["board_scores"]
+        if scores == self._scores.get(board):
+            scores = None
+        else:
+            self._scores[board] = scores
+        if not deltas and scores is None:
+            return None
+
+        delta = BoardDelta(board, deltas, scores)
+        for callback in list(self._subscribers):
+            callback(delta)
+        return delta
+
+    def _updates(self, bodies: Iterable[bytes], decode: Callable) -> List[BoardDelta]:
+        deltas = []
+        for board, body in enumerate(bodies, 1):
+            if body == self._bodies.get(board):
+                continue
+            delta = self.update(board, decode(body))
+            self._bodies[board] = body
+            if delta is not None:
+                deltas.append(delta)
+        return deltas
+
+    def poll(self) -> List[BoardDelta]:
+        """Poll the match and all its boards once.
+
+        Returns:
+            List[BoardDelta]: Changes of the boards that changed since the previous poll.
+        """
+        client = get_client()
+        api_url = f"{BASE_MATCH_URL}/live/{self.live_match_id}"
+        api_urls = self._board_urls(client.get(api_url, _live_match))
+        bodies = prefetch(api_urls, client.fetch, self.max_workers)
+        return self._updates(bodies, client.decode)
+
+    def watch(self) -> Iterator[BoardDelta]:
+        """Poll the match every ``interval`` seconds until it is finished.
+
+        Yields:
+            BoardDelta: Changes of a board.
+        """
+        while True:
+            start = time.time()
+            yield from self.poll()
+            if self.finished:
+                return
+            time.sleep(max(0.0, start + self.interval - time.time()))
+
+
+class AsyncLiveMatchTracker(LiveMatchTracker):
+    """Polls all boards of a live match and reports what changed on each board, for use with ``asyncio``.
+
+    Takes the same arguments as :class:`LiveMatchTracker`; ``max_workers`` bounds the number of requests
+    in flight.
+    """
+
+    async def poll(self) -> List[BoardDelta]:
+        """Poll the match and all its boards once.
+
+        Returns:
+            List[BoardDelta]: Changes of the boards that changed since the previous poll.
+        """
+        client = get_async_client()
+        api_url = f"{BASE_MATCH_URL}/live/{self.live_match_id}"
+        api_urls = self._board_urls(await client.get(api_url, _live_match))
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(url: str) -> bytes:
+            async with semaphore:
+                return await client.fetch(url)
+
+        bodies = await asyncio.gather(*(fetch(url) for url in api_urls))
+        return self._updates(bodies, client.decode)
+
+    async def watch(self) -> AsyncIterator[BoardDelta]:
+        """Poll the match every ``interval`` seconds until it is finished.
+
+        Yields:
+            BoardDelta: Changes of a board.
+        """
+        while True:
+            start = time.time()
+            for delta in await self.poll():
+                yield delta
+            if self.finished:
+                return
+            await asyncio.sleep(max(0.0, start + self.interval - time.time()))
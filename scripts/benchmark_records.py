@@ -0,0 +1,88 @@
+"""Benchmark the memory held by archived games as models and as compact records.
+
+Usage:
+    python scripts/benchmark_records.py [--games N]
+"""
+
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+
+from chesscom.api._player import MonthlyArchive
+from chesscom.api._records import GameRecord
+
+ECO = [f"https://www.chess.com/openings/Opening-{i}" for i in range(50)]
+MOVES = " ".join(
+    f"{i}. e4 {{[%clk 0:00:59.9]}} {i}... e5 {{[%clk 0:00:59.9]}}" for i in range(1, 41)
+)
+
+
+def player(username: str, rating: int, result: str) -> dict:
+    return {
+        "rating": rating,
+        "result": result,
+        "@id": f"https://api.chess.com/pub/player/{username.lower()}",
+        "username": username,
+    }
+
+
+def games_payload(n: int) -> str:
+    random.seed(0)
+    games = []
+    for i in range(n):
+        opponent = f"Opponent{random.randrange(n // 4 + 1)}"
+        owner, other = player("Erik", 1500, "win"), player(opponent, 1480, "resigned")
+        white, black = (owner, other) if i % 2 else (other, owner)
+        games.append(
+            {
+                "url": f"https://www.chess.com/game/live/{10**10 + i}",
+                "pgn": f'[Event "Live Chess"]\n[White "{white["username"]}"]\n\n{MOVES} 1-0\n',
+                "time_control": "60",
+                "end_time": 1588291200 + i,
+                "rated": True,
+                "fen": "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq -",
+                "time_class": "bullet",
+                "rules": "chess",
+                "eco": random.choice(ECO),
+                "white": white,
+                "black": black,
+            }
+        )
+    return json.dumps({"games": games})
+
+
+def measure(build, payload: str) -> int:
+    gc.collect()
+    tracemalloc.start()
+    games = build(json.loads(payload)["games"])
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del games
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=20000)
+    args = parser.parse_args()
+
+    payload = games_payload(args.games)
+    pgn_size = sum(len(x["pgn"]) + 49 for x in json.loads(payload)["games"])
+    model_size = measure(lambda games: [MonthlyArchive(**x) for x in games], payload)
+    record_size = measure(
+        lambda games: [GameRecord.from_response(x) for x in games], payload
+    )
+
+    for name, size in (("MonthlyArchive", model_size), ("GameRecord", record_size)):
+        print(
+            f"{name:<16} {size / args.games:8.0f} B/game  "
+            f"{(size - pgn_size) / args.games:8.0f} B/game excluding PGN"
+        )
+    print(f"Saved {(model_size - record_size) / args.games:.0f} B/game")
+
+
+if __name__ == "__main__":
+    main()
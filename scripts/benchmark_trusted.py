@@ -0,0 +1,110 @@
+"""Benchmark building models with and without validation.
+
+Leaderboard boards are built lazily, so building one board is much cheaper than building all. The
+cases measure building alone: serializing (e.g. ``.dict()``) is not sped up by trusted mode.
+
+Usage:
+    python scripts/benchmark_trusted.py [--games N] [--repeat N]
+"""
+
+import argparse
+import json
+import time
+
+from chesscom.api._leaderboards import AVAILABLE_LEADERBOARDS, LeaderboardDetails
+from chesscom.api._player import MonthlyArchive
+from chesscom.api.client import trusted
+
+PLAYER = {"rating": 1500, "result": "win", "@id": "https://api.chess.com/pub/player/"}
+GAME = {
+    "url": "https://www.chess.com/game/live/",
+    "pgn": '[Event "Live Chess"]\n\n1. e4 e5 1-0\n',
+    "time_control": "60",
+    "end_time": 1588291200,
+    "rated": True,
+    "fen": "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq -",
+    "time_class": "bullet",
+    "rules": "chess",
+}
+LEADERBOARD_PLAYER = {
+    "player_id": 1,
+    "@id": "https://api.chess.com/pub/player/",
+    "url": "https://www.chess.com/member/",
+    "username": "",
+    "score": 3000,
+    "rank": 1,
+    "country": "https://api.chess.com/pub/country/US",
+    "status": "premium",
+    "avatar": "https://images.chesscomfiles.com/",
+    "trend_score": {"direction": 1, "delta": 10},
+    "trend_rank": {"direction": 0, "delta": 0},
+    "flair_code": "nothing",
+}
+
+
+def games_payload(n: int) -> str:
+    games = []
+    for i in range(n):
+        white = dict(PLAYER, username=f"white{i}", result="win")
+        black = dict(PLAYER, username=f"black{i}", result="resigned")
+        white["@id"] += white["username"]
+        black["@id"] += black["username"]
+        games.append(dict(GAME, url=f"{GAME['url']}{i}", white=white, black=black))
+    return json.dumps(games)
+
+
+def leaderboards_payload() -> str:
+    players = [dict(LEADERBOARD_PLAYER, username=f"p{i}", rank=i) for i in range(50)]
+    return json.dumps({board: players for board in AVAILABLE_LEADERBOARDS})
+
+
+def all_boards(data: dict) -> list:
+    details = LeaderboardDetails(**data)
+    return [getattr(details, board) for board in AVAILABLE_LEADERBOARDS]
+
+
+def bench(build, payload: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        data = json.loads(payload)
+        start = time.perf_counter()
+        build(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        (
+            f"MonthlyArchive x {args.games}",
+            lambda data: [MonthlyArchive(**x) for x in data],
+            games_payload(args.games),
+        ),
+        (
+            "LeaderboardDetails, 1 board",
+            lambda data: LeaderboardDetails(**data).live_blitz,
+            leaderboards_payload(),
+        ),
+        (
+            "LeaderboardDetails, all",
+            all_boards,
+            leaderboards_payload(),
+        ),
+    ]
+    for name, build, payload in cases:
+        validated = bench(build, payload, args.repeat)
+        with trusted():
+            fast = bench(build, payload, args.repeat)
+        print(
+            f"{name:<28} validated {validated * 1000:8.1f} ms  "
+            f"trusted {fast * 1000:8.1f} ms  speedup {validated / fast:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
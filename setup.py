@@ -25,6 +25,17 @@ setup(
     keywords=["chess", "chess.com", "api"],
     install_requires=requirements,
     extras_require={
-        "dev": requirements + ["black==21.5b1", "isort==4.3.0", "pytest_cov==2.12.0"]
+        "async": ["aiohttp>=3.7"],
+        "arrow": ["pyarrow>=4.0"],
+        "fast": ["orjson>=3.5"],
+        "dev": requirements
+        + [
+            "aiohttp>=3.7",
+            "pyarrow>=4.0",
+            "orjson>=3.5",
+            "black==21.5b1",
+            "isort==4.3.0",
+            "pytest_cov==2.12.0",
+        ],
     },
 )
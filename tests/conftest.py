@@ -1,4 +1,51 @@
+import io
+import json
+import zlib
+from typing import Any, Dict, Iterator, List, Optional
+
 import pytest
+import requests
+
+from chesscom.api.client import Client, get_client, set_client
+
+
+class FakeSession:
+    """Session serving JSON bodies by URL with an ETag, answering 304 to matching revalidations.
+
+    Requests to a URL in ``throttled`` are first answered 429, once per listed ``Retry-After`` value (None
+    to send no header).
+    """
+
+    def __init__(self):
+        self.bodies: Dict[str, Any] = {}
+        self.throttled: Dict[str, List[Optional[str]]] = {}
+        self.requests = 0
+        self.not_modified = 0
+
+    def get(self, url: str, headers: Dict[str, str] = None, **kwargs: Any):
+        self.requests += 1
+        response = requests.Response()
+        response.url = url
+        response.raw = io.BytesIO()
+        if self.throttled.get(url):
+            retry_after = self.throttled[url].pop(0)
+            if retry_after is not None:
+                response.headers["Retry-After"] = retry_after
+            response.status_code, response._content = 429, b""
+            return response
+
+        body = json.dumps(self.bodies[url]).encode()
+        etag = f'"{zlib.crc32(body)}"'
+        response.headers["ETag"] = etag
+        if headers and headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            response.status_code, response._content = 304, b""
+        else:
+            response.status_code, response._content = 200, body
+        return response
+
+    def close(self) -> None:
+        pass
 
 
 @pytest.fixture
@@ -54,3 +101,15 @@ def board() -> int:
 @pytest.fixture
 def country_alpha_2() -> str:
     return "AU"
+
+
+@pytest.fixture
+def fake_session() -> Iterator[FakeSession]:
+    default_client = get_client()
+    client = Client()
+    client.session = FakeSession()
+    set_client(client)
+    try:
+        yield client.session
+    finally:
+        set_client(default_client)
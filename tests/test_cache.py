@@ -0,0 +1,89 @@
+import time
+
+import pytest
+
+from chesscom.api.cache import (
+    IMMUTABLE,
+    BaseCache,
+    CacheEntry,
+    CachePolicy,
+    MemoryCache,
+    SQLiteCache,
+    ValidatorStore,
+)
+
+
+class TestValidatorStore:
+    @staticmethod
+    def test_put_get():
+        store = ValidatorStore(maxsize=2)
+        store.put("a", '"1"', None, b"1")
+        store.put("b", None, "Wed, 21 Oct 2015 07:28:00 GMT", b"2")
+        store.put("c", None, None, b"3")
+        assert store.get("a").headers() == {"If-None-Match": '"1"'}
+        assert store.get("c") is None
+
+        store.put("c", '"3"', None, b"3")
+        assert store.get("b") is None
+        assert store.get("c").body == b"3"
+
+    @staticmethod
+    def test_max_bytes():
+        store = ValidatorStore(max_bytes=4)
+        store.put("a", '"1"', None, b"11")
+        store.put("b", '"2"', None, b"22")
+        store.put("c", '"3"', None, b"33")
+        assert store.get("a") is None and store.size == 4
+        store.put("d", '"4"', None, b"44444")
+        assert store.get("d") is None and len(store) == 2
+
+
+class TestCachePolicy:
+    @staticmethod
+    def test_ttl(username, club_id):
+        policy = CachePolicy()
+        base_url = "https://api.chess.com/pub"
+        assert policy.ttl(f"{base_url}/club/{club_id}/members") == 12 * 60 * 60
+        assert policy.ttl(f"{base_url}/streamers") == 5 * 60
+        assert policy.ttl(f"{base_url}/player/{username}/games/2020/05") == IMMUTABLE
+        assert (
+            policy.ttl(f"{base_url}/player/{username}/games/2020/05/pgn") == IMMUTABLE
+        )
+        assert policy.ttl(f"{base_url}/player/{username}") is None
+
+
+class TestBaseCache:
+    @staticmethod
+    def test_incomplete_backend():
+        class GetOnlyCache(BaseCache):
+            def get(self, url):
+                return None
+
+        with pytest.raises(TypeError):
+            GetOnlyCache()
+
+
+class TestMemoryCache:
+    @staticmethod
+    def test_eviction():
+        cache = MemoryCache(maxsize=10)
+        cache.set("a", CacheEntry(b"12345", None, None, IMMUTABLE))
+        cache.set("b", CacheEntry(b"12345", None, None, IMMUTABLE))
+        cache.get("a")
+        cache.set("c", CacheEntry(b"1", None, None, IMMUTABLE))
+        assert cache.get("b") is None
+        assert cache.get("a").is_fresh()
+        assert cache.size == 6
+
+
+class TestSQLiteCache:
+    @staticmethod
+    def test_set_get(tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite"))
+        cache.set("a", CacheEntry(b"{}", '"1"', None, IMMUTABLE))
+        cache.set("b", CacheEntry(b"{}", None, None, time.time() - 1))
+        assert cache.get("a") == CacheEntry(b"{}", '"1"', None, IMMUTABLE)
+        assert not cache.get("b").is_fresh()
+        cache.delete("a")
+        assert cache.get("a") is None
+        cache.close()
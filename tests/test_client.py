@@ -0,0 +1,160 @@
+import asyncio
+import json
+from copy import deepcopy
+
+import pytest
+from pydantic import ValidationError
+
+from chesscom.api._base import _trusted
+from chesscom.api._concurrency import prefetch
+from chesscom.api._player import MonthlyArchive
+from chesscom.api.cache import ValidatorStore
+from chesscom.api.client import (
+    AsyncClient,
+    Client,
+    get_client,
+    set_client,
+    trusted,
+)
+from chesscom.api.player import Player
+
+
+class TestClient:
+    @staticmethod
+    def test_get(username):
+        with Client(pool_maxsize=2, timeout=10) as client:
+            client.get(f"https://api.chess.com/pub/player/{username}")
+
+    @staticmethod
+    def test_set_client(username):
+        default_client = get_client()
+        client = Client(headers={"User-Agent": "chesscom-tests"})
+        set_client(client)
+        try:
+            assert get_client() is client
+            Player.profile(username)
+        finally:
+            set_client(default_client)
+
+    @staticmethod
+    def test_conditional_get(country_alpha_2):
+        with Client() as client:
+            api_url = f"https://api.chess.com/pub/country/{country_alpha_2}/players"
+            players = client.get(api_url, lambda response: response["players"])
+            assert client.get(api_url, lambda response: response["players"]) == players
+
+    @staticmethod
+    def test_trusted_client(username, month, year):
+        default_client = get_client()
+        set_client(Client(trusted=True))
+        try:
+            trusted_games = Player.monthly_archive(username, year=year, month=month)
+        finally:
+            set_client(default_client)
+        games = Player.monthly_archive(username, year=year, month=month)
+        assert [x.url for x in trusted_games] == [x.url for x in games]
+
+    @staticmethod
+    def test_loads(username):
+        api_url = f"https://api.chess.com/pub/player/{username}"
+        with Client(loads=json.loads) as client, Client() as default_client:
+            assert client.get(api_url) == default_client.get(api_url)
+
+
+class TestAsyncClient:
+    @staticmethod
+    def test_session_per_loop():
+        client = AsyncClient()
+        asyncio.run(client._ensure_session())
+        session = client.session
+        asyncio.run(client._ensure_session())
+        assert session.closed and not client.session.closed
+        asyncio.run(client.close())
+
+
+class TestConditional:
+    @staticmethod
+    def test_parsers(fake_session):
+        api_url = "https://api.chess.com/pub/player/erik"
+        fake_session.bodies[api_url] = {"username": "erik"}
+        client = get_client()
+        assert client.get(api_url, lambda response: response["username"]) == "erik"
+        assert client.get(api_url, lambda response: len(response)) == 1
+        assert client.get(api_url) == {"username": "erik"}
+        assert fake_session.not_modified == 2
+
+    @staticmethod
+    def test_parsed_values(fake_session):
+        api_url = "https://api.chess.com/pub/player/erik/games/2025/10"
+        fake_session.bodies[api_url] = {"games": []}
+        client = get_client()
+        calls = []
+
+        def parse(response):
+            calls.append(response)
+            return list(response["games"])
+
+        games = client.get(api_url, parse)
+        assert client.get(api_url, parse) is games
+        assert client.get(api_url, lambda response: response["games"]) == []
+        assert fake_session.not_modified == 2 and len(calls) == 1
+
+        fake_session.bodies[api_url] = {"games": [1]}
+        assert client.get(api_url, parse) == [1]
+        assert client.get(api_url, parse) == [1]
+        assert len(calls) == 2
+
+    @staticmethod
+    def test_large_body(fake_session):
+        api_url = "https://api.chess.com/pub/country/US/players"
+        players = [f"player-{i}" for i in range(10**6)]
+        fake_session.bodies[api_url] = {"players": players}
+        client = get_client()
+        assert len(client.get(api_url)["players"]) == len(players)
+        assert len(client.validators.get(api_url).body) > 16 * 2**20
+        assert client.get(api_url, lambda response: response["players"]) == players
+        assert fake_session.not_modified == 1
+
+    @staticmethod
+    def test_max_bytes(fake_session):
+        api_url = "https://api.chess.com/pub/player/erik"
+        fake_session.bodies[api_url] = {"username": "erik"}
+        client = get_client()
+        client.validators = ValidatorStore(max_bytes=8)
+        client.get(api_url)
+        client.get(api_url)
+        assert fake_session.not_modified == 0
+
+
+class TestTrusted:
+    @staticmethod
+    def test_trusted(username):
+        game = {
+            "white": {"@id": "a", "username": username, "rating": 1, "result": "win"},
+            "black": {"@id": "b", "username": "b", "rating": 1, "result": "resigned"},
+            "url": "https://www.chess.com/game/live/1",
+            "fen": "8/8/8/8/8/8/8/8 w - -",
+            "pgn": "1. e4 *",
+            "end_time": 1588291200,
+            "time_control": "60",
+            "rules": "chess",
+            "time_class": "bullet",
+        }
+        validated = MonthlyArchive(**deepcopy(game))
+        with trusted():
+            fast = MonthlyArchive(**deepcopy(game))
+        assert fast == validated
+        assert fast.white.username == username
+        assert MonthlyArchive(**deepcopy(game)).white.rating == 1
+
+        with pytest.raises(ValidationError):
+            MonthlyArchive(**dict(game, end_time="never"))
+
+    @staticmethod
+    def test_worker_threads():
+        with trusted():
+            assert (
+                list(prefetch(["a", "b", "c"], lambda url: _trusted.get(), 2))
+                == [True] * 3
+            )
+        assert list(prefetch(["a"], lambda url: _trusted.get(), 2)) == [False]
@@ -1,4 +1,6 @@
-from chesscom.api.clubs import Club
+import asyncio
+
+from chesscom.api.clubs import AsyncClub, Club, MembershipIndex
 
 
 class TestClub:
@@ -10,6 +12,95 @@ class TestClub:
     def test_members(club_id):
         Club.members(club_id)
 
+    @staticmethod
+    def test_iter_members(club_id):
+        members = Club.members(club_id)
+        usernames = [x.username for x in Club.iter_members(club_id, ["all_time"])]
+        assert usernames == [x.username for x in members.all_time]
+
+    @staticmethod
+    def test_membership_index(club_id):
+        members = Club.members(club_id)
+        index = Club.membership_index([club_id])
+        usernames = {
+            x.username for x in members.weekly + members.monthly + members.all_time
+        }
+        assert set(index.members(club_id)) == usernames
+
+    @staticmethod
+    def test_membership_index_after_members(fake_session, club_id):
+        url = f"https://api.chess.com/pub/club/{club_id}/members"
+        fake_session.bodies[url] = {
+            "weekly": [{"username": "erik", "joined": 2}],
+            "monthly": [],
+            "all_time": [{"username": "hikaru", "joined": 1}],
+        }
+
+        members = Club.members(club_id)
+        index = Club.membership_index([club_id])
+        assert fake_session.not_modified == 1
+        assert members.weekly[0].username == "erik"
+        assert sorted(index.members(club_id)) == ["erik", "hikaru"]
+        assert index.clubs_of("ERIK") == [club_id]
+
     @staticmethod
     def test_matches(club_id):
         Club.matches(club_id)
+
+
+class TestAsyncClub:
+    @staticmethod
+    def test_details(club_id):
+        asyncio.run(AsyncClub.details(club_id))
+
+    @staticmethod
+    def test_members(club_id):
+        asyncio.run(AsyncClub.members(club_id))
+
+    @staticmethod
+    def test_iter_members(club_id):
+        async def iter_members():
+            return [x async for x in AsyncClub.iter_members(club_id)]
+
+        members = asyncio.run(iter_members())
+        assert all(isinstance(x.username, str) for x in members)
+
+    @staticmethod
+    def test_membership_index(club_id):
+        index = asyncio.run(AsyncClub.membership_index([club_id]))
+        assert club_id in index
+
+    @staticmethod
+    def test_matches(club_id):
+        asyncio.run(AsyncClub.matches(club_id))
+
+
+class TestMembershipIndex:
+    @staticmethod
+    def test_queries():
+        index = MembershipIndex()
+        index.add("a", ["erik", "Hikaru", "magnus"])
+        index.add("b", ["hikaru", "fabiano"])
+        index.add("c", ["Erik", "hikaru", "ding"])
+        assert index.intersection("a", "b", "c") == ["Hikaru"]
+        assert index.intersection("a") == ["erik", "Hikaru", "magnus"]
+        assert index.intersection() == index.union() == []
+        assert sorted(index.union("a", "b")) == ["Hikaru", "erik", "fabiano", "magnus"]
+        assert index.difference("a", "b", "c") == ["magnus"]
+        assert index.clubs_of("HIKARU") == ["a", "b", "c"]
+        assert index.overlap(["a", "b", "c"]).tolist() == [
+            [3, 1, 2],
+            [1, 2, 1],
+            [2, 1, 3],
+        ]
+
+    @staticmethod
+    def test_new_since():
+        old = MembershipIndex()
+        old.add("a", ["erik", "hikaru"])
+        new = MembershipIndex(old)
+        new.add("a", ["hikaru", "magnus"])
+        assert new.new_since(old, "a") == ["magnus"]
+        other = MembershipIndex()
+        other.add("a", ["magnus", "ding"])
+        assert other.new_since(old, "a") == ["magnus", "ding"]
@@ -0,0 +1,87 @@
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+from chesscom.api.columns import (
+    RESULTS,
+    TIME_CLASSES,
+    UNKNOWN,
+    ArchiveColumns,
+)
+from chesscom.api.player import Player
+
+GAME = {
+    "white": {
+        "@id": "https://api.chess.com/pub/player/erik",
+        "username": "erik",
+        "rating": 1500,
+        "result": "win",
+    },
+    "black": {
+        "@id": "https://api.chess.com/pub/player/hikaru",
+        "username": "Hikaru",
+        "rating": 3000,
+        "result": "resigned",
+    },
+    "url": "https://www.chess.com/game/live/1",
+    "fen": "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq -",
+    "pgn": '[Event "Live Chess"]\n[ECO "C20"]\n\n1. e4 e5 1-0\n',
+    "end_time": 1588291200,
+    "time_control": "60",
+    "rules": "chess",
+    "eco": "https://www.chess.com/openings/Kings-Pawn-Opening",
+    "time_class": "bullet",
+}
+
+
+def _columns() -> ArchiveColumns:
+    other = deepcopy(GAME)
+    other["time_class"] = "blitz"
+    other["black"]["result"] = "unknown"
+    other["pgn"] = '[Event "Live Chess"]\n\n1. e4 e5 1-0\n'
+    del other["eco"]
+    columns = ArchiveColumns()
+    columns.add([GAME, other], "erik", "2020-05")
+    return columns
+
+
+class TestArchiveColumns:
+    @staticmethod
+    def test_to_numpy():
+        array = _columns().to_numpy()
+        assert len(array) == 2
+        assert array["white_rating"].dtype == np.int32
+        assert list(array["time_class"]) == [
+            TIME_CLASSES.index("bullet"),
+            TIME_CLASSES.index("blitz"),
+        ]
+        assert array["white_result"][0] == RESULTS.index("win")
+        assert array["black_result"][1] == UNKNOWN
+        assert list(array["eco"]) == ["C20", None]
+        assert array["eco_url"][0] == GAME["eco"] and array["eco_url"][1] is None
+        assert list(array["month"]) == ["2020-05", "2020-05"]
+        assert array["start_time"][0] == -1
+
+    @staticmethod
+    def test_to_arrow():
+        pytest.importorskip("pyarrow")
+        table = _columns().to_arrow()
+        assert table.num_rows == 2
+        assert table.column("time_class").to_pylist() == ["bullet", "blitz"]
+        assert table.column("black_result").to_pylist() == ["resigned", None]
+
+    @staticmethod
+    def test_archive_columns_after_archive(fake_session):
+        base_url = "https://api.chess.com/pub/player/erik/games"
+        fake_session.bodies[f"{base_url}/archives"] = {
+            "archives": [f"{base_url}/2020/05"]
+        }
+        fake_session.bodies[f"{base_url}/2020/05"] = {"games": [GAME]}
+
+        (game,) = Player.monthly_archive("erik", year=2020, month=5)
+        array = Player.archive_columns("erik").to_numpy()
+        assert fake_session.not_modified == 1
+        assert list(array["url"]) == [game.url]
+        assert list(array["eco"]) == ["C20"]
+        assert list(array["month"]) == ["2020-05"]
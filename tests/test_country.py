@@ -1,4 +1,6 @@
-from chesscom.api.country import Country
+import asyncio
+
+from chesscom.api.country import AsyncCountry, Country
 
 
 class TestCountry:
@@ -13,3 +15,35 @@ class TestCountry:
     @staticmethod
     def test_clubs(country_alpha_2):
         Country.clubs(country_alpha_2)
+
+    @staticmethod
+    def test_iter_players(country_alpha_2):
+        players = Country.players(country_alpha_2)
+        assert list(Country.iter_players(country_alpha_2)) == players
+
+    @staticmethod
+    def test_iter_clubs(country_alpha_2):
+        clubs = Country.clubs(country_alpha_2)
+        assert list(Country.iter_clubs(country_alpha_2)) == clubs
+
+
+class TestAsyncCountry:
+    @staticmethod
+    def test_details(country_alpha_2):
+        asyncio.run(AsyncCountry.details(country_alpha_2))
+
+    @staticmethod
+    def test_players(country_alpha_2):
+        asyncio.run(AsyncCountry.players(country_alpha_2))
+
+    @staticmethod
+    def test_clubs(country_alpha_2):
+        asyncio.run(AsyncCountry.clubs(country_alpha_2))
+
+    @staticmethod
+    def test_iter_players(country_alpha_2):
+        async def iter_players():
+            return [x async for x in AsyncCountry.iter_players(country_alpha_2)]
+
+        players = asyncio.run(iter_players())
+        assert players == Country.players(country_alpha_2)
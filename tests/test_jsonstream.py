@@ -0,0 +1,65 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from chesscom.api.jsonstream import ArrayParser, aiter_arrays, iter_arrays
+
+DOCUMENT = {
+    "comment": {"nested": [1, {"text": "not ], an itém"}]},
+    "weekly": [],
+    "monthly": [{"username": "erik", "joined": 1178556600}],
+    "all_time": [
+        {"username": "hikaru", "joined": 1389043258},
+        {"username": "magnuscarlsen", "joined": 1389043259},
+    ],
+    "count": -1.5e3,
+}
+KEYS = ("weekly", "monthly", "all_time")
+ITEMS = [(key, item) for key in KEYS for item in DOCUMENT[key]]
+
+
+class TestArrayParser:
+    @staticmethod
+    def test_chunks():
+        text = json.dumps(DOCUMENT, indent=2)
+        for size in (1, 2, 7, len(text)):
+            parser = ArrayParser(KEYS)
+            items = []
+            for i in range(0, len(text), size):
+                items += parser.feed(text[i : i + size])
+            items += parser.feed("", final=True)
+            assert items == ITEMS
+
+    @staticmethod
+    def test_incomplete():
+        parser = ArrayParser(KEYS)
+        parser.feed('{"weekly": [{"username": "erik"')
+        with pytest.raises(json.JSONDecodeError):
+            parser.feed("", final=True)
+
+    @staticmethod
+    def test_not_array():
+        with pytest.raises(json.JSONDecodeError):
+            ArrayParser(KEYS).feed('{"weekly": {}}', final=True)
+
+
+class TestIterArrays:
+    @staticmethod
+    def test_iter_arrays():
+        body = io.BytesIO(json.dumps(DOCUMENT).encode())
+        assert list(iter_arrays(body, KEYS, chunk_size=3)) == ITEMS
+
+    @staticmethod
+    def test_aiter_arrays():
+        body = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+
+        async def chunks():
+            for i in range(0, len(body), 5):
+                yield body[i : i + 5]
+
+        async def items():
+            return [x async for x in aiter_arrays(chunks(), KEYS)]
+
+        assert asyncio.run(items()) == ITEMS
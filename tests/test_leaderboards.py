@@ -1,7 +1,111 @@
-from chesscom.api.leaderboards import Leaderboards
+import asyncio
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from chesscom.api._leaderboards import AVAILABLE_LEADERBOARDS, LeaderboardDetails
+from chesscom.api.client import trusted
+from chesscom.api.leaderboards import AsyncLeaderboards, LeaderboardIndex, Leaderboards
+
+PLAYER = {
+    "player_id": 1,
+    "@id": "https://api.chess.com/pub/player/erik",
+    "url": "https://www.chess.com/member/erik",
+    "username": "erik",
+    "score": 3000,
+    "rank": 1,
+    "country": "https://api.chess.com/pub/country/US",
+    "status": "staff",
+    "avatar": "https://images.chesscomfiles.com/erik.png",
+    "trend_score": {"direction": 1, "delta": 10},
+    "flair_code": "nothing",
+}
 
 
 class TestLeaderboards:
     @staticmethod
     def test_get_all():
         Leaderboards.get_all()
+
+    @staticmethod
+    def test_lazy_boards():
+        details = LeaderboardDetails(**{b: [PLAYER] for b in AVAILABLE_LEADERBOARDS})
+        assert "live_blitz" not in details.__dict__
+        assert details.live_blitz[0].id == PLAYER["@id"]
+        assert details.live_blitz is details.live_blitz
+        assert "daily" not in details.__dict__
+
+        copy = pickle.loads(pickle.dumps(details))
+        assert copy == details
+        assert list(copy.__dict__) == AVAILABLE_LEADERBOARDS
+
+        with trusted():
+            fast = LeaderboardDetails(**{b: [PLAYER] for b in AVAILABLE_LEADERBOARDS})
+        assert fast.daily[0].trend_score.delta == 10
+        with trusted():
+            fast = LeaderboardDetails(
+                **{b: [dict(PLAYER, score="high")] for b in AVAILABLE_LEADERBOARDS}
+            )
+        assert fast.daily[0].score == "high"
+
+        with pytest.raises(ValidationError):
+            LeaderboardDetails(daily=[PLAYER])
+        invalid = dict(PLAYER, score="high")
+        details = LeaderboardDetails(**{b: [invalid] for b in AVAILABLE_LEADERBOARDS})
+        with pytest.raises(ValidationError):
+            details.daily
+
+    @staticmethod
+    def test_index():
+        index = Leaderboards.index()
+        details = Leaderboards.get_all()
+        player = details.live_blitz[0]
+        assert index.ranks(player.username.upper())["live_blitz"].rank == player.rank
+        assert index.ranks_by_id(player.player_id) == index.ranks(player.username)
+        assert not index.diff(LeaderboardIndex.from_details(details)).changes
+
+    @staticmethod
+    def test_index_after_get_all(fake_session):
+        url = "https://api.chess.com/pub/leaderboards"
+        fake_session.bodies[url] = {b: [PLAYER] for b in AVAILABLE_LEADERBOARDS}
+
+        details = Leaderboards.get_all()
+        index = Leaderboards.index()
+        assert fake_session.not_modified == 1
+        assert isinstance(details, LeaderboardDetails)
+        assert isinstance(index, LeaderboardIndex)
+        assert index.ranks("ERIK")["live_blitz"].rank == details.live_blitz[0].rank
+
+
+class TestLeaderboardIndex:
+    @staticmethod
+    def test_diff():
+        def snapshot(*players):
+            boards = {board: [] for board in AVAILABLE_LEADERBOARDS}
+            boards["daily"] = [dict(PLAYER, **x) for x in players]
+            return LeaderboardIndex.from_details(LeaderboardDetails(**boards))
+
+        old = snapshot(
+            {"username": "erik", "player_id": 1, "rank": 1},
+            {"username": "hikaru", "player_id": 2, "rank": 2},
+        )
+        new = snapshot(
+            {"username": "hikaru", "player_id": 2, "rank": 1, "score": 3010},
+            {"username": "magnus", "player_id": 3, "rank": 2},
+        )
+        assert old.ranks_by_id("1")["daily"].rank == 1
+        assert "ERIK" in old and "erik" not in new
+
+        diff = old.diff(new)
+        assert [x.new.username for x in diff.entries] == ["magnus"]
+        assert [x.old.username for x in diff.exits] == ["erik"]
+        (change,) = diff.changes
+        assert (change.rank_delta, change.score_delta) == (1, 10)
+        assert sorted(old.apply(diff).entries()) == sorted(new.entries())
+
+
+class TestAsyncLeaderboards:
+    @staticmethod
+    def test_get_all():
+        asyncio.run(AsyncLeaderboards.get_all())
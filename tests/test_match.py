@@ -1,4 +1,53 @@
-from chesscom.api.match import Match
+import asyncio
+
+from chesscom.api.match import AsyncMatch, Match
+
+BASE_URL = "https://api.chess.com/pub/match"
+TEAM1, TEAM2 = "https://api.chess.com/pub/club/a", "https://api.chess.com/pub/club/b"
+
+
+def _team(url, usernames):
+    players = [{"username": x, "board": "", "status": "basic"} for x in usernames]
+    return {"@id": url, "name": url[-1], "score": 0, "players": players}
+
+
+def _match(url, boards, team1, team2):
+    return {
+        "@id": url,
+        "name": "match",
+        "url": url,
+        "start_time": 0,
+        "status": "in_progress",
+        "boards": boards,
+        "settings": {
+            "time_class": "daily",
+            "time_control": "1/86400",
+            "rules": "chess",
+        },
+        "teams": {"team1": team1, "team2": team2},
+    }
+
+
+def _player(username, rating, result=None, team=None):
+    player = {"@id": f"https://api.chess.com/pub/player/{username}"}
+    player.update(username=username, rating=rating)
+    if result is not None:
+        player["result"] = result
+    if team is not None:
+        player["team"] = team
+    return player
+
+
+def _game(white, black):
+    return {
+        "white": white,
+        "black": black,
+        "url": "https://www.chess.com/game/daily/1",
+        "fen": "8/8/8/8/8/8/8/8 w - -",
+        "time_control": "1/86400",
+        "time_class": "daily",
+        "rules": "chess",
+    }
 
 
 class TestMatch:
@@ -10,6 +59,17 @@ class TestMatch:
     def test_team_match_board(match_id, board):
         Match.team_match_board(match_id, board)
 
+    @staticmethod
+    def test_daily_team_match_boards(match_id, board):
+        tree = Match.daily_team_match_boards(match_id)
+        assert len(tree.boards) == tree.details.boards
+        assert tree.boards[board - 1].details == Match.team_match_board(match_id, board)
+        team1, team2 = tree.teams
+        assert team1.wins + team1.draws + team1.losses + team1.in_progress == len(
+            tree.games()
+        )
+        assert team1.wins == team2.losses
+
     @staticmethod
     def test_get_live_match(live_match_id):
         Match.live_match(live_match_id)
@@ -17,3 +77,105 @@ class TestMatch:
     @staticmethod
     def test_live_match_board(live_match_id, board):
         Match.live_match_board(live_match_id, board)
+
+    @staticmethod
+    def test_live_match_boards(live_match_id):
+        tree = Match.live_match_boards(live_match_id)
+        assert len(tree.boards) == tree.details.boards
+
+    @staticmethod
+    def test_daily_team_match_aggregates(fake_session):
+        url = f"{BASE_URL}/1"
+        fake_session.bodies[url] = _match(
+            url, 2, _team(TEAM1, ["a1", "a2"]), _team(TEAM2, ["b1", "b2"])
+        )
+        fake_session.bodies[f"{url}/1"] = {
+            "board_scores": {"a1": 1.5, "b1": 0.5},
+            "games": [
+                _game(
+                    _player("a1", 1500, "win", TEAM1),
+                    _player("b1", 1400, "checkmated", TEAM2),
+                ),
+                _game(
+                    _player("b1", 1400, "agreed", TEAM2),
+                    _player("a1", 1500, "agreed", TEAM1),
+                ),
+            ],
+        }
+        fake_session.bodies[f"{url}/2"] = {
+            "board_scores": {"a2": 0, "b2": 1},
+            "games": [
+                # Not finished: no results yet.
+                _game(_player("a2", 1600, team=TEAM1), _player("b2", 1800, team=TEAM2)),
+                _game(
+                    _player("b2", 1800, "win", TEAM2),
+                    _player("a2", 1600, "resigned", TEAM1),
+                ),
+            ],
+        }
+
+        tree = Match.daily_team_match_boards("1")
+        assert [x.number for x in tree.boards] == [1, 2]
+        assert len(tree.games()) == 4
+        team1, team2 = tree.teams
+        assert (team1.id, team1.name) == (TEAM1, "a")
+        assert (team1.score, team1.wins, team1.draws, team1.losses) == (1.5, 1, 1, 1)
+        assert (team2.score, team2.wins, team2.draws, team2.losses) == (1.5, 1, 1, 1)
+        assert (team1.in_progress, team2.in_progress) == (1, 1)
+        assert (team1.average_rating, team2.average_rating) == (1550, 1600)
+
+    @staticmethod
+    def test_live_match_aggregates(fake_session):
+        url = f"{BASE_URL}/live/7"
+        fake_session.bodies[url] = _match(
+            url, 1, _team(TEAM1, ["A1"]), _team(TEAM2, ["b1"])
+        )
+        # Live games name no team: players are matched to the team lists by username.
+        fake_session.bodies[f"{url}/1"] = {
+            "board_scores": {"a1": 1, "b1": 0},
+            "games": [
+                _game(_player("a1", 1500, "win"), _player("B1", 1400, "timeout")),
+                _game(_player("stranger", 1000), _player("b1", 1400)),
+            ],
+        }
+
+        tree = Match.live_match_boards("7")
+        team1, team2 = tree.teams
+        assert (team1.score, team1.wins, team1.in_progress) == (1, 1, 0)
+        assert (team2.score, team2.losses, team2.in_progress) == (0, 1, 1)
+        assert (team1.average_rating, team2.average_rating) == (1500, 1400)
+
+    @staticmethod
+    def test_empty_team(fake_session):
+        url = f"{BASE_URL}/2"
+        fake_session.bodies[url] = _match(url, 1, _team(TEAM1, []), _team(TEAM2, []))
+        fake_session.bodies[f"{url}/1"] = {
+            "board_scores": {"a": 0, "b": 0},
+            "games": [],
+        }
+
+        team1, _ = Match.daily_team_match_boards("2").teams
+        assert (team1.score, team1.in_progress, team1.average_rating) == (0, 0, None)
+
+
+class TestAsyncMatch:
+    @staticmethod
+    def test_daily_team_matches(match_id):
+        asyncio.run(AsyncMatch.daily_team_matches(match_id))
+
+    @staticmethod
+    def test_team_match_board(match_id, board):
+        asyncio.run(AsyncMatch.team_match_board(match_id, board))
+
+    @staticmethod
+    def test_get_live_match(live_match_id):
+        asyncio.run(AsyncMatch.live_match(live_match_id))
+
+    @staticmethod
+    def test_live_match_board(live_match_id, board):
+        asyncio.run(AsyncMatch.live_match_board(live_match_id, board))
+
+    @staticmethod
+    def test_daily_team_match_boards(match_id):
+        tree = asyncio.run(AsyncMatch.daily_team_match_boards(match_id))
+        assert tree.teams == Match.daily_team_match_boards(match_id).teams
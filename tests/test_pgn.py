@@ -0,0 +1,68 @@
+import io
+
+import chess.pgn
+
+from chesscom.api.pgn import iter_headers, parse_games, read_headers, split_games
+
+PGN = """[Event "Live Chess"]
+[Site "Chess.com"]
+[Date "2020.05.01"]
+[Round "-"]
+[White "erik"]
+[Black "magnus"]
+[Result "1-0"]
+[ECO "C20"]
+
+1. e4 {[%clk 0:02:59.9]} 1... e5 {[%clk 0:02:58.1]} 2. Qh5 Nc6 3. Bc4 Nf6 4. Qxf7# 1-0
+
+[Event "Live Chess"]
+[Site "Chess.com"]
+[Date "2020.05.02"]
+[Round "-"]
+[White "hikaru"]
+[Black "erik"]
+[Result "1/2-1/2"]
+
+1. d4 d5 1/2-1/2
+"""
+
+
+class TestPGN:
+    @staticmethod
+    def test_read_headers():
+        headers = read_headers(PGN)
+        games = []
+        pgn_file = io.StringIO(PGN)
+        while True:
+            game = chess.pgn.read_game(pgn_file)
+            if game is None:
+                break
+            games.append(game)
+
+        assert len(headers) == len(games) == 2
+        for tags, game in zip(headers, games):
+            assert dict(tags) == dict(game.headers)
+            assert list(tags.game().mainline_moves()) == list(game.mainline_moves())
+
+    @staticmethod
+    def test_iter_headers():
+        headers = iter_headers(io.StringIO(PGN))
+        assert next(headers)["Result"] == "1-0"
+        assert next(headers).movetext == "1. d4 d5 1/2-1/2\n"
+        assert next(headers, None) is None
+
+    @staticmethod
+    def test_split_games():
+        games = split_games(PGN)
+        assert len(games) == 2
+        assert "".join(games) == PGN
+        assert read_headers(games[1])[0]["White"] == "hikaru"
+
+    @staticmethod
+    def test_parse_games():
+        games = list(parse_games([PGN, PGN], max_workers=2, batch_size=1))
+        assert [game.headers["White"] for game in games] == ["erik", "hikaru"] * 2
+        compact = list(parse_games([PGN], max_workers=1, compact=True))
+        assert compact[0].moves[:2] == ["e2e4", "e7e5"]
+        assert compact[0].comments[0] == "[%clk 0:02:59.9]"
+        assert str(compact[0].game().mainline_moves()) == str(games[0].mainline_moves())
@@ -1,4 +1,8 @@
-from chesscom.api.player import Player
+import asyncio
+import datetime
+
+from chesscom.api._records import GameRecord
+from chesscom.api.player import DEFAULT_BULK_ENDPOINTS, AsyncPlayer, Player
 
 
 class TestPlayer:
@@ -42,6 +46,149 @@ class TestPlayer:
     def test_monthly_archive(username, month, year):
         Player.monthly_archive(username, year=year, month=month)
 
+    @staticmethod
+    def test_monthly_archive_games(username, month, year):
+        for game in Player.monthly_archive(username, year=year, month=month):
+            assert game.game.headers["Link"] == game.url
+
+    @staticmethod
+    def test_monthly_records(username, month, year):
+        games = Player.monthly_archive(username, year=year, month=month)
+        records = Player.monthly_records(username, year=year, month=month)
+        assert all(isinstance(x, GameRecord) for x in records)
+        assert [x.to_model() for x in records] == games
+
+    @staticmethod
+    def test_monthly_records_after_archive(fake_session):
+        url = "https://api.chess.com/pub/player/erik/games/2025/10"
+        player = {"@id": "a", "username": "erik", "rating": 1, "result": "win"}
+        game = {
+            "white": player,
+            "black": dict(player, username="b", result="resigned"),
+            "url": "g",
+            "fen": "8/8/8/8/8/8/8/8 w - -",
+            "pgn": "1. e4 *",
+            "end_time": 1,
+            "time_control": "60",
+            "rules": "chess",
+            "time_class": "bullet",
+        }
+        fake_session.bodies[url] = {"games": [game]}
+
+        games = Player.monthly_archive("erik", year=2025, month=10)
+        records = Player.monthly_records("erik", year=2025, month=10)
+        assert fake_session.not_modified == 1
+        assert [type(x) for x in records] == [GameRecord]
+        assert [x.to_model() for x in records] == games
+
+    @staticmethod
+    def test_bulk(username):
+        missing = "this-user-does-not-exist-0"
+        results = {x.username: x for x in Player.bulk([username, missing])}
+        assert not results[username].errors
+        assert results[username].values["profile"] == Player.profile(username)
+        assert set(results[missing].errors) == set(DEFAULT_BULK_ENDPOINTS)
+
+    @staticmethod
+    def test_archives(username, month, year):
+        date = datetime.date(year, month, 1)
+        games = list(Player.archives(username, start=date, end=date))
+        assert [x.url for x in games] == [
+            x.url for x in Player.monthly_archive(username, year=year, month=month)
+        ]
+
     @staticmethod
     def test_monthly_pgns(username, month, year):
         Player.monthly_pgns(username, year=year, month=month)
+
+    @staticmethod
+    def test_iter_monthly_pgns(username, month, year):
+        games = Player.iter_monthly_pgns(username, year=year, month=month)
+        assert len(list(games)) == len(
+            Player.monthly_pgns(username, year=year, month=month)
+        )
+
+    @staticmethod
+    def test_monthly_pgns_headers_only(username, month, year):
+        games = Player.monthly_pgns(username, year=year, month=month)
+        headers = Player.monthly_pgns(
+            username, year=year, month=month, headers_only=True
+        )
+        assert [dict(x) for x in headers] == [dict(x.headers) for x in games]
+
+    @staticmethod
+    def test_iter_all_pgns(username):
+        next(Player.iter_all_pgns(username), None)
+
+    @staticmethod
+    def test_parse_all_pgns(username):
+        games = Player.parse_all_pgns(username, max_workers=2, compact=True)
+        next(games, None)
+
+
+class TestAsyncPlayer:
+    @staticmethod
+    def test_profile(username):
+        asyncio.run(AsyncPlayer.profile(username))
+
+    @staticmethod
+    def test_clubs(username):
+        asyncio.run(AsyncPlayer.clubs(username))
+
+    @staticmethod
+    def test_tournaments(username):
+        asyncio.run(AsyncPlayer.tournaments(username))
+
+    @staticmethod
+    def test_matches(username):
+        asyncio.run(AsyncPlayer.matches(username))
+
+    @staticmethod
+    def test_online_status(username):
+        asyncio.run(AsyncPlayer.online_status(username))
+
+    @staticmethod
+    def test_stats(username):
+        asyncio.run(AsyncPlayer.stats(username))
+
+    @staticmethod
+    def test_current_daily_chess_games(username):
+        asyncio.run(AsyncPlayer.current_daily_chess_games(username))
+
+    @staticmethod
+    def test_to_move_daily_chess_games(username):
+        asyncio.run(AsyncPlayer.to_move_daily_chess_games(username))
+
+    @staticmethod
+    def test_monthly_archive_urls(username):
+        asyncio.run(AsyncPlayer.monthly_archive_urls(username))
+
+    @staticmethod
+    def test_monthly_archive(username, month, year):
+        asyncio.run(AsyncPlayer.monthly_archive(username, year=year, month=month))
+
+    @staticmethod
+    def test_monthly_records(username, month, year):
+        asyncio.run(AsyncPlayer.monthly_records(username, year=year, month=month))
+
+    @staticmethod
+    def test_bulk(username):
+        async def bulk():
+            return [x async for x in AsyncPlayer.bulk([username], ["profile"])]
+
+        (result,) = asyncio.run(bulk())
+        assert result.values["profile"].username == Player.profile(username).username
+
+    @staticmethod
+    def test_archives(username, month, year):
+        async def archives():
+            date = datetime.date(year, month, 1)
+            return [
+                x async for x in AsyncPlayer.archives(username, start=date, end=date)
+            ]
+
+        asyncio.run(archives())
+
+    @staticmethod
+    def test_monthly_pgns(username, month, year):
+        asyncio.run(AsyncPlayer.monthly_pgns(username, year=year, month=month))
@@ -1,4 +1,6 @@
-from chesscom.api.puzzles import Puzzles
+import asyncio
+
+from chesscom.api.puzzles import AsyncPuzzles, Puzzles
 
 
 class TestPuzzles:
@@ -9,3 +11,13 @@ class TestPuzzles:
     @staticmethod
     def test_random():
         Puzzles.random()
+
+
+class TestAsyncPuzzles:
+    @staticmethod
+    def test_daily():
+        asyncio.run(AsyncPuzzles.daily())
+
+    @staticmethod
+    def test_random():
+        asyncio.run(AsyncPuzzles.random())
@@ -0,0 +1,90 @@
+import time
+
+import pytest
+import requests
+
+from chesscom.api import ratelimit
+from chesscom.api.client import get_client
+from chesscom.api.ratelimit import RateLimiter, parse_retry_after
+
+API_URL = "https://api.chess.com/pub/player/erik"
+
+
+class RecordingRateLimiter(RateLimiter):
+    """Rate limiter recording the delay of each backoff."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.delays = []
+
+    def _pause(self, attempt, retry_after):
+        now = time.monotonic()
+        super()._pause(attempt, retry_after)
+        self.delays.append(self._resume_at - now)
+
+
+class TestRateLimiter:
+    @staticmethod
+    def test_parse_retry_after():
+        assert parse_retry_after({"Retry-After": "3"}) == 3
+        assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+        assert parse_retry_after({}) is None
+
+    @staticmethod
+    def test_aimd():
+        limiter = RateLimiter(initial_concurrency=8, max_concurrency=16)
+        tokens = [limiter.acquire() for _ in range(8)]
+        for token in tokens:
+            limiter.release(token, throttled=True)
+        assert limiter.metrics().concurrency == 4
+        assert limiter.metrics().throttled == 8
+
+        for _ in range(100):
+            limiter.release(limiter.acquire())
+        assert 4 < limiter.metrics().concurrency <= 16
+
+
+class TestClientRetries:
+    @staticmethod
+    def test_retry(fake_session, monkeypatch):
+        # Jitter picks the longest delay.
+        monkeypatch.setattr(ratelimit.random, "uniform", lambda a, b: b)
+        fake_session.bodies[API_URL] = {"username": "erik"}
+        fake_session.throttled[API_URL] = ["0.05", None]
+        client = get_client()
+        client.rate_limiter = limiter = RecordingRateLimiter(backoff_base=0.02)
+
+        assert client.get(API_URL) == {"username": "erik"}
+        assert fake_session.requests == 3
+        # Retry-After, then the backoff of the second attempt: 0.02 * 2.
+        assert limiter.delays == pytest.approx([0.05, 0.04], abs=0.005)
+        metrics = limiter.metrics()
+        assert (metrics.throttled, metrics.retries, metrics.requests) == (2, 2, 3)
+        assert metrics.throttled_time >= 0.08
+        # Halved on each 429 (8 -> 4 -> 2), then increased by 1 / 2 on success.
+        assert metrics.concurrency == 2.5
+
+    @staticmethod
+    def test_jitter(fake_session, monkeypatch):
+        monkeypatch.setattr(ratelimit.random, "uniform", lambda a, b: a)
+        fake_session.bodies[API_URL] = {"username": "erik"}
+        fake_session.throttled[API_URL] = [None, None]
+        client = get_client()
+        client.rate_limiter = limiter = RecordingRateLimiter(backoff_base=0.02)
+
+        client.get(API_URL)
+        assert limiter.delays == pytest.approx([0.01, 0.02], abs=0.005)
+
+    @staticmethod
+    def test_retry_limit(fake_session):
+        fake_session.bodies[API_URL] = {"username": "erik"}
+        fake_session.throttled[API_URL] = ["0"] * 3
+        client = get_client()
+        client.rate_limiter = RateLimiter()
+        client.max_retries = 2
+
+        with pytest.raises(requests.HTTPError):
+            client.get(API_URL)
+        assert fake_session.requests == 3
+        assert client.rate_limiter.metrics().retries == 2
+        assert client.rate_limiter.metrics().concurrency == 1
@@ -0,0 +1,53 @@
+import json
+from copy import deepcopy
+
+from chesscom.api._player import MonthlyArchive
+from chesscom.api._records import GameRecord, PlayerRecord
+
+GAME = {
+    "white": {
+        "@id": "https://api.chess.com/pub/player/erik",
+        "username": "erik",
+        "rating": 1500,
+        "result": "win",
+    },
+    "black": {
+        "@id": "https://api.chess.com/pub/player/hikaru",
+        "username": "Hikaru",
+        "rating": 3000,
+        "result": "resigned",
+    },
+    "url": "https://www.chess.com/game/live/1",
+    "fen": "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq -",
+    "pgn": '[Event "Live Chess"]\n\n1. e4 e5 1-0\n',
+    "end_time": 1588291200,
+    "time_control": "60",
+    "rules": "chess",
+    "eco": "https://www.chess.com/openings/Kings-Pawn-Opening",
+    "time_class": "bullet",
+}
+
+
+class TestGameRecord:
+    @staticmethod
+    def test_from_response():
+        record = GameRecord.from_response(deepcopy(GAME))
+        assert record.white == PlayerRecord(
+            "erik", 1500, "win", "https://api.chess.com/pub/player/erik"
+        )
+        assert record.start_time is None
+        assert record.to_model() == MonthlyArchive(**deepcopy(GAME))
+
+    @staticmethod
+    def test_from_model():
+        game = MonthlyArchive(**deepcopy(GAME))
+        record = GameRecord.from_model(game)
+        assert record == GameRecord.from_response(deepcopy(GAME))
+        assert record.black.to_model() == game.black
+
+    @staticmethod
+    def test_interned():
+        first = GameRecord.from_response(json.loads(json.dumps(GAME)))
+        second = GameRecord.from_response(json.loads(json.dumps(GAME)))
+        assert first.white.id is second.white.id
+        assert first.eco is second.eco
@@ -1,7 +1,15 @@
-from chesscom.api.streamers import Streamers
+import asyncio
+
+from chesscom.api.streamers import AsyncStreamers, Streamers
 
 
 class TestStreamers:
     @staticmethod
     def test_list_all():
         Streamers.list_all()
+
+
+class TestAsyncStreamers:
+    @staticmethod
+    def test_list_all():
+        asyncio.run(AsyncStreamers.list_all())
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from chesscom.api._sync import MonthCheckpoint, SyncCheckpoint
+from chesscom.api.sync import (
+    ArchiveSync,
+    AsyncArchiveSync,
+    BaseCheckpointStore,
+    MemoryCheckpointStore,
+    SQLiteCheckpointStore,
+)
+
+
+class TestCheckpointStore:
+    @staticmethod
+    def test_memory(username):
+        store = MemoryCheckpointStore()
+        assert store.get(username) is None
+        checkpoint = SyncCheckpoint(username=username, completed="2020/05")
+        store.set(checkpoint)
+        checkpoint.completed = "2020/06"
+        assert store.get(username.upper()).completed == "2020/05"
+        store.delete(username)
+        assert store.get(username) is None
+
+    @staticmethod
+    def test_sqlite(username, tmp_path):
+        path = str(tmp_path / "sync.sqlite")
+        store = SQLiteCheckpointStore(path)
+        months = {"2020/05": MonthCheckpoint(last_end_time=1, last_urls=["a"])}
+        store.set(SyncCheckpoint(username=username, months=months))
+        store.close()
+
+        store = SQLiteCheckpointStore(path)
+        checkpoint = store.get(username)
+        assert checkpoint.months["2020/05"].last_urls == ["a"]
+        store.delete(username)
+        assert store.get(username) is None
+        store.close()
+
+    @staticmethod
+    def test_incomplete_backend():
+        class GetOnlyStore(BaseCheckpointStore):
+            def get(self, username):
+                return None
+
+        with pytest.raises(TypeError):
+            GetOnlyStore()
+
+
+def _archive_game(url, end_time):
+    player = {"@id": "a", "username": "erik", "rating": 1, "result": "win"}
+    return {
+        "white": player,
+        "black": dict(player, username="b", result="resigned"),
+        "url": url,
+        "fen": "8/8/8/8/8/8/8/8 w - -",
+        "pgn": "1. e4 *",
+        "end_time": end_time,
+        "time_control": "60",
+        "rules": "chess",
+        "time_class": "bullet",
+    }
+
+
+class TestArchiveSync:
+    @staticmethod
+    def test_sync(username):
+        sync = ArchiveSync(MemoryCheckpointStore())
+        next(sync.sync(username), None)
+
+    @staticmethod
+    def test_months_in_progress(fake_session):
+        base_url = "https://api.chess.com/pub/player/erik/games"
+        october, november = f"{base_url}/2025/10", f"{base_url}/2025/11"
+        fake_session.bodies[f"{base_url}/archives"] = {"archives": [october, november]}
+        fake_session.bodies[october] = {"games": [_archive_game("o1", 1)]}
+        fake_session.bodies[november] = {"games": [_archive_game("n1", 2)]}
+
+        # Both months are still in their grace period, e.g. early on the 1st.
+        store = MemoryCheckpointStore()
+        sync = ArchiveSync(store, grace=100 * 365 * 86400)
+        assert [x.url for x in sync.sync("erik")] == ["o1", "n1"]
+        assert list(sync.sync("erik")) == []
+
+        fake_session.bodies[november]["games"].append(_archive_game("n2", 3))
+        assert [x.url for x in sync.sync("erik")] == ["n2"]
+
+        sync.grace = 0
+        assert list(sync.sync("erik")) == []
+        assert store.get("erik").completed == "2025/11"
+        assert store.get("erik").months == {}
+
+
+class TestAsyncArchiveSync:
+    @staticmethod
+    def test_sync(username):
+        async def sync():
+            games = AsyncArchiveSync(MemoryCheckpointStore()).sync(username)
+            async for game in games:
+                return game
+
+        asyncio.run(sync())
@@ -1,7 +1,71 @@
-from chesscom.api.titled_players import VALID_TITLES, TitledPlayers
+import asyncio
+
+from chesscom.api import titled_players
+from chesscom.api.titled_players import (
+    VALID_TITLES,
+    AsyncTitledPlayers,
+    TitledPlayers,
+    TitleIndex,
+)
 
 
 class TestTitledPlayers:
     @staticmethod
     def test_usernames():
         TitledPlayers.usernames(VALID_TITLES)
+
+    @staticmethod
+    def test_index():
+        index = TitledPlayers.index()
+        assert TitledPlayers.index() is index
+        username = TitledPlayers.usernames(["GM"])["GM"][0]
+        assert index.title_of(username.upper()) == "GM"
+
+
+class TestAsyncTitledPlayers:
+    @staticmethod
+    def test_usernames():
+        asyncio.run(AsyncTitledPlayers.usernames(VALID_TITLES))
+
+    @staticmethod
+    def test_index():
+        index = asyncio.run(AsyncTitledPlayers.index(ttl=0))
+        assert len(index) > 0
+
+    @staticmethod
+    def test_index_single_flight(monkeypatch):
+        calls = []
+
+        async def usernames(titles):
+            calls.append(titles)
+            await asyncio.sleep(0.01)
+            return {"GM": ["Hikaru"]}
+
+        async def index():
+            return await asyncio.gather(*(AsyncTitledPlayers.index() for _ in range(5)))
+
+        monkeypatch.setattr(titled_players, "_index", None)
+        monkeypatch.setattr(AsyncTitledPlayers, "usernames", staticmethod(usernames))
+        indexes = asyncio.run(index())
+        assert len(calls) == 1
+        assert all(x is indexes[0] for x in indexes)
+        assert asyncio.run(index())[0] is indexes[0]
+
+
+class TestTitleIndex:
+    @staticmethod
+    def test_lookup():
+        index = TitleIndex({"IM": ["Hikaru", "erik"], "GM": ["hikaru"]})
+        assert index.title_of("HIKARU") == "GM"
+        assert index.title_of("erik") == "IM"
+        assert index.title_of("nobody") is None
+        assert index.titles_of(["Erik", "nobody"]) == ["IM", None]
+        assert index.is_titled(["Erik", "nobody"]) == [True, False]
+        assert "ERIK" in index
+        assert len(index) == 2
+
+    @staticmethod
+    def test_is_fresh():
+        index = TitleIndex({})
+        assert index.is_fresh(60)
+        assert not index.is_fresh(0)
@@ -1,4 +1,69 @@
-from chesscom.api.tournaments import Tournament
+import asyncio
+
+from chesscom.api.tournaments import AsyncTournament, Tournament
+
+BASE_URL = "https://api.chess.com/pub/tournament/t"
+SETTINGS = {
+    "type": "standard",
+    "rules": "chess",
+    "time_class": "daily",
+    "time_control": "1/259200",
+    "is_rated": True,
+    "is_official": False,
+    "is_invite_only": False,
+    "initial_group_size": 2,
+    "user_advance_count": 1,
+    "use_tiebreak": True,
+    "allow_vacation": False,
+    "winner_places": 1,
+    "registered_user_count": 5,
+    "games_per_opponent": 2,
+    "total_rounds": 2,
+    "concurrent_games_per_opponent": 1,
+}
+
+
+def _group(*players):
+    keys = ("username", "points", "tie_break", "is_advancing")
+    return {
+        "fair_play_removals": [],
+        "games": [],
+        "players": [dict(zip(keys, x)) for x in players],
+    }
+
+
+def _tournament(fake_session):
+    statuses = [("alice", "winner"), ("bob", "eliminated"), ("carol", "eliminated")]
+    fake_session.bodies[BASE_URL] = {
+        "name": "t",
+        "url": "https://www.chess.com/tournament/t",
+        "description": "",
+        "creator": "erik",
+        "status": "finished",
+        "finish_time": 1,
+        "settings": SETTINGS,
+        "players": [{"username": x, "status": y} for x, y in statuses]
+        + [{"username": "dave", "status": "withdrew"}],
+        "rounds": [f"{BASE_URL}/1", f"{BASE_URL}/2"],
+    }
+    fake_session.bodies[f"{BASE_URL}/1"] = {
+        "groups": [f"{BASE_URL}/1/1", f"{BASE_URL}/1/2"],
+        "players": [],
+    }
+    fake_session.bodies[f"{BASE_URL}/2"] = {
+        "groups": [f"{BASE_URL}/2/1"],
+        "players": [],
+    }
+    fake_session.bodies[f"{BASE_URL}/1/1"] = _group(
+        ("Alice", 2, 1, True), ("bob", 1, 0.5, False)
+    )
+    fake_session.bodies[f"{BASE_URL}/1/2"] = _group(
+        ("carol", 2, 2, True), ("dave", 0, 0, False)
+    )
+    # eve is not listed in the tournament players, e.g. a late replacement.
+    fake_session.bodies[f"{BASE_URL}/2/1"] = _group(
+        ("ALICE", 1, 0, False), ("carol", 1, 1, False), ("eve", 0, 0, False)
+    )
 
 
 class TestTournament:
@@ -13,3 +78,62 @@ class TestTournament:
     @staticmethod
     def test_get_round_group(tournament_id, tournament_round, tournament_group):
         Tournament.get_round_group(tournament_id, tournament_round, tournament_group)
+
+    @staticmethod
+    def test_crawl(tournament_id, tournament_round, tournament_group):
+        tree = Tournament.crawl(tournament_id)
+        assert len(tree.rounds) == len(tree.details.rounds)
+        group = Tournament.get_round_group(
+            tournament_id, tournament_round, tournament_group
+        )
+        crawled = tree.rounds[tournament_round - 1].groups[tournament_group - 1]
+        assert crawled.details == group
+        usernames = [x.username.lower() for x in tree.standings]
+        assert len(usernames) == len(set(usernames))
+
+    @staticmethod
+    def test_crawl_tree(fake_session):
+        _tournament(fake_session)
+        tree = Tournament.crawl("t")
+        assert [x.url for x in tree.rounds] == [f"{BASE_URL}/1", f"{BASE_URL}/2"]
+        assert [len(x.groups) for x in tree.rounds] == [2, 1]
+        assert tree.rounds[0].groups[1].url == f"{BASE_URL}/1/2"
+        assert tree.rounds[0].groups[1].details.players[0].username == "carol"
+
+    @staticmethod
+    def test_standings(fake_session):
+        _tournament(fake_session)
+        standings = [tuple(x) for x in Tournament.crawl("t").standings]
+        assert standings == [
+            # Tied on rounds and points: ordered by tie-break.
+            ("carol", "eliminated", 3.0, 3.0, 2, False),
+            # Merged across rounds and cases, keeping the first spelling.
+            ("Alice", "winner", 3.0, 1.0, 2, False),
+            ("bob", "eliminated", 1.0, 0.5, 1, False),
+            # Tied on everything: kept in the order they were first seen.
+            ("dave", "withdrew", 0.0, 0.0, 1, False),
+            ("eve", None, 0.0, 0.0, 1, False),
+        ]
+
+
+class TestAsyncTournament:
+    @staticmethod
+    def test_get(tournament_id):
+        asyncio.run(AsyncTournament.get(tournament_id))
+
+    @staticmethod
+    def test_get_round(tournament_id, tournament_round):
+        asyncio.run(AsyncTournament.get_round(tournament_id, tournament_round))
+
+    @staticmethod
+    def test_get_round_group(tournament_id, tournament_round, tournament_group):
+        asyncio.run(
+            AsyncTournament.get_round_group(
+                tournament_id, tournament_round, tournament_group
+            )
+        )
+
+    @staticmethod
+    def test_crawl(tournament_id):
+        tree = asyncio.run(AsyncTournament.crawl(tournament_id))
+        assert tree.standings == Tournament.crawl(tournament_id).standings
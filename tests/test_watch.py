@@ -0,0 +1,195 @@
+import asyncio
+import json
+import time
+
+from chesscom.api._player import CurrentDailyChess
+from chesscom.api.match import Match
+from chesscom.api.watch import (
+    DEADLINE,
+    DRAW_OFFER,
+    ERROR,
+    GAME_OVER,
+    MOVE,
+    NEW_GAME,
+    AsyncDailyGamesWatcher,
+    AsyncLiveMatchTracker,
+    DailyGamesWatcher,
+    LiveMatchTracker,
+)
+
+
+def _game(url, fen, turn="white", draw_offer=None, move_by=0, last_activity=0):
+    return CurrentDailyChess(
+        white="https://api.chess.com/pub/player/erik",
+        black="https://api.chess.com/pub/player/hikaru",
+        url=url,
+        fen=fen,
+        pgn="",
+        turn=turn,
+        move_by=move_by,
+        draw_offer=draw_offer,
+        last_activity=last_activity,
+        start_time=0,
+        time_control="1/86400",
+        time_class="daily",
+        rules="chess",
+    )
+
+
+def _board(moves, result=None):
+    pgn = '[Event "Live Chess"]\n\n' + " ".join(
+        f"{i // 2 + 1}. {x} {{[%clk 0:02:59]}}" for i, x in enumerate(moves)
+    )
+    white = {"@id": "a", "username": "erik", "rating": 1500}
+    black = {"@id": "b", "username": "hikaru", "rating": 1500}
+    if result is not None:
+        white["result"], black["result"] = result
+    game = {"white": white, "black": black, "url": "g", "fen": str(moves), "pgn": pgn}
+    scores = {"erik": 1 if result else 0, "hikaru": 0}
+    return {"board_scores": scores, "games": [game]}
+
+
+class TestDailyGamesWatcher:
+    @staticmethod
+    def test_poll(username):
+        watcher = DailyGamesWatcher([username])
+        events = watcher.poll()
+        assert {x.kind for x in events} <= {NEW_GAME, DRAW_OFFER, DEADLINE}
+        assert len(watcher.games(username)) == sum(x.kind == NEW_GAME for x in events)
+
+    @staticmethod
+    def test_update(username):
+        now = time.time()
+        watcher = DailyGamesWatcher([username], min_interval=60, max_interval=3600)
+        games = [_game("a", "fen1", "black", last_activity=now), _game("b", "fen1")]
+        assert [x.kind for x in watcher.update(username, games, now)] == [NEW_GAME] * 2
+        assert watcher.update(username, games, now) == []
+
+        games = [
+            _game("a", "fen2", "white", draw_offer="hikaru", last_activity=now),
+            _game("c", "fen1"),
+        ]
+        events = watcher.update(username, games, now)
+        assert [(x.kind, x.game.url) for x in events] == [
+            (MOVE, "a"),
+            (DRAW_OFFER, "a"),
+            (NEW_GAME, "c"),
+            (GAME_OVER, "b"),
+        ]
+        assert events[0].to_move and events[0].previous.fen == "fen1"
+        assert watcher.update(username, ValueError(), now)[0].kind == ERROR
+
+    @staticmethod
+    def test_deadline(username):
+        now = time.time()
+        watcher = DailyGamesWatcher([username], deadline=3600)
+        games = [_game("a", "fen1", move_by=int(now) + 60, last_activity=now)]
+        watcher.update(username, games, now)
+        events = watcher.poll()
+        assert [(x.kind, x.game.url) for x in events] == [(DEADLINE, "a")]
+        assert watcher.poll() == []
+
+    @staticmethod
+    def test_opponent_deadline(username):
+        now = time.time()
+        watcher = DailyGamesWatcher([username], min_interval=60, max_interval=86400)
+        games = [_game("a", "fen1", "black", move_by=int(now) + 600)]
+        watcher.update(username, games, now)
+        account = watcher._accounts[username]
+        assert 590 < account.due - now <= 600
+
+        games = [_game("a", "fen1", "white", move_by=int(now) + 600)]
+        watcher.update(username, games, now)
+        assert account.due - now == 86400
+
+    @staticmethod
+    def test_unchanged_body(fake_session, username):
+        url = f"https://api.chess.com/pub/player/{username}/games"
+        game = _game("a", "fen1", last_activity=int(time.time()))
+        fake_session.bodies[url] = {"games": [json.loads(game.json())]}
+        watcher = DailyGamesWatcher([username], min_interval=0, max_interval=0)
+        assert [x.kind for x in watcher.poll()] == [NEW_GAME]
+        assert watcher.poll() == []
+        assert fake_session.not_modified == 1
+
+        fake_session.bodies[url]["games"][0]["fen"] = "fen2"
+        assert [x.kind for x in watcher.poll()] == [MOVE]
+
+
+class TestAsyncDailyGamesWatcher:
+    @staticmethod
+    def test_poll(username):
+        watcher = AsyncDailyGamesWatcher([username])
+        events = asyncio.run(watcher.poll())
+        assert len(watcher.games(username)) == sum(x.kind == NEW_GAME for x in events)
+
+
+class TestLiveMatchTracker:
+    @staticmethod
+    def test_poll(live_match_id):
+        tracker = LiveMatchTracker(live_match_id)
+        deltas = tracker.poll()
+        assert len(deltas) <= tracker.details.boards
+        assert tracker.poll() == []
+
+    @staticmethod
+    def test_update(live_match_id):
+        tracker = LiveMatchTracker(live_match_id)
+        received = []
+        tracker.subscribe(received.append)
+        delta = tracker.update(1, _board(["e4", "e5"]))
+        assert delta.scores == {"erik": 0, "hikaru": 0}
+        assert (delta.games[0].ply, delta.games[0].moves) == (0, ["e4", "e5"])
+        assert tracker.update(1, _board(["e4", "e5"])) is None
+
+        delta = tracker.update(1, _board(["e4", "e5", "Qh5"], ("win", "resigned")))
+        game = delta.games[0]
+        assert (game.ply, game.moves, game.white_result) == (2, ["Qh5"], "win")
+        assert game.result_changed and delta.scores["erik"] == 1
+        assert [x.board for x in received] == [1, 1]
+
+    @staticmethod
+    def test_interleaved(fake_session, live_match_id):
+        url = f"https://api.chess.com/pub/match/live/{live_match_id}"
+        team = {"@id": "t", "name": "t", "score": 0, "players": []}
+        fake_session.bodies[url] = {
+            "@id": url,
+            "name": "match",
+            "url": "m",
+            "start_time": 0,
+            "status": "in_progress",
+            "boards": 1,
+            "settings": {
+                "time_class": "blitz",
+                "time_control": "180",
+                "rules": "chess",
+            },
+            "teams": {"team1": dict(team, name="a"), "team2": dict(team, name="b")},
+        }
+        board = _board(["e4"])
+        board["games"][0].update(time_control="180", time_class="blitz", rules="chess")
+        fake_session.bodies[f"{url}/1"] = board
+
+        details = Match.live_match_board(live_match_id, 1)
+        assert details.games[0].white.username == "erik"
+        tracker = LiveMatchTracker(live_match_id)
+        (delta,) = tracker.poll()
+        assert delta.games[0].moves == ["e4"]
+        assert (
+            Match.live_match_board(live_match_id, 1).games[0].fen
+            == details.games[0].fen
+        )
+        assert tracker.poll() == []
+
+        board["games"][0]["pgn"] += " e5"
+        (delta,) = tracker.poll()
+        assert (delta.games[0].ply, delta.games[0].moves) == (1, ["e5"])
+        assert Match.live_match_board(live_match_id, 1).games[0].pgn.endswith("e5")
+
+
+class TestAsyncLiveMatchTracker:
+    @staticmethod
+    def test_poll(live_match_id):
+        tracker = AsyncLiveMatchTracker(live_match_id)
+        deltas = asyncio.run(tracker.poll())
+        assert len(deltas) <= tracker.details.boards